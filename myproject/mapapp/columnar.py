@@ -0,0 +1,113 @@
+"""Packed columnar binary encoding for large column-oriented JSON payloads.
+
+Layout (little endian)::
+
+    b"SEGC" | uint32 header length | header JSON (utf-8) | column buffers
+
+Every column buffer starts on an 8-byte boundary so the browser can view it
+directly as a typed array. The header lists ``count`` plus, per column, its
+``name``, ``type``, ``offset`` and ``length`` in bytes:
+
+``float32``
+    Numbers; ``None`` becomes NaN.
+``int16``
+    Integers; ``None`` becomes ``null_value`` (-32768).
+``dict``
+    Dictionary-encoded strings. The buffer holds ``uint16`` or ``uint32``
+    codes (``index_type``) into ``dictionary``; code 0 is always ``null``.
+``utf8``
+    Strings joined with ``\\n`` (``None`` is sent as an empty string).
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+MAGIC = b"SEGC"
+FORMAT_VERSION = 1
+CONTENT_TYPE = "application/vnd.seg.columnar"
+INT16_NULL = -32768
+_ALIGNMENT = 8
+
+
+def _as_text(value: Any) -> Optional[str]:
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def _float32(values: Sequence[Any]) -> Tuple[bytes, Dict[str, Any]]:
+    array = pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").to_numpy(dtype="float32")
+    return array.astype("<f4").tobytes(), {}
+
+
+def _int16(values: Sequence[Any]) -> Tuple[bytes, Dict[str, Any]]:
+    numbers = pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").to_numpy(dtype="float64")
+    array = np.where(np.isnan(numbers), INT16_NULL, numbers).astype("<i2")
+    return array.tobytes(), {"null_value": INT16_NULL}
+
+
+def _dictionary(values: Sequence[Any]) -> Tuple[bytes, Dict[str, Any]]:
+    codes, uniques = pd.factorize(pd.Series([_as_text(v) for v in values], dtype=object))
+    codes = codes + 1  # 0 is reserved for null
+    index_type = "uint16" if len(uniques) < 0xFFFF else "uint32"
+    array = codes.astype("<u2" if index_type == "uint16" else "<u4")
+    return array.tobytes(), {"index_type": index_type, "dictionary": [None] + list(uniques)}
+
+
+def _utf8(values: Sequence[Any]) -> Tuple[bytes, Dict[str, Any]]:
+    text = "\n".join(_as_text(v) or "" for v in values)
+    return text.encode("utf-8"), {}
+
+
+_ENCODERS = {
+    "float32": _float32,
+    "int16": _int16,
+    "dict": _dictionary,
+    "utf8": _utf8,
+}
+
+
+def pack(
+    columns: Iterable[Tuple[str, str, Sequence[Any]]],
+    *,
+    meta: Optional[Dict[str, Any]] = None,
+) -> bytes:
+    """Encode ``(name, type, values)`` columns of equal length into one buffer."""
+
+    specs: List[Dict[str, Any]] = []
+    buffers: List[bytes] = []
+    count = None
+    offset = 0
+    for name, kind, values in columns:
+        if count is None:
+            count = len(values)
+        elif len(values) != count:
+            raise ValueError(f"Column {name!r} has {len(values)} values, expected {count}.")
+        data, extra = _ENCODERS[kind](values)
+        padding = (-offset) % _ALIGNMENT
+        offset += padding
+        buffers.append(b"\0" * padding + data)
+        specs.append({"name": name, "type": kind, "offset": offset, "length": len(data), **extra})
+        offset += len(data)
+
+    header = {
+        "version": FORMAT_VERSION,
+        "count": count or 0,
+        "columns": specs,
+        "meta": meta or {},
+    }
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    # Pad the header so the body (and its aligned offsets) start on a boundary.
+    prefix_length = len(MAGIC) + 4 + len(header_bytes)
+    header_bytes += b" " * ((-prefix_length) % _ALIGNMENT)
+    return b"".join([MAGIC, struct.pack("<I", len(header_bytes)), header_bytes, *buffers])
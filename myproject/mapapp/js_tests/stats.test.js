@@ -0,0 +1,54 @@
+// Run with `npm run test:js` (node --test, no dependencies).
+const assert = require('node:assert/strict');
+const fs = require('node:fs');
+const path = require('node:path');
+const test = require('node:test');
+const vm = require('node:vm');
+
+const STATS_JS = path.join(__dirname, '..', 'static', 'mapapp', 'js', 'stats.js');
+
+function loadStats() {
+  const elements = {};
+  const document = {
+    getElementById(id) {
+      elements[id] = elements[id] || { textContent: '' };
+      return elements[id];
+    },
+  };
+  const context = { window: {}, document, ArrayBuffer, Date, Math };
+  vm.runInNewContext(fs.readFileSync(STATS_JS, 'utf8'), context);
+  return { Stats: context.window.Stats, text: (id) => elements[id].textContent };
+}
+
+test('JSON payload (plain arrays)', () => {
+  const { Stats, text } = loadStats();
+  Stats.render(
+    { lat: [31.1, 31.2, 31.3], years: [1998, null, 2021], last_producing: ['2024-03-01', null, '2024-05-01'] },
+    { lat: [31.1] },
+  );
+  assert.equal(text('stat-total'), '3');
+  assert.equal(text('stat-user-total'), '1');
+  assert.equal(text('stat-year-range'), '1998–2021');
+  assert.equal(text('stat-last-prod'), '2024-05');
+});
+
+test('binary payload (typed array prefixes from filterDataByYear)', () => {
+  const { Stats, text } = loadStats();
+  // decodeColumnarPayload yields Float32Array columns (int16 nulls -> NaN);
+  // the year_index branch slices a prefix, which stays a typed array.
+  const lat = new Float32Array([31.1, 31.2, 31.3, 31.4]).slice(0, 3);
+  const years = new Float32Array([1998, NaN, 2021, 2023]).slice(0, 3);
+  Stats.render({ lat, years, last_producing: ['2024-03-01', null, null] }, { lat: new Float32Array(2) });
+  assert.equal(text('stat-total'), '3');
+  assert.equal(text('stat-user-total'), '2');
+  assert.equal(text('stat-year-range'), '1998–2021');
+  assert.equal(text('stat-last-prod'), '2024-03');
+});
+
+test('empty and missing columns', () => {
+  const { Stats, text } = loadStats();
+  Stats.render({ lat: new Float32Array(0), years: new Float32Array([NaN]) }, null);
+  assert.equal(text('stat-total'), '0');
+  assert.equal(text('stat-year-range'), '—');
+  assert.equal(text('stat-last-prod'), '—');
+});
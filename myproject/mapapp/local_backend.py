@@ -0,0 +1,387 @@
+"""SQLite stand-in for Snowflake used for offline development and benchmarks.
+
+Set ``SNOWFLAKE_BACKEND=sqlite`` and ``snowflake_helpers.connect()`` returns a
+connection to the local database at ``SNOWFLAKE_LOCAL_DB`` instead of a
+Snowflake session. The connection and cursors implement the subset of the
+connector API the views rely on (``%s`` binding, ``DictCursor``,
+``fetch_pandas_all``, ``sfqid``) and SQLite errors are re-raised as the
+matching ``snowflake.connector.errors`` classes so view error handling is
+exercised unchanged. Populate the database with
+``python manage.py generate_local_data``.
+"""
+
+from __future__ import annotations
+
+import datetime
+import decimal
+import itertools
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import pandas as pd
+from snowflake.connector import DictCursor
+from snowflake.connector import errors as snowflake_errors
+
+
+BACKEND_ENV = "SNOWFLAKE_BACKEND"
+DATABASE_ENV = "SNOWFLAKE_LOCAL_DB"
+
+# Column types use Snowflake spellings; DATE and TIMESTAMP_NTZ columns are
+# decoded back into date/datetime objects like the real connector returns.
+SCHEMA: Dict[str, List[tuple]] = {
+    "RAW_WELL_DATA_WITH_OWNERS": [
+        ("API_UWI", "TEXT"),
+        ("WELLNAME", "TEXT"),
+        ("ENVOPERATOR", "TEXT"),
+        ("TRAJECTORY", "TEXT"),
+        ("LATITUDE", "REAL"),
+        ("LONGITUDE", "REAL"),
+        ("LATITUDE_BH", "REAL"),
+        ("LONGITUDE_BH", "REAL"),
+        ("PERMITAPPROVEDDATE", "DATE"),
+        ("COMPLETIONDATE", "DATE"),
+        ("FIRSTPRODMONTHOIL", "DATE"),
+        ("FIRSTPRODMONTHGAS", "DATE"),
+        ("LASTPRODUCINGMONTHOIL", "DATE"),
+        ("LASTPRODUCINGMONTHGAS", "DATE"),
+        ("LASTPRODUCINGMONTH", "DATE"),
+        ("OWNER_LIST", "TEXT"),
+        ("NRI_LIST", "TEXT"),
+        ("OWNER_COUNT", "INTEGER"),
+        ("GROSS_OIL_EUR", "REAL"),
+        ("GROSS_GAS_EUR", "REAL"),
+        ("NET_OIL_EUR", "REAL"),
+        ("NET_GAS_EUR", "REAL"),
+        ("NET_NGL_EUR", "REAL"),
+        ("REMAINING_NET_OIL", "REAL"),
+        ("REMAINING_NET_GAS", "REAL"),
+        ("PV17", "REAL"),
+    ],
+    "RAW_PROD_DATA": [
+        ("API_UWI", "TEXT"),
+        ("PRODUCINGMONTH", "DATE"),
+        ("LIQUIDSPROD_BBL", "REAL"),
+        ("GASPROD_MCF", "REAL"),
+    ],
+    "ECON_INPUT_1PASS": [
+        ("API_UWI", "TEXT"),
+        ("OIL_CALC_QI", "REAL"),
+        ("OIL_Q_MIN", "REAL"),
+        ("OIL_EMPIRICAL_DI", "REAL"),
+        ("OIL_CALC_B_FACTOR", "REAL"),
+        ("OIL_D_MIN", "REAL"),
+        ("OIL_DECLINE_TYPE", "TEXT"),
+        ("FCST_START_OIL", "DATE"),
+        ("OIL_FCST_YRS", "REAL"),
+        ("GAS_CALC_QI", "REAL"),
+        ("GAS_Q_MIN", "REAL"),
+        ("GAS_EMPIRICAL_DI", "REAL"),
+        ("GAS_CALC_B_FACTOR", "REAL"),
+        ("GAS_D_MIN", "REAL"),
+        ("GAS_DECLINE_TYPE", "TEXT"),
+        ("FCST_START_GAS", "DATE"),
+        ("GAS_FCST_YRS", "REAL"),
+        ("ECON_SCENARIO", "TEXT"),
+        ("APPROVED", "TEXT"),
+        ("LAST_EDIT_DATE", "TIMESTAMP_NTZ"),
+    ],
+    "PRICE_DECK": [
+        ("PRICE_DECK_NAME", "TEXT"),
+        ("MONTH_DATE", "DATE"),
+        ("OIL", "REAL"),
+        ("GAS", "REAL"),
+    ],
+    "ECON_SCENARIOS": [
+        ("ECON_SCENARIO", "TEXT"),
+        ("OIL_DIFF_PCT", "REAL"),
+        ("OIL_DIFF_AMT", "REAL"),
+        ("GAS_DIFF_PCT", "REAL"),
+        ("GAS_DIFF_AMT", "REAL"),
+        ("NGL_DIFF_PCT", "REAL"),
+        ("NGL_DIFF_AMT", "REAL"),
+        ("OIL_GPT_DEDUCT", "REAL"),
+        ("GAS_GPT_DEDUCT", "REAL"),
+        ("NGL_GPT_DEDUCT", "REAL"),
+        ("OIL_TAX", "REAL"),
+        ("GAS_TAX", "REAL"),
+        ("NGL_TAX", "REAL"),
+        ("AD_VAL_TAX", "REAL"),
+        ("GAS_SHRINK", "REAL"),
+        ("NGL_YIELD", "REAL"),
+    ],
+    "USER_MAPPINGS": [
+        ("AUTH0_EMAIL", "TEXT"),
+        ("OWNER_NAME", "TEXT"),
+    ],
+}
+
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS IX_WELLS_API ON RAW_WELL_DATA_WITH_OWNERS (API_UWI)",
+    "CREATE INDEX IF NOT EXISTS IX_PROD_API_MONTH ON RAW_PROD_DATA (API_UWI, PRODUCINGMONTH)",
+    "CREATE INDEX IF NOT EXISTS IX_ECON_INPUT_API ON ECON_INPUT_1PASS (API_UWI, LAST_EDIT_DATE)",
+    "CREATE INDEX IF NOT EXISTS IX_USER_MAPPINGS_EMAIL ON USER_MAPPINGS (AUTH0_EMAIL)",
+]
+
+# RAW_WELL_DATA is the owner-less projection the map reads.
+VIEWS = [
+    """
+    CREATE VIEW IF NOT EXISTS RAW_WELL_DATA AS
+    SELECT API_UWI, WELLNAME, ENVOPERATOR, TRAJECTORY,
+           LATITUDE, LONGITUDE, LATITUDE_BH, LONGITUDE_BH,
+           PERMITAPPROVEDDATE, COMPLETIONDATE, LASTPRODUCINGMONTH
+    FROM RAW_WELL_DATA_WITH_OWNERS
+    """,
+]
+
+_QUALIFIED_NAME_RE = re.compile(r"\bWELLS\.MINERALS\.", re.IGNORECASE)
+_DATE_PART_RE = re.compile(r"\bDATE_PART\(\s*(year|month|day)\s*,", re.IGNORECASE)
+_CURRENT_TIMESTAMP_RE = re.compile(r"\bCURRENT_TIMESTAMP\(\)", re.IGNORECASE)
+_NAMED_PARAM_RE = re.compile(r"%\((\w+)\)s")
+_FLATTEN_JSON_RE = re.compile(
+    r"SELECT\s+VALUE::STRING\s+FROM\s+TABLE\(\s*FLATTEN\(\s*INPUT\s*=>\s*PARSE_JSON\((%s|\?)\)\s*\)\s*\)",
+    re.IGNORECASE,
+)
+
+_query_ids = itertools.count(1)
+
+
+def backend_enabled() -> bool:
+    return (os.getenv(BACKEND_ENV) or "").strip().lower() == "sqlite"
+
+
+def database_path() -> str:
+    configured = os.getenv(DATABASE_ENV)
+    if configured:
+        return os.path.expanduser(configured)
+    return os.path.join(tempfile.gettempdir(), "seg-admin-local.sqlite3")
+
+
+def translate_sql(query: str) -> str:
+    """Rewrite the Snowflake dialect used by the views into SQLite."""
+
+    sql = _QUALIFIED_NAME_RE.sub("", str(query))
+    sql = _DATE_PART_RE.sub(lambda m: f"DATE_PART('{m.group(1).lower()}',", sql)
+    sql = _CURRENT_TIMESTAMP_RE.sub("CURRENT_TIMESTAMP", sql)
+    # Array binds from snowflake_helpers.in_list() expand with json_each.
+    sql = _FLATTEN_JSON_RE.sub(r"SELECT value FROM json_each(\1)", sql)
+    sql = _NAMED_PARAM_RE.sub(r":\1", sql)
+    return sql.replace("%s", "?").replace("%%", "%")
+
+
+def _date_part(part: str, value: Any) -> Optional[int]:
+    if value is None:
+        return None
+    try:
+        parsed = datetime.date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+    return getattr(parsed, part.lower(), None)
+
+
+def _convert_date(raw: bytes) -> Optional[datetime.date]:
+    try:
+        return datetime.date.fromisoformat(raw.decode()[:10])
+    except ValueError:
+        return None
+
+
+def _convert_timestamp(raw: bytes) -> Optional[datetime.datetime]:
+    try:
+        return datetime.datetime.fromisoformat(raw.decode())
+    except ValueError:
+        return None
+
+
+sqlite3.register_adapter(datetime.date, lambda value: value.isoformat())
+sqlite3.register_adapter(datetime.datetime, lambda value: value.isoformat(sep=" "))
+sqlite3.register_adapter(decimal.Decimal, float)
+sqlite3.register_adapter(pd.Timestamp, lambda value: value.isoformat(sep=" "))
+sqlite3.register_converter("DATE", _convert_date)
+sqlite3.register_converter("TIMESTAMP_NTZ", _convert_timestamp)
+
+
+def _translate_error(exc: sqlite3.Error) -> snowflake_errors.Error:
+    if isinstance(exc, sqlite3.IntegrityError):
+        return snowflake_errors.IntegrityError(msg=str(exc))
+    if isinstance(exc, sqlite3.OperationalError) and "locked" in str(exc):
+        return snowflake_errors.OperationalError(msg=str(exc))
+    if isinstance(exc, sqlite3.NotSupportedError):
+        return snowflake_errors.NotSupportedError(msg=str(exc))
+    return snowflake_errors.ProgrammingError(msg=str(exc))
+
+
+class LocalCursor:
+    """Cursor mirroring the parts of ``SnowflakeCursor`` used by the app."""
+
+    def __init__(self, connection: "LocalConnection", as_dict: bool = False) -> None:
+        self._connection = connection
+        self._as_dict = as_dict
+        self._rows: List[tuple] = []
+        self._position = 0
+        self.description: Optional[List[tuple]] = None
+        self.rowcount = -1
+        self.sfqid: Optional[str] = None
+
+    def execute(self, command: str, params: Any = None, *args: Any, **kwargs: Any) -> "LocalCursor":
+        sql = translate_sql(command)
+        if params is None:
+            params = ()
+        elif not isinstance(params, dict):
+            params = tuple(params)
+        try:
+            cursor = self._connection.raw.execute(sql, params)
+            rows = cursor.fetchall()
+        except sqlite3.Error as exc:
+            raise _translate_error(exc) from exc
+        self._set_result(cursor, rows)
+        return self
+
+    def executemany(self, command: str, seqparams: Sequence[Any], *args: Any, **kwargs: Any) -> "LocalCursor":
+        sql = translate_sql(command)
+        try:
+            cursor = self._connection.raw.executemany(sql, [tuple(p) for p in seqparams])
+        except sqlite3.Error as exc:
+            raise _translate_error(exc) from exc
+        self._set_result(cursor, [])
+        return self
+
+    def _set_result(self, cursor: sqlite3.Cursor, rows: List[tuple]) -> None:
+        # Snowflake reports unquoted identifiers in upper case.
+        self.description = (
+            [(col[0].upper(), None, None, None, None, None, True) for col in cursor.description]
+            if cursor.description
+            else None
+        )
+        self._rows = rows
+        self._position = 0
+        self.rowcount = len(rows) if cursor.description else cursor.rowcount
+        self.sfqid = f"local-{next(_query_ids):012d}"
+
+    def _columns(self) -> List[str]:
+        return [col[0] for col in self.description or []]
+
+    def _shape(self, rows: Sequence[tuple]) -> List[Any]:
+        if not self._as_dict:
+            return list(rows)
+        columns = self._columns()
+        return [dict(zip(columns, row)) for row in rows]
+
+    def fetchone(self) -> Optional[Any]:
+        if self._position >= len(self._rows):
+            return None
+        row = self._rows[self._position]
+        self._position += 1
+        return self._shape([row])[0]
+
+    def fetchmany(self, size: Optional[int] = None) -> List[Any]:
+        size = size or 1
+        rows = self._rows[self._position : self._position + size]
+        self._position += len(rows)
+        return self._shape(rows)
+
+    def fetchall(self) -> List[Any]:
+        rows = self._rows[self._position :]
+        self._position = len(self._rows)
+        return self._shape(rows)
+
+    def fetch_pandas_all(self) -> pd.DataFrame:
+        rows = self._rows[self._position :]
+        self._position = len(self._rows)
+        return pd.DataFrame(rows, columns=self._columns())
+
+    def fetch_arrow_batches(self) -> Iterator[Any]:
+        try:
+            import pyarrow as pa
+        except ImportError as exc:  # pragma: no cover - pyarrow ships with the connector extra
+            raise snowflake_errors.NotSupportedError(msg="pyarrow is not installed") from exc
+        frame = self.fetch_pandas_all()
+        if len(frame):
+            yield pa.Table.from_pandas(frame, preserve_index=False)
+
+    def get_result_batches(self) -> None:
+        return None
+
+    def __iter__(self) -> Iterator[Any]:
+        while True:
+            row = self.fetchone()
+            if row is None:
+                return
+            yield row
+
+    def close(self) -> None:
+        self._rows = []
+
+
+class LocalConnection:
+    """Connection object standing in for ``SnowflakeConnection``."""
+
+    def __init__(self, path: str) -> None:
+        # Autocommit like Snowflake; an explicit BEGIN opens a transaction
+        # that commit()/rollback() then close.
+        self.raw = sqlite3.connect(
+            path,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            isolation_level=None,
+            check_same_thread=False,
+            timeout=30,
+        )
+        self.raw.create_function("DATE_PART", 2, _date_part, deterministic=True)
+        self._closed = False
+
+    def cursor(self, cursor_class: Any = None) -> LocalCursor:
+        return LocalCursor(self, as_dict=cursor_class is DictCursor)
+
+    def commit(self) -> None:
+        if self.raw.in_transaction:
+            self.raw.execute("COMMIT")
+
+    def rollback(self) -> None:
+        if self.raw.in_transaction:
+            self.raw.execute("ROLLBACK")
+
+    def is_valid(self) -> bool:
+        return not self._closed
+
+    def is_closed(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self.raw.close()
+
+
+_schema_lock = threading.Lock()
+
+
+def create_schema(conn: LocalConnection, *, drop: bool = False) -> None:
+    """Create (or with ``drop=True`` recreate) the stand-in tables."""
+
+    with _schema_lock:
+        raw = conn.raw
+        raw.execute("PRAGMA journal_mode=WAL")
+        if drop:
+            raw.execute("DROP VIEW IF EXISTS RAW_WELL_DATA")
+            for table in SCHEMA:
+                raw.execute(f"DROP TABLE IF EXISTS {table}")
+        for table, columns in SCHEMA.items():
+            body = ", ".join(f"{name} {col_type}" for name, col_type in columns)
+            raw.execute(f"CREATE TABLE IF NOT EXISTS {table} ({body})")
+        for statement in INDEXES + VIEWS:
+            raw.execute(statement)
+
+
+def connect(**_overrides: Any) -> LocalConnection:
+    """Open a connection to the local database, creating the schema if needed."""
+
+    path = database_path()
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = LocalConnection(path)
+    create_schema(conn)
+    return conn
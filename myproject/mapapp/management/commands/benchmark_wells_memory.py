@@ -0,0 +1,57 @@
+"""Compare the memory footprint of the wells-with-owners frame before and after compaction."""
+
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from myproject.mapapp import views
+
+
+def _megabytes(num_bytes: float) -> str:
+    return f"{num_bytes / 1e6:8.2f} MB"
+
+
+class Command(BaseCommand):
+    help = (
+        "Load RAW_WELL_DATA_WITH_OWNERS as it is cached and report per-column memory "
+        "(deep) before and after _compact_wells_frame, plus owner index build time."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top", type=int, default=15, help="Columns to list, largest first.")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        raw = views._load_wells_with_owners()
+        self.stdout.write(f"Loaded {len(raw)} wells in {time.perf_counter() - started:.1f}s")
+
+        started = time.perf_counter()
+        compact = views._compact_wells_frame(raw.copy())
+        self.stdout.write(f"Compacted in {time.perf_counter() - started:.2f}s")
+
+        before = raw.memory_usage(deep=True, index=False)
+        after = compact.memory_usage(deep=True, index=False)
+        self.stdout.write(f"\n{'column':<24}{'before':>12}{'after':>12}  dtype")
+        for column in before.sort_values(ascending=False).index[: options["top"]]:
+            self.stdout.write(
+                f"{column:<24}{_megabytes(before[column]):>12}{_megabytes(after[column]):>12}"
+                f"  {compact[column].dtype.name}"
+            )
+
+        for label, frame in (("before", raw), ("after", compact)):
+            started = time.perf_counter()
+            index = views._build_owner_index(frame)
+            self.stdout.write(
+                f"Owner index ({label}): {len(index['owners'])} owners in "
+                f"{time.perf_counter() - started:.2f}s"
+            )
+
+        saved = 1 - after.sum() / before.sum() if before.sum() else 0.0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Total {_megabytes(before.sum()).strip()} -> {_megabytes(after.sum()).strip()} "
+                f"({saved:.0%} smaller)"
+            )
+        )
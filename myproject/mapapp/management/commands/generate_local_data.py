@@ -0,0 +1,302 @@
+"""Fill the local SQLite stand-in with synthetic wells, production and economics."""
+
+from __future__ import annotations
+
+import time
+from datetime import date
+
+import numpy as np
+import pandas as pd
+from django.core.management.base import BaseCommand, CommandError
+
+from myproject.mapapp import local_backend
+from myproject.mapapp.views import (
+    DCA_INPUT_COLUMNS,
+    ECON_SCENARIO_COLUMNS,
+    ECON_SCENARIO_DEFAULTS,
+)
+
+
+PRICE_DECKS = {
+    # name: (oil $/bbl, gas $/mcf, annual drift)
+    "STRIP": (68.0, 3.1, -0.01),
+    "BASE": (70.0, 3.25, 0.0),
+    "LOW": (55.0, 2.4, -0.02),
+    "HIGH": (85.0, 4.1, 0.015),
+}
+
+ECON_SCENARIOS = {
+    "BASE": {},
+    "PERMIAN": {"OIL_DIFF_AMT": -1.5, "GAS_DIFF_PCT": 0.75, "GAS_SHRINK": 0.82},
+    "GASSY": {"GAS_DIFF_PCT": 0.9, "NGL_YIELD": 115.0, "GAS_GPT_DEDUCT": 0.45},
+}
+
+# Permian-basin-like bounding box with wells clustered around pad locations.
+_LAT_RANGE = (31.0, 33.2)
+_LON_RANGE = (-104.2, -101.0)
+
+
+def _month_starts(start: pd.Timestamp, periods: int) -> np.ndarray:
+    return pd.date_range(start, periods=periods, freq="MS").strftime("%Y-%m-%d").to_numpy()
+
+
+def _iso(values) -> list:
+    return [None if pd.isna(v) else pd.Timestamp(v).strftime("%Y-%m-%d") for v in values]
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate synthetic RAW_WELL_DATA_WITH_OWNERS, RAW_PROD_DATA, ECON_INPUT_1PASS, "
+        "PRICE_DECK and ECON_SCENARIOS rows in the local SQLite stand-in "
+        "(SNOWFLAKE_BACKEND=sqlite)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--wells", type=int, default=10_000, help="Number of wells (10k-500k).")
+        parser.add_argument("--owners", type=int, default=None, help="Distinct owners (default wells/20).")
+        parser.add_argument(
+            "--prod-months", type=int, default=36,
+            help="Most recent producing months stored per well.",
+        )
+        parser.add_argument(
+            "--econ-fraction", type=float, default=0.3,
+            help="Share of wells with saved DCA inputs.",
+        )
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument(
+            "--database", default=None,
+            help="SQLite file to write (defaults to SNOWFLAKE_LOCAL_DB).",
+        )
+        parser.add_argument("--batch-size", type=int, default=50_000)
+
+    def handle(self, *args, **options):
+        n_wells = options["wells"]
+        if n_wells <= 0:
+            raise CommandError("--wells must be positive.")
+        n_owners = options["owners"] or max(50, n_wells // 20)
+        self.rng = np.random.default_rng(options["seed"])
+        self.batch_size = options["batch_size"]
+        self.today = pd.Timestamp(date.today()).to_period("M").to_timestamp()
+
+        path = options["database"] or local_backend.database_path()
+        conn = local_backend.LocalConnection(path)
+        try:
+            local_backend.create_schema(conn, drop=True)
+            wells = self._wells(n_wells, n_owners)
+            self._timed(conn, "RAW_WELL_DATA_WITH_OWNERS", lambda: self._insert_frame(conn, "RAW_WELL_DATA_WITH_OWNERS", wells))
+            self._timed(conn, "RAW_PROD_DATA", lambda: self._insert_production(conn, wells, options["prod_months"]))
+            self._timed(conn, "ECON_INPUT_1PASS", lambda: self._insert_econ_inputs(conn, wells, options["econ_fraction"]))
+            self._timed(conn, "PRICE_DECK", lambda: self._insert_price_decks(conn))
+            self._timed(conn, "ECON_SCENARIOS", lambda: self._insert_econ_scenarios(conn))
+            self._timed(conn, "USER_MAPPINGS", lambda: self._insert_user_mappings(conn, n_owners))
+            conn.raw.execute("ANALYZE")
+        finally:
+            conn.close()
+        self.stdout.write(self.style.SUCCESS(f"Wrote {n_wells} wells to {path}"))
+
+    def _timed(self, conn, table, populate):
+        started = time.perf_counter()
+        conn.raw.execute("BEGIN")
+        try:
+            rows = populate()
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        self.stdout.write(f"{table}: {rows} rows in {time.perf_counter() - started:.1f}s")
+
+    def _insert_rows(self, conn, table, columns, rows):
+        sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['?'] * len(columns))})"
+        conn.raw.executemany(sql, rows)
+
+    def _insert_frame(self, conn, table, frame):
+        columns = [name for name, _ in local_backend.SCHEMA[table] if name in frame.columns]
+        values = frame[columns].astype(object).where(frame[columns].notna(), None)
+        for start in range(0, len(values), self.batch_size):
+            chunk = values.iloc[start : start + self.batch_size]
+            self._insert_rows(conn, table, columns, chunk.itertuples(index=False, name=None))
+        return len(frame)
+
+    def _wells(self, n_wells, n_owners):
+        rng = self.rng
+        idx = np.arange(n_wells)
+        apis = [f"42-{(i % 250) * 2 + 1:03d}-{i // 250:05d}" for i in idx]
+
+        n_pads = max(1, n_wells // 8)
+        pad_lat = rng.uniform(*_LAT_RANGE, n_pads)
+        pad_lon = rng.uniform(*_LON_RANGE, n_pads)
+        pad = rng.integers(0, n_pads, n_wells)
+        lat = pad_lat[pad] + rng.normal(0, 0.004, n_wells)
+        lon = pad_lon[pad] + rng.normal(0, 0.004, n_wells)
+
+        horizontal = rng.random(n_wells) < 0.7
+        lateral_deg = rng.uniform(0.015, 0.03, n_wells) * rng.choice([-1, 1], n_wells)
+        lat_bh = np.where(horizontal, lat + lateral_deg, np.nan)
+        lon_bh = np.where(horizontal, lon + rng.normal(0, 0.002, n_wells), np.nan)
+
+        # Skew completions towards the last decade like the real inventory.
+        age_months = np.minimum(rng.exponential(90, n_wells).astype(int), 12 * 70)
+        completion = self.today - pd.to_timedelta(age_months * 30 + rng.integers(0, 30, n_wells), unit="D")
+        permit = completion - pd.to_timedelta(rng.integers(60, 300, n_wells), unit="D")
+        first_prod = completion.to_period("M").to_timestamp() + pd.offsets.MonthBegin(1)
+        life_months = rng.integers(24, 12 * 40, n_wells)
+        last_prod = pd.DatetimeIndex(
+            np.minimum(
+                (first_prod + pd.to_timedelta(life_months * 30.44, unit="D")).to_period("M").to_timestamp().values,
+                self.today.to_datetime64(),
+            )
+        )
+        gas_only = rng.random(n_wells) < 0.15
+
+        # A Zipf-like owner distribution gives a few owners many wells.
+        owner_weights = 1.0 / np.arange(1, n_owners + 1) ** 0.8
+        owner_weights /= owner_weights.sum()
+        owner_counts = np.clip(rng.poisson(1.5, n_wells) + 1, 1, 6)
+        owner_names = np.array([f"Owner {i:05d}" for i in range(1, n_owners + 1)])
+        owner_lists, nri_lists = [], []
+        for count in owner_counts:
+            picks = np.unique(rng.choice(n_owners, count, p=owner_weights))
+            owner_lists.append("|".join(owner_names[picks]))
+            nri_lists.append("|".join(f"{v:.6f}" for v in rng.uniform(0.0005, 0.05, len(picks))))
+
+        gross_oil = np.where(gas_only, 0.0, rng.lognormal(12.0, 0.6, n_wells))
+        gross_gas = rng.lognormal(13.2, 0.7, n_wells)
+        nri_total = rng.uniform(0.001, 0.06, n_wells)
+        remaining = rng.uniform(0.1, 0.8, n_wells)
+        return pd.DataFrame(
+            {
+                "API_UWI": apis,
+                "WELLNAME": [f"SYNTH {i // 8 + 1:05d} {i % 8 + 1}H" for i in idx],
+                "ENVOPERATOR": rng.choice([f"Operator {i:03d}" for i in range(1, 121)], n_wells),
+                "TRAJECTORY": np.where(horizontal, "HORIZONTAL", "VERTICAL"),
+                "LATITUDE": lat.round(6),
+                "LONGITUDE": lon.round(6),
+                "LATITUDE_BH": lat_bh.round(6),
+                "LONGITUDE_BH": lon_bh.round(6),
+                "PERMITAPPROVEDDATE": _iso(permit),
+                "COMPLETIONDATE": _iso(completion),
+                "FIRSTPRODMONTHOIL": _iso(first_prod.where(~gas_only)),
+                "FIRSTPRODMONTHGAS": _iso(first_prod),
+                "LASTPRODUCINGMONTHOIL": _iso(last_prod.where(~gas_only)),
+                "LASTPRODUCINGMONTHGAS": _iso(last_prod),
+                "LASTPRODUCINGMONTH": _iso(last_prod),
+                "OWNER_LIST": owner_lists,
+                "NRI_LIST": nri_lists,
+                "OWNER_COUNT": [len(o.split("|")) for o in owner_lists],
+                "GROSS_OIL_EUR": gross_oil.round(1),
+                "GROSS_GAS_EUR": gross_gas.round(1),
+                "NET_OIL_EUR": (gross_oil * nri_total).round(2),
+                "NET_GAS_EUR": (gross_gas * nri_total).round(2),
+                "NET_NGL_EUR": (gross_gas * nri_total * 0.09).round(2),
+                "REMAINING_NET_OIL": (gross_oil * nri_total * remaining).round(2),
+                "REMAINING_NET_GAS": (gross_gas * nri_total * remaining).round(2),
+                "PV17": (gross_oil * nri_total * remaining * 18 + gross_gas * nri_total * remaining * 1.1).round(2),
+                "_FIRST_PROD": first_prod,
+                "_LAST_PROD": last_prod,
+                "_GAS_ONLY": gas_only,
+            }
+        )
+
+    def _insert_production(self, conn, wells, prod_months):
+        first = wells["_FIRST_PROD"].to_numpy(dtype="datetime64[M]")
+        last = wells["_LAST_PROD"].to_numpy(dtype="datetime64[M]")
+        span = (last - first).astype(int) + 1
+        stored = np.clip(np.minimum(span, prod_months), 0, None)
+        start = last - (stored - 1)
+        offset_from_first = (start - first).astype(int)
+
+        rng = self.rng
+        qi_oil = np.where(wells["_GAS_ONLY"], 0.0, rng.lognormal(9.2, 0.5, len(wells)))
+        qi_gas = rng.lognormal(10.3, 0.6, len(wells))
+        di = rng.uniform(0.04, 0.12, len(wells))
+        b = rng.uniform(0.6, 1.2, len(wells))
+
+        base = self.today.to_datetime64().astype("datetime64[M]")
+        span_months = int((base - start.min()).astype(int)) + 1
+        month_labels = _month_starts(pd.Timestamp(start.min()), span_months)
+
+        apis = wells["API_UWI"].to_numpy()
+        total = 0
+        columns = ["API_UWI", "PRODUCINGMONTH", "LIQUIDSPROD_BBL", "GASPROD_MCF"]
+        step = max(1, self.batch_size // max(1, prod_months))
+        for lo in range(0, len(wells), step):
+            hi = min(lo + step, len(wells))
+            counts = stored[lo:hi]
+            well = np.repeat(np.arange(lo, hi), counts)
+            k = np.arange(len(well)) - np.repeat(np.cumsum(counts) - counts, counts)
+            t = offset_from_first[well] + k
+            decline = (1.0 + b[well] * di[well] * t) ** (-1.0 / b[well])
+            noise = rng.normal(1.0, 0.08, len(well)).clip(0.5, 1.5)
+            month_idx = (start[well] - start.min()).astype(int) + k
+            rows = zip(
+                apis[well].tolist(),
+                month_labels[month_idx].tolist(),
+                (qi_oil[well] * decline * noise).round(1).tolist(),
+                (qi_gas[well] * decline * noise).round(1).tolist(),
+            )
+            self._insert_rows(conn, "RAW_PROD_DATA", columns, rows)
+            total += len(well)
+        return total
+
+    def _insert_econ_inputs(self, conn, wells, fraction):
+        rng = self.rng
+        chosen = wells.loc[rng.random(len(wells)) < fraction]
+        n = len(chosen)
+        fcst_start = chosen["_LAST_PROD"] + pd.offsets.MonthBegin(1)
+        values = {
+            "API_UWI": chosen["API_UWI"].to_numpy(),
+            "OIL_CALC_QI": np.where(chosen["_GAS_ONLY"], 0.0, rng.lognormal(7.5, 0.6, n)).round(1),
+            "OIL_Q_MIN": np.full(n, 5.0),
+            "OIL_EMPIRICAL_DI": rng.uniform(0.3, 0.8, n).round(4),
+            "OIL_CALC_B_FACTOR": rng.uniform(0.6, 1.2, n).round(3),
+            "OIL_D_MIN": np.full(n, 0.06),
+            "OIL_DECLINE_TYPE": rng.choice(["EXP", "HYP"], n, p=[0.2, 0.8]),
+            "FCST_START_OIL": _iso(fcst_start),
+            "OIL_FCST_YRS": np.full(n, 30.0),
+            "GAS_CALC_QI": rng.lognormal(8.8, 0.6, n).round(1),
+            "GAS_Q_MIN": np.full(n, 20.0),
+            "GAS_EMPIRICAL_DI": rng.uniform(0.3, 0.8, n).round(4),
+            "GAS_CALC_B_FACTOR": rng.uniform(0.6, 1.2, n).round(3),
+            "GAS_D_MIN": np.full(n, 0.06),
+            "GAS_DECLINE_TYPE": rng.choice(["EXP", "HYP"], n, p=[0.2, 0.8]),
+            "FCST_START_GAS": _iso(fcst_start),
+            "GAS_FCST_YRS": np.full(n, 30.0),
+            "ECON_SCENARIO": rng.choice(list(ECON_SCENARIOS), n),
+            "APPROVED": np.where(rng.random(n) < 0.5, "Y", None),
+            "LAST_EDIT_DATE": (
+                pd.Timestamp.now().floor("s") - pd.to_timedelta(rng.integers(0, 365 * 24 * 3600, n), unit="s")
+            ).strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        frame = pd.DataFrame({col: values[col] for col in ["API_UWI"] + DCA_INPUT_COLUMNS + ["LAST_EDIT_DATE"]})
+        return self._insert_frame(conn, "ECON_INPUT_1PASS", frame)
+
+    def _insert_price_decks(self, conn):
+        rng = self.rng
+        rows = []
+        hist_months = pd.date_range("2000-01-31", self.today, freq="ME")
+        oil = 30 + np.cumsum(rng.normal(0.15, 3.0, len(hist_months))).clip(-10, 90)
+        gas = 3 + np.cumsum(rng.normal(0.0, 0.25, len(hist_months))).clip(-1.5, 8)
+        rows.extend(("HIST", m.strftime("%Y-%m-%d"), round(float(o), 2), round(float(g), 3))
+                    for m, o, g in zip(hist_months, oil.clip(15), gas.clip(1.2)))
+
+        future = pd.date_range(self.today + pd.offsets.MonthEnd(1), periods=15 * 12, freq="ME")
+        years = np.arange(len(future)) / 12.0
+        for name, (oil0, gas0, drift) in PRICE_DECKS.items():
+            factor = (1 + drift) ** years
+            rows.extend((name, m.strftime("%Y-%m-%d"), round(float(oil0 * f), 2), round(float(gas0 * f), 3))
+                        for m, f in zip(future, factor))
+        self._insert_rows(conn, "PRICE_DECK", ["PRICE_DECK_NAME", "MONTH_DATE", "OIL", "GAS"], rows)
+        return len(rows)
+
+    def _insert_econ_scenarios(self, conn):
+        rows = []
+        for name, overrides in ECON_SCENARIOS.items():
+            values = {**ECON_SCENARIO_DEFAULTS, **overrides, "ECON_SCENARIO": name}
+            rows.append(tuple(values.get(col) for col in ECON_SCENARIO_COLUMNS))
+        self._insert_rows(conn, "ECON_SCENARIOS", ECON_SCENARIO_COLUMNS, rows)
+        return len(rows)
+
+    def _insert_user_mappings(self, conn, n_owners):
+        rows = [(f"owner{i:05d}@example.com", f"Owner {i:05d}") for i in range(1, n_owners + 1)]
+        self._insert_rows(conn, "USER_MAPPINGS", ["AUTH0_EMAIL", "OWNER_NAME"], rows)
+        return len(rows)
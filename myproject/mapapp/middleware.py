@@ -0,0 +1,53 @@
+"""Request middleware for the map application."""
+
+from __future__ import annotations
+
+from . import snowflake_helpers
+
+
+class QueryMetricsMiddleware:
+    """Attribute Snowflake statements to the Django view that issued them.
+
+    Every statement executed while the request is handled (including those
+    fanned out through ``snowflake_helpers.run_concurrently``) is collected
+    into a per-request scope, folded into the per-view aggregates served by
+    ``/api/query-stats/`` and emitted as one structured log line. Streaming
+    responses are finished once their content has been fully sent.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with snowflake_helpers.query_scope(request.path) as scope:
+            response = self.get_response(request)
+
+        match = getattr(request, "resolver_match", None)
+        if match is not None and match.view_name:
+            scope.name = match.view_name
+        context = {
+            "method": request.method,
+            "path": request.path,
+            "status": getattr(response, "status_code", None),
+        }
+        if getattr(response, "streaming", False):
+            response.streaming_content = self._stream_within(
+                scope, response.streaming_content, context
+            )
+        else:
+            snowflake_helpers.finish_scope(scope, **context)
+        return response
+
+    @staticmethod
+    def _stream_within(scope, content, context):
+        iterator = iter(content)
+        try:
+            while True:
+                with snowflake_helpers.attach_scope(scope):
+                    try:
+                        chunk = next(iterator)
+                    except StopIteration:
+                        return
+                yield chunk
+        finally:
+            snowflake_helpers.finish_scope(scope, **context)
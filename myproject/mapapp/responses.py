@@ -0,0 +1,197 @@
+"""Response helpers shared by the JSON endpoints."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import itertools
+import json
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, Optional
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.utils.cache import patch_vary_headers
+
+try:  # optional; gzip is always available
+    import brotli
+except ImportError:  # pragma: no cover - brotli variant is simply skipped
+    brotli = None
+
+try:  # optional; falls back to the stdlib encoder
+    import orjson
+except ImportError:  # pragma: no cover - json.dumps is used instead
+    orjson = None
+
+
+CACHE_CONTROL = "private, no-cache"
+_ENCODED_CACHE_MAX_KEYS = 32
+
+
+def prime(iterator: Iterable[Any]) -> Iterator[Any]:
+    """Start ``iterator`` now so query errors surface before a response is sent.
+
+    Returns an equivalent iterator with the first item already fetched.
+    """
+
+    iterator = iter(iterator)
+    try:
+        first = next(iterator)
+    except StopIteration:
+        return iter(())
+    return itertools.chain((first,), iterator)
+
+
+def dumps(data: Any) -> bytes:
+    """Encode ``data`` as UTF-8 JSON, using orjson when it is installed.
+
+    Types orjson does not know (``Decimal``, lazy strings, ...) are handed to
+    ``DjangoJSONEncoder`` as with ``JsonResponse``.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(data, default=DjangoJSONEncoder().default)
+    return json.dumps(data, cls=DjangoJSONEncoder).encode("utf-8")
+
+
+def json_response(data: Any, *, status: int = 200) -> HttpResponse:
+    """A ``JsonResponse`` equivalent serialized with :func:`dumps`."""
+
+    return HttpResponse(dumps(data), content_type="application/json", status=status)
+
+
+def _json_array_chunks(
+    key: str,
+    items: Iterable[Any],
+    transform: Optional[Callable[[Any], Any]],
+    chunk_items: int,
+) -> Iterator[str]:
+    encoder = DjangoJSONEncoder()
+    yield "{" + json.dumps(key) + ": ["
+    buffer = []
+    first = True
+    for item in items:
+        if transform is not None:
+            item = transform(item)
+        buffer.append(("" if first else ",") + encoder.encode(item))
+        first = False
+        if len(buffer) >= chunk_items:
+            yield "".join(buffer)
+            buffer = []
+    if buffer:
+        yield "".join(buffer)
+    yield "]}"
+
+
+def streaming_json_list(
+    key: str,
+    items: Iterable[Any],
+    transform: Optional[Callable[[Any], Any]] = None,
+    *,
+    chunk_items: int = 500,
+    status: int = 200,
+) -> StreamingHttpResponse:
+    """Stream ``{"<key>": [...]}`` without materialising the list.
+
+    Each item is passed through ``transform`` and encoded with the same
+    encoder ``JsonResponse`` uses; items are flushed in groups of
+    ``chunk_items``.
+    """
+
+    return StreamingHttpResponse(
+        _json_array_chunks(key, items, transform, chunk_items),
+        content_type="application/json",
+        status=status,
+    )
+
+
+class Precompressed:
+    """A serialized response body with gzip/brotli variants and a strong ETag."""
+
+    def __init__(self, body: bytes, content_type: str) -> None:
+        self.content_type = content_type
+        self.digest = hashlib.sha256(body).hexdigest()[:32]
+        self.variants: Dict[str, bytes] = {"identity": body, "gzip": gzip.compress(body, 6, mtime=0)}
+        if brotli is not None:
+            self.variants["br"] = brotli.compress(body, quality=5)
+
+    @classmethod
+    def from_json(cls, data: Any) -> "Precompressed":
+        body = json.dumps(data, cls=DjangoJSONEncoder).encode("utf-8")
+        return cls(body, "application/json")
+
+    def etag(self, encoding: str) -> str:
+        # Strong validators must differ between content codings.
+        suffix = "" if encoding == "identity" else f"-{encoding}"
+        return f'"{self.digest}{suffix}"'
+
+    def matches(self, if_none_match: str) -> bool:
+        tags = {tag.strip() for tag in if_none_match.split(",")}
+        if "*" in tags:
+            return True
+        tags = {tag[2:] if tag.startswith("W/") else tag for tag in tags}
+        return any(self.etag(encoding) in tags for encoding in self.variants)
+
+    def choose_encoding(self, accept_encoding: str) -> str:
+        accepted = set()
+        for part in accept_encoding.split(","):
+            token, _, params = part.strip().partition(";")
+            params = params.strip().replace(" ", "")
+            if params.startswith("q="):
+                try:
+                    if float(params[2:]) <= 0:
+                        continue
+                except ValueError:
+                    continue
+            accepted.add(token.strip().lower())
+        for encoding in ("br", "gzip"):
+            if encoding in self.variants and (encoding in accepted or "*" in accepted):
+                return encoding
+        return "identity"
+
+
+def precompressed_response(request, payload: Precompressed) -> HttpResponse:
+    """Serve ``payload`` honouring ``If-None-Match`` and ``Accept-Encoding``."""
+
+    encoding = payload.choose_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+    if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+    if if_none_match and payload.matches(if_none_match):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(payload.variants[encoding], content_type=payload.content_type)
+        if encoding != "identity":
+            response["Content-Encoding"] = encoding
+    response["ETag"] = payload.etag(encoding)
+    response["Cache-Control"] = CACHE_CONTROL
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
+
+class EncodedCache:
+    """Serialized payloads for one source object, rebuilt when the source changes.
+
+    ``source`` is compared by identity, so callers pass the cached object
+    (payload dict, DataFrame, ...) whose replacement marks a new generation.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._source: Any = None
+        self._entries: Dict[Hashable, Precompressed] = {}
+
+    def get(self, source: Any, key: Hashable, build: Callable[[], Precompressed]) -> Precompressed:
+        with self._lock:
+            if self._source is source and key in self._entries:
+                return self._entries[key]
+        payload = build()
+        with self._lock:
+            if self._source is not source or len(self._entries) >= _ENCODED_CACHE_MAX_KEYS:
+                self._source = source
+                self._entries = {}
+            self._entries[key] = payload
+        return payload
+
+    def clear(self) -> None:
+        with self._lock:
+            self._source = None
+            self._entries = {}
@@ -0,0 +1,391 @@
+"""On-disk snapshots of reference datasets, shared by the workers on a host.
+
+New workers start warm from the snapshot, readers attach to the memory-mapped
+file instead of holding private copies of the numeric columns, and refreshes
+are serialised through a per-dataset file lock so only one worker per host
+queries Snowflake for a given generation.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+import pandas as pd
+
+try:  # pyarrow ships with snowflake-connector-python[pandas]
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - snapshots are simply disabled
+    pa = None
+    feather = None
+
+try:  # filelock is a connector dependency as well
+    from filelock import FileLock, Timeout as FileLockTimeout
+except ImportError:  # pragma: no cover - workers refresh independently
+    FileLock = None
+    FileLockTimeout = None
+
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the shape of a snapshotted dataset changes so workers running
+# new code never load a file written by an older release.
+SNAPSHOT_FORMAT_VERSION = 6
+_METADATA_KEY = b"seg_snapshot"
+
+_refreshing: Set[str] = set()
+_refreshing_lock = threading.Lock()
+
+_local_versions: Dict[str, int] = {}
+_versions_lock = threading.Lock()
+
+
+def env_seconds(name: str, default: float) -> float:
+    """A duration from the environment, or ``default`` when unset or invalid."""
+
+    try:
+        return float(os.getenv(name) or default)
+    except ValueError:
+        return default
+
+
+def snapshots_enabled() -> bool:
+    if pa is None:
+        return False
+    return (os.getenv("SEG_SNAPSHOTS_ENABLED") or "1").strip().lower() not in ("0", "false", "no")
+
+
+def snapshot_dir() -> Path:
+    """Directory holding snapshot files (``SEG_SNAPSHOT_DIR`` or a temp dir)."""
+
+    configured = os.getenv("SEG_SNAPSHOT_DIR")
+    if configured:
+        return Path(os.path.expanduser(configured))
+    return Path(tempfile.gettempdir()) / "seg-admin-snapshots"
+
+
+def _snapshot_path(name: str) -> Path:
+    return snapshot_dir() / f"{name}.arrow"
+
+
+def _lock_path(name: str) -> Path:
+    return snapshot_dir() / f"{name}.lock"
+
+
+def _version_path(name: str) -> Path:
+    return snapshot_dir() / f"{name}.version"
+
+
+@contextmanager
+def host_lock(name: str):
+    """Hold the host-wide lock for refreshing ``name`` (a no-op without filelock).
+
+    Waits up to ``SEG_SNAPSHOT_LOCK_TIMEOUT_SECONDS`` (default 120) and then
+    proceeds without the lock rather than failing the request.
+    """
+
+    if FileLock is None or not snapshots_enabled():
+        yield
+        return
+
+    path = _lock_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lock = FileLock(str(path))
+    try:
+        lock.acquire(timeout=env_seconds("SEG_SNAPSHOT_LOCK_TIMEOUT_SECONDS", 120))
+    except FileLockTimeout:
+        logger.warning("Timed out waiting for the %s refresh lock; refreshing without it", name)
+        yield
+        return
+    try:
+        yield
+    finally:
+        lock.release()
+
+
+def version_stamp(name: str) -> str:
+    """Host-wide version of ``name``, changed by every :func:`bump_version`.
+
+    Workers key caches of data that another worker can change (approvals,
+    scenarios) on this stamp. It is read from ``<name>.version`` next to the
+    snapshots; without snapshots only this process's bumps are seen.
+    """
+
+    with _versions_lock:
+        local = _local_versions.get(name, 0)
+    shared = ""
+    if snapshots_enabled():
+        try:
+            shared = _version_path(name).read_text()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            logger.warning("Unable to read %s version stamp", name, exc_info=True)
+    return f"{shared}:{local}"
+
+
+def bump_version(name: str) -> None:
+    """Invalidate caches keyed on ``version_stamp(name)`` in every worker on the host."""
+
+    with _versions_lock:
+        _local_versions[name] = _local_versions.get(name, 0) + 1
+    if not snapshots_enabled():
+        return
+    path = _version_path(name)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as handle:
+                handle.write(f"{time.time_ns()}-{os.getpid()}")
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+    except OSError:
+        logger.warning("Unable to write %s version stamp to %s", name, path, exc_info=True)
+
+
+def save_frame(name: str, df: pd.DataFrame) -> bool:
+    """Atomically persist ``df`` as an uncompressed Arrow/Feather file."""
+
+    if not snapshots_enabled() or df is None:
+        return False
+
+    path = _snapshot_path(name)
+    stamp = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "created_at": time.time(),
+        "rows": int(len(df)),
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[_METADATA_KEY] = json.dumps(stamp).encode()
+        table = table.replace_schema_metadata(metadata)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{name}.", suffix=".tmp")
+        os.close(fd)
+        try:
+            feather.write_feather(table, tmp_path, compression="uncompressed")
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+    except Exception:  # noqa: BLE001
+        logger.warning("Unable to write %s snapshot to %s", name, path, exc_info=True)
+        return False
+    return True
+
+
+def _arrow_string_dtype(arrow_type: Any) -> Optional[pd.ArrowDtype]:
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return pd.ArrowDtype(arrow_type)
+    return None
+
+
+def load_frame(
+    name: str, *, arrow_strings: bool = False
+) -> Optional[Tuple[pd.DataFrame, Dict[str, Any]]]:
+    """Return ``(frame, stamp)`` for a usable snapshot, or ``None``.
+
+    Snapshots written by another format version, or older than
+    ``SEG_SNAPSHOT_MAX_AGE_SECONDS`` (default one day), are ignored.
+
+    Numeric columns without nulls are zero-copy views of the memory-mapped
+    file, so every worker shares one copy in the page cache. With
+    ``arrow_strings`` string columns stay Arrow-backed (``pd.ArrowDtype``)
+    views of the file as well instead of per-worker Python strings. Mapped
+    columns are read-only: copy a frame before modifying it in place.
+    """
+
+    if not snapshots_enabled():
+        return None
+
+    path = _snapshot_path(name)
+    if not path.is_file():
+        return None
+    try:
+        table = feather.read_table(str(path), memory_map=True)
+        stamp = json.loads((table.schema.metadata or {}).get(_METADATA_KEY, b"{}"))
+    except Exception:  # noqa: BLE001
+        logger.warning("Ignoring unreadable %s snapshot at %s", name, path, exc_info=True)
+        return None
+
+    if stamp.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+        return None
+    age = time.time() - float(stamp.get("created_at") or 0)
+    if age > env_seconds("SEG_SNAPSHOT_MAX_AGE_SECONDS", 24 * 60 * 60):
+        return None
+
+    stamp["age_seconds"] = max(0.0, age)
+    types_mapper = _arrow_string_dtype if arrow_strings else None
+    return table.to_pandas(split_blocks=True, types_mapper=types_mapper), stamp
+
+
+def refresh_shared(
+    name: str,
+    fetch: Callable[[], pd.DataFrame],
+    *,
+    newer_than: Optional[float] = None,
+    arrow_strings: bool = False,
+) -> pd.DataFrame:
+    """Fetch ``name`` and rewrite its snapshot, once per host.
+
+    Under the host lock, a snapshot written after ``newer_than`` (a
+    ``time.time()`` value; any usable snapshot when ``None``) is returned
+    instead of calling ``fetch()``. That means another worker already
+    refreshed it while this one waited. After a fetch the freshly written
+    snapshot is returned, so the refreshing worker maps the shared file too.
+    """
+
+    with host_lock(name):
+        snapshot = load_frame(name, arrow_strings=arrow_strings)
+        if snapshot is not None:
+            frame, stamp = snapshot
+            if newer_than is None or float(stamp.get("created_at") or 0) > newer_than:
+                return frame
+        frame = fetch()
+        if save_frame(name, frame):
+            snapshot = load_frame(name, arrow_strings=arrow_strings)
+            if snapshot is not None:
+                return snapshot[0]
+        return frame
+
+
+def refresh_in_background(name: str, refresh: Callable[[], Any]) -> bool:
+    """Run ``refresh`` on a daemon thread unless one is already running for ``name``."""
+
+    with _refreshing_lock:
+        if name in _refreshing:
+            return False
+        _refreshing.add(name)
+
+    def _run():
+        try:
+            refresh()
+        except Exception:  # noqa: BLE001
+            logger.exception("Background refresh of %s failed", name)
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(name)
+
+    threading.Thread(target=_run, name=f"refresh-{name}", daemon=True).start()
+    return True
+
+
+def warm_load(
+    name: str,
+    fetch: Callable[[], pd.DataFrame],
+    on_refresh: Optional[Callable[[pd.DataFrame], Any]] = None,
+    *,
+    refresh_after: float = 300.0,
+    arrow_strings: bool = False,
+) -> pd.DataFrame:
+    """Return a dataset from its snapshot now and refresh it in the background.
+
+    When the snapshot is older than ``refresh_after`` seconds a background
+    thread refreshes it through ``refresh_shared`` and hands the fresh frame
+    to ``on_refresh``. Without a usable snapshot the first worker fetches
+    inline while the others wait for its snapshot.
+    """
+
+    snapshot = load_frame(name, arrow_strings=arrow_strings)
+    if snapshot is None:
+        return refresh_shared(name, fetch, arrow_strings=arrow_strings)
+
+    frame, stamp = snapshot
+    if stamp["age_seconds"] >= refresh_after:
+
+        def _refresh():
+            fresh = refresh_shared(
+                name, fetch, newer_than=time.time() - refresh_after, arrow_strings=arrow_strings
+            )
+            if on_refresh is not None:
+                on_refresh(fresh)
+
+        refresh_in_background(name, _refresh)
+    return frame
+
+
+class SharedDataset:
+    """A snapshot-backed DataFrame cached per process with a TTL.
+
+    ``get()`` returns the cached frame. Once it is older than ``ttl`` seconds
+    the stale frame keeps being served while a background thread refreshes
+    it through ``refresh_shared`` (so once per host). A failed refresh is
+    retried after ``error_backoff`` seconds, doubling per consecutive
+    failure up to ``max_backoff``. ``invalidate()`` drops the cached frame;
+    the next ``get()`` waits for a snapshot written after the invalidation,
+    fetching it if no other worker has.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fetch: Callable[[], pd.DataFrame],
+        *,
+        ttl: float = 300.0,
+        error_backoff: float = 30.0,
+        max_backoff: float = 600.0,
+    ) -> None:
+        self.name = name
+        self.fetch = fetch
+        self.ttl = ttl
+        self.error_backoff = error_backoff
+        self.max_backoff = max_backoff
+        self._lock = threading.Lock()
+        self._frame: Optional[pd.DataFrame] = None
+        self._loaded_at = 0.0
+        self._invalidated_at: Optional[float] = None
+        self._failures = 0
+        self._retry_at = 0.0
+
+    def get(self) -> pd.DataFrame:
+        frame = self._frame
+        if frame is not None:
+            now = time.monotonic()
+            if now - self._loaded_at >= self.ttl and now >= self._retry_at:
+                refresh_in_background(self.name, self.refresh)
+            return frame
+
+        with self._lock:
+            if self._frame is not None:
+                return self._frame
+            if self._invalidated_at is not None:
+                frame = refresh_shared(self.name, self.fetch, newer_than=self._invalidated_at)
+                self._invalidated_at = None
+            else:
+                frame = warm_load(self.name, self.fetch, self._store, refresh_after=self.ttl)
+            self._store(frame)
+            return frame
+
+    def refresh(self) -> pd.DataFrame:
+        try:
+            frame = refresh_shared(self.name, self.fetch, newer_than=time.time() - self.ttl)
+        except Exception:
+            self._failures += 1
+            backoff = min(self.error_backoff * 2 ** (self._failures - 1), self.max_backoff)
+            self._retry_at = time.monotonic() + backoff
+            raise
+        self._store(frame)
+        return frame
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._frame = None
+            self._invalidated_at = time.time()
+
+    def _store(self, frame: pd.DataFrame) -> None:
+        self._frame = frame
+        self._loaded_at = time.monotonic()
+        self._failures = 0
+        self._retry_at = 0.0
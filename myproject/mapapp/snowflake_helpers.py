@@ -2,24 +2,44 @@
 
 from __future__ import annotations
 
+import atexit
 import base64
+import contextvars
+import json
+import logging
 import os
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from functools import lru_cache
-from typing import Any, Dict, Iterable, Optional, Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import boto3
+import pandas as pd
 import snowflake.connector
 from botocore.exceptions import ClientError
 from snowflake.connector import DictCursor
+from snowflake.connector import errors as snowflake_errors
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.backends import default_backend
 
+from . import local_backend
+
+
+logger = logging.getLogger(__name__)
+
 
 class SnowflakeConfigurationError(RuntimeError):
     """Raised when the Snowflake configuration is incomplete."""
 
 
+class ConnectionPoolTimeout(snowflake_errors.OperationalError):
+    """Raised when no pooled connection becomes available in time."""
+
+
 def _load_private_key_from_file() -> Optional[bytes]:
     """Return the RSA key bytes from the filesystem if a path is configured."""
 
@@ -185,27 +205,521 @@ def get_connection_kwargs() -> Dict[str, Any]:
 
 
 def connect(**overrides: Any):
-    """Create a Snowflake connection using the shared configuration."""
+    """Create a Snowflake connection using the shared configuration.
+
+    With ``SNOWFLAKE_BACKEND=sqlite`` a connection to the local stand-in
+    database is returned instead (see :mod:`local_backend`).
+    """
+
+    if local_backend.backend_enabled():
+        return local_backend.connect(**overrides)
 
     cfg = _build_connection_kwargs()
     cfg.update(overrides)
     return snowflake.connector.connect(**cfg)
 
 
+def _getenv_number(name: str, default: float) -> float:
+    """Return a numeric environment setting, falling back on bad values."""
+
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning("Ignoring invalid value %r for %s", value, name)
+        return default
+
+
+class ConnectionPool:
+    """Bounded, thread-safe pool of reusable Snowflake connections.
+
+    Idle connections are kept LIFO so the warmest session is reused first.
+    Connections idle longer than ``max_idle_seconds`` are closed, and any
+    connection idle longer than ``health_check_seconds`` is validated with a
+    heartbeat before being handed out again.
+    """
+
+    def __init__(
+        self,
+        factory,
+        *,
+        max_size: int = 8,
+        max_idle_seconds: float = 600.0,
+        health_check_seconds: float = 60.0,
+        acquire_timeout: float = 30.0,
+    ) -> None:
+        self._factory = factory
+        self.max_size = max(1, int(max_size))
+        self.max_idle_seconds = max_idle_seconds
+        self.health_check_seconds = health_check_seconds
+        self.acquire_timeout = acquire_timeout
+        self._idle: List[Tuple[Any, float]] = []
+        self._checked_out = 0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        """Borrow a healthy connection, opening a new one if under the limit."""
+
+        deadline = time.monotonic() + self.acquire_timeout
+        while True:
+            stale: List[Any] = []
+            conn = None
+            idle_for = 0.0
+            with self._cond:
+                while True:
+                    now = time.monotonic()
+                    stale.extend(self._evict_idle_locked(now))
+                    if self._idle:
+                        conn, last_used = self._idle.pop()
+                        idle_for = now - last_used
+                        self._checked_out += 1
+                        break
+                    if self._checked_out < self.max_size:
+                        self._checked_out += 1
+                        break
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        self._close_quietly(stale)
+                        raise ConnectionPoolTimeout(
+                            msg=(
+                                "Timed out waiting for a Snowflake connection "
+                                f"(pool size {self.max_size})"
+                            )
+                        )
+                    self._cond.wait(remaining)
+            self._close_quietly(stale)
+
+            if conn is None:
+                try:
+                    return self._factory()
+                except BaseException:
+                    self._forget()
+                    raise
+
+            if self._is_healthy(conn, idle_for):
+                return conn
+            self._discard(conn)
+
+    def release(self, conn, *, discard: bool = False) -> None:
+        """Return ``conn`` to the pool, or close it when it is no longer usable."""
+
+        if discard or _connection_closed(conn):
+            self._discard(conn)
+            return
+        with self._cond:
+            self._checked_out = max(0, self._checked_out - 1)
+            self._idle.append((conn, time.monotonic()))
+            stale = self._evict_idle_locked(time.monotonic())
+            self._cond.notify()
+        self._close_quietly(stale)
+
+    def close_all(self) -> None:
+        """Close every idle connection; borrowed ones close on release."""
+
+        with self._cond:
+            idle = [conn for conn, _ in self._idle]
+            self._idle = []
+            self._cond.notify_all()
+        self._close_quietly(idle)
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "max_size": self.max_size,
+                "idle": len(self._idle),
+                "in_use": self._checked_out,
+            }
+
+    def _evict_idle_locked(self, now: float) -> List[Any]:
+        if not self._idle:
+            return []
+        cutoff = now - self.max_idle_seconds
+        keep = [(conn, ts) for conn, ts in self._idle if ts >= cutoff]
+        stale = [conn for conn, ts in self._idle if ts < cutoff]
+        self._idle = keep
+        return stale
+
+    def _is_healthy(self, conn, idle_for: float) -> bool:
+        if _connection_closed(conn):
+            return False
+        if idle_for < self.health_check_seconds:
+            return True
+        try:
+            return bool(conn.is_valid())
+        except Exception:  # noqa: BLE001
+            return False
+
+    def _forget(self) -> None:
+        with self._cond:
+            self._checked_out = max(0, self._checked_out - 1)
+            self._cond.notify()
+
+    def _discard(self, conn) -> None:
+        self._forget()
+        self._close_quietly([conn])
+
+    @staticmethod
+    def _close_quietly(conns: Iterable[Any]) -> None:
+        for conn in conns:
+            try:
+                conn.close()
+            except Exception:  # noqa: BLE001
+                logger.debug("Ignoring error while closing pooled connection", exc_info=True)
+
+
+def _connection_closed(conn) -> bool:
+    try:
+        return bool(conn.is_closed())
+    except Exception:  # noqa: BLE001
+        return True
+
+
+class PooledConnection:
+    """Connection handle borrowed from the pool.
+
+    Behaves like a regular Snowflake connection, except ``close()`` hands the
+    underlying session back to the pool instead of logging out.
+    """
+
+    _DISCARD_ERRORS = (snowflake_errors.InterfaceError, snowflake_errors.OperationalError)
+
+    def __init__(self, pool: ConnectionPool, conn) -> None:
+        self._pool = pool
+        self._conn = conn
+
+    @property
+    def raw(self):
+        if self._conn is None:
+            raise snowflake_errors.InterfaceError(msg="Connection already returned to pool")
+        return self._conn
+
+    def cursor(self, *args: Any, **kwargs: Any):
+        return InstrumentedCursor(self.raw.cursor(*args, **kwargs))
+
+    def commit(self) -> None:
+        self.raw.commit()
+
+    def rollback(self) -> None:
+        self.raw.rollback()
+
+    def close(self, *, discard: bool = False) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            self._pool.release(conn, discard=discard)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.raw, name)
+
+    def __enter__(self) -> "PooledConnection":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close(discard=isinstance(exc, self._DISCARD_ERRORS))
+
+    def __del__(self) -> None:
+        # Safety net for handles that were never closed so the pool slot is
+        # not leaked for the life of the process.
+        try:
+            self.close()
+        except Exception:  # noqa: BLE001
+            pass
+
+
+# ---------------------------------------------------------------------------
+# Query instrumentation
+# ---------------------------------------------------------------------------
+
+_RECENT_QUERY_LOG_SIZE = 50
+_MAX_STATEMENTS_PER_VIEW = 50
+_BACKGROUND_SCOPE = "<background>"
+_IN_LIST_RE = re.compile(r"\(\s*%s(?:\s*,\s*%s)+\s*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_current_scope: contextvars.ContextVar = contextvars.ContextVar(
+    "snowflake_query_scope", default=None
+)
+_stats_lock = threading.Lock()
+_view_stats: Dict[str, Dict[str, Any]] = {}
+_recent_queries: deque = deque(maxlen=_RECENT_QUERY_LOG_SIZE)
+_stats_since = time.time()
+
+
+def _statement_fingerprint(query: Any) -> str:
+    text = _WHITESPACE_RE.sub(" ", str(query or "")).strip()
+    return _IN_LIST_RE.sub("(%s, ...)", text)[:300]
+
+
+class QueryScope:
+    """Collects query records and timed phases for one unit of work (a request)."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.queries: List[Dict[str, Any]] = []
+        self.phases: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def add_query(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self.queries.append(record)
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds * 1000.0
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            queries = list(self.queries)
+            phases = dict(self.phases)
+        return {
+            "view": self.name,
+            "query_count": len(queries),
+            "query_ms": round(sum(q["ms"] + q["fetch_ms"] for q in queries), 2),
+            "rows": sum(q["rows"] or 0 for q in queries),
+            "bytes": sum(q["bytes"] or 0 for q in queries),
+            "phases_ms": {name: round(ms, 2) for name, ms in phases.items()},
+            "queries": queries,
+        }
+
+
 @contextmanager
-def _snowflake_cursor(dict_cursor: bool = False):
-    """Yield a Snowflake cursor and ensure cleanup."""
+def attach_scope(scope: QueryScope):
+    """Make ``scope`` current for the duration of the block."""
 
-    conn = connect()
-    cursor = conn.cursor(DictCursor) if dict_cursor else conn.cursor()
+    token = _current_scope.set(scope)
     try:
-        yield cursor
-        conn.commit()
+        yield scope
     finally:
+        _current_scope.reset(token)
+
+
+def query_scope(name: str):
+    """Attribute every statement run inside the block to ``name``."""
+
+    return attach_scope(QueryScope(name))
+
+
+def record_phase(name: str, seconds: float) -> None:
+    """Record non-query work (e.g. pandas modelling) against the current scope."""
+
+    scope = _current_scope.get()
+    if scope is not None:
+        scope.add_phase(name, seconds)
+
+
+@contextmanager
+def timed_phase(name: str):
+    """Context manager form of :func:`record_phase`."""
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_phase(name, time.perf_counter() - started)
+
+
+def _aggregate_locked(view: str, queries: Sequence[Dict[str, Any]], phases: Dict[str, float], request: bool) -> None:
+    entry = _view_stats.setdefault(
+        view,
+        {"requests": 0, "queries": 0, "query_ms": 0.0, "rows": 0, "bytes": 0, "phases_ms": {}, "statements": {}},
+    )
+    if request:
+        entry["requests"] += 1
+    for name, ms in phases.items():
+        entry["phases_ms"][name] = round(entry["phases_ms"].get(name, 0.0) + ms, 2)
+    for record in queries:
+        total_ms = record["ms"] + record["fetch_ms"]
+        entry["queries"] += 1
+        entry["query_ms"] = round(entry["query_ms"] + total_ms, 2)
+        entry["rows"] += record["rows"] or 0
+        entry["bytes"] += record["bytes"] or 0
+        statements = entry["statements"]
+        stmt = statements.get(record["sql"])
+        if stmt is None:
+            if len(statements) >= _MAX_STATEMENTS_PER_VIEW:
+                continue
+            stmt = statements[record["sql"]] = {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "rows": 0, "bytes": 0}
+        stmt["count"] += 1
+        stmt["total_ms"] = round(stmt["total_ms"] + total_ms, 2)
+        stmt["max_ms"] = round(max(stmt["max_ms"], total_ms), 2)
+        stmt["rows"] += record["rows"] or 0
+        stmt["bytes"] += record["bytes"] or 0
+
+
+def finish_scope(scope: QueryScope, **context: Any) -> Optional[Dict[str, Any]]:
+    """Fold a finished scope into the per-view aggregates and log it.
+
+    Returns the structured summary, or ``None`` when no work was recorded.
+    """
+
+    summary = scope.summary()
+    if not summary["query_count"] and not summary["phases_ms"]:
+        return None
+    summary.update(context)
+    with _stats_lock:
+        _aggregate_locked(scope.name, summary["queries"], summary["phases_ms"], request=True)
+    logger.info("snowflake.view_queries %s", json.dumps(summary, default=str))
+    return summary
+
+
+def _record_query(record: Dict[str, Any]) -> None:
+    with _stats_lock:
+        _recent_queries.append(record)
+    scope = _current_scope.get()
+    if scope is not None:
+        scope.add_query(record)
+    else:
+        with _stats_lock:
+            _aggregate_locked(_BACKGROUND_SCOPE, [record], {}, request=False)
+
+
+def query_stats() -> Dict[str, Any]:
+    """Snapshot of the per-view query aggregates collected by this process."""
+
+    with _stats_lock:
+        views = json.loads(json.dumps(_view_stats))
+        recent = sorted(_recent_queries, key=lambda r: r["ms"] + r["fetch_ms"], reverse=True)
+    return {
+        "since": _stats_since,
+        "pid": os.getpid(),
+        "pool": get_pool().stats() if _pool is not None else None,
+        "views": views,
+        "recent_queries_by_duration": [dict(record) for record in recent],
+    }
+
+
+def _result_bytes(cursor) -> Optional[int]:
+    try:
+        batches = cursor.get_result_batches() or []
+    except Exception:  # noqa: BLE001
+        return None
+    sizes = [getattr(batch, "uncompressed_size", None) for batch in batches]
+    sizes = [size for size in sizes if size]
+    return int(sum(sizes)) if sizes else None
+
+
+class InstrumentedCursor:
+    """Cursor wrapper that records timing, row counts, bytes and query IDs."""
+
+    _FETCH_METHODS = frozenset(
+        {"fetchone", "fetchmany", "fetchall", "fetch_pandas_all", "fetch_arrow_batches", "fetch_arrow_all"}
+    )
+
+    def __init__(self, cursor) -> None:
+        self._cursor = cursor
+        self._record: Optional[Dict[str, Any]] = None
+
+    def execute(self, command: Any, params: Any = None, *args: Any, **kwargs: Any):
+        return self._timed("execute", command, params, *args, **kwargs)
+
+    def executemany(self, command: Any, seqparams: Any, *args: Any, **kwargs: Any):
+        return self._timed("executemany", command, seqparams, *args, **kwargs)
+
+    def _timed(self, method: str, command: Any, params: Any, *args: Any, **kwargs: Any):
+        started = time.perf_counter()
+        record = {
+            "sql": _statement_fingerprint(command),
+            "ms": 0.0,
+            "fetch_ms": 0.0,
+            "rows": None,
+            "bytes": None,
+            "sfqid": None,
+            "error": None,
+        }
         try:
-            cursor.close()
+            result = getattr(self._cursor, method)(command, params, *args, **kwargs)
+        except Exception as exc:
+            record["error"] = type(exc).__name__
+            raise
         finally:
-            conn.close()
+            record["ms"] = round((time.perf_counter() - started) * 1000.0, 2)
+            record["sfqid"] = getattr(self._cursor, "sfqid", None)
+            rowcount = getattr(self._cursor, "rowcount", None)
+            record["rows"] = rowcount if isinstance(rowcount, int) and rowcount >= 0 else None
+            record["bytes"] = _result_bytes(self._cursor)
+            self._record = record
+            _record_query(record)
+        return self if result is self._cursor else result
+
+    def _timed_fetch(self, method):
+        def wrapper(*args: Any, **kwargs: Any):
+            started = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                if self._record is not None:
+                    elapsed = (time.perf_counter() - started) * 1000.0
+                    self._record["fetch_ms"] = round(self._record["fetch_ms"] + elapsed, 2)
+
+        return wrapper
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        attr = getattr(self._cursor, name)
+        if name in self._FETCH_METHODS:
+            return self._timed_fetch(attr)
+        return attr
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __enter__(self) -> "InstrumentedCursor":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._cursor.close()
+
+
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def _pooled_connect():
+    return connect(client_session_keep_alive=True)
+
+
+def get_pool() -> ConnectionPool:
+    """Return the process-wide connection pool, creating it on first use."""
+
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    _pooled_connect,
+                    max_size=int(_getenv_number("SNOWFLAKE_POOL_SIZE", 8)),
+                    max_idle_seconds=_getenv_number("SNOWFLAKE_POOL_MAX_IDLE_SECONDS", 600),
+                    health_check_seconds=_getenv_number(
+                        "SNOWFLAKE_POOL_HEALTH_CHECK_SECONDS", 60
+                    ),
+                    acquire_timeout=_getenv_number("SNOWFLAKE_POOL_TIMEOUT_SECONDS", 30),
+                )
+                atexit.register(_pool.close_all)
+    return _pool
+
+
+def get_connection() -> PooledConnection:
+    """Borrow a pooled connection; call ``close()`` (or use ``with``) to return it."""
+
+    pool = get_pool()
+    return PooledConnection(pool, pool.acquire())
+
+
+@contextmanager
+def _snowflake_cursor(dict_cursor: bool = False):
+    """Yield a cursor on a pooled connection and ensure cleanup."""
+
+    with get_connection() as conn:
+        cursor = conn.cursor(DictCursor) if dict_cursor else conn.cursor()
+        try:
+            yield cursor
+            conn.commit()
+        finally:
+            cursor.close()
 
 
 def execute(query: str, params: Optional[Sequence[Any]] = None) -> int:
@@ -236,3 +750,161 @@ def fetch_all(
         cursor.execute(query, params or [])
         rows = cursor.fetchall()
     return rows or []
+
+
+def in_list(column: str, values: Iterable[Any]) -> Tuple[str, List[str]]:
+    """Return ``(sql, params)`` filtering ``column`` against ``values``.
+
+    The list is passed as one JSON array and expanded with ``FLATTEN``, so
+    any number of values is filtered in a single statement and round-trip.
+    The connector uses the client-side ``pyformat`` paramstyle, so the array
+    is inlined into the SQL text and each distinct list still compiles its
+    own statement. Values are compared as strings. Intended for lists up to
+    a few tens of thousands of values, since the inlined array counts
+    towards Snowflake's statement size limit.
+    """
+
+    array = json.dumps([str(value) for value in dict.fromkeys(values)])
+    sql = f"{column} IN (SELECT VALUE::STRING FROM TABLE(FLATTEN(INPUT => PARSE_JSON(%s))))"
+    return sql, [array]
+
+
+def _cursor_frame(cursor) -> pd.DataFrame:
+    """Build a DataFrame from an executed cursor, preferring Arrow batches."""
+
+    columns = [col[0] for col in cursor.description or []]
+    try:
+        frame = cursor.fetch_pandas_all()
+    except (snowflake_errors.NotSupportedError, snowflake_errors.ProgrammingError):
+        # Result was not delivered as Arrow (or pandas support is missing);
+        # fall back to row tuples so callers always get a DataFrame.
+        return pd.DataFrame(cursor.fetchall(), columns=columns)
+    if frame.empty and len(frame.columns) == 0:
+        return pd.DataFrame(columns=columns)
+    return frame
+
+
+def fetch_frame(query: str, params: Optional[Sequence[Any]] = None) -> pd.DataFrame:
+    """Return the full result of a query as a pandas DataFrame.
+
+    Results are decoded straight from the connector's Arrow result batches,
+    which avoids building a Python object per cell for large reads.
+    """
+
+    with _snowflake_cursor() as cursor:
+        cursor.execute(query, params or [])
+        return _cursor_frame(cursor)
+
+
+def fetch_arrow_batches(
+    query: str, params: Optional[Sequence[Any]] = None
+) -> Iterator[Any]:
+    """Yield the result of a query as ``pyarrow.Table`` batches.
+
+    The pooled connection is held only while the generator is consumed.
+    """
+
+    with _snowflake_cursor() as cursor:
+        cursor.execute(query, params or [])
+        yield from cursor.fetch_arrow_batches()
+
+
+def _fetch_batch_size() -> int:
+    return max(1, int(_getenv_number("SNOWFLAKE_FETCH_BATCH_SIZE", 1000)))
+
+
+def iter_batches(
+    query: str,
+    params: Optional[Sequence[Any]] = None,
+    *,
+    batch_size: Optional[int] = None,
+    dict_cursor: bool = True,
+) -> Iterator[List[Any]]:
+    """Yield the rows of a query in lists of at most ``batch_size`` rows.
+
+    Rows are pulled with ``fetchmany`` so memory stays flat regardless of
+    the result size. The query runs on the first ``next()`` and the pooled
+    connection is held only until the generator is exhausted or closed.
+    """
+
+    size = batch_size or _fetch_batch_size()
+    with _snowflake_cursor(dict_cursor=dict_cursor) as cursor:
+        cursor.execute(query, params or [])
+        while True:
+            rows = cursor.fetchmany(size)
+            if not rows:
+                return
+            yield rows
+
+
+def iter_rows(
+    query: str,
+    params: Optional[Sequence[Any]] = None,
+    *,
+    batch_size: Optional[int] = None,
+    dict_cursor: bool = True,
+) -> Iterator[Any]:
+    """Yield the rows of a query one at a time; see :func:`iter_batches`."""
+
+    for rows in iter_batches(query, params, batch_size=batch_size, dict_cursor=dict_cursor):
+        yield from rows
+
+
+_FETCH_MODES = ("all", "one", "frame")
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                # Never run more queries at once than the pool can serve.
+                _executor = ThreadPoolExecutor(
+                    max_workers=get_pool().max_size,
+                    thread_name_prefix="snowflake-query",
+                )
+    return _executor
+
+
+def _run_named_query(query: str, params: Optional[Sequence[Any]], fetch: str) -> Any:
+    if fetch == "frame":
+        return fetch_frame(query, params)
+    if fetch == "one":
+        return fetch_one(query, params)
+    return list(fetch_all(query, params))
+
+
+def run_concurrently(
+    queries: Iterable[Sequence[Any]],
+) -> Dict[str, Any]:
+    """Run independent queries in parallel and return results keyed by name.
+
+    ``queries`` holds ``(name, query, params)`` tuples with an optional fourth
+    ``fetch`` element: ``"all"`` (default, list of dicts), ``"one"`` (first
+    dict or ``None``) or ``"frame"`` (DataFrame). Each query runs on its own
+    pooled connection. A failing query maps to the exception it raised
+    instead of its rows, so one failure never hides the other results.
+    """
+
+    futures = {}
+    executor = _get_executor()
+    for entry in queries:
+        name, query, params = entry[0], entry[1], entry[2]
+        fetch = entry[3] if len(entry) > 3 else "all"
+        if fetch not in _FETCH_MODES:
+            raise ValueError(f"Unknown fetch mode {fetch!r} for query {name!r}")
+        if name in futures:
+            raise ValueError(f"Duplicate query name {name!r}")
+        # Copy the caller's context so the query is attributed to its view.
+        context = contextvars.copy_context()
+        futures[name] = executor.submit(context.run, _run_named_query, query, params, fetch)
+
+    results: Dict[str, Any] = {}
+    for name, future in futures.items():
+        try:
+            results[name] = future.result()
+        except Exception as exc:  # noqa: BLE001
+            results[name] = exc
+    return results
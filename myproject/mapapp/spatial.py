@@ -0,0 +1,145 @@
+"""Grid spatial index over the cached map coordinates.
+
+Points are bucketed into fixed-size lat/lon cells and stored sorted by cell,
+so a bounding-box query only touches the contiguous runs of cells that
+overlap the box before the exact coordinate check.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+
+EARTH_RADIUS_MILES = 3959.0
+MILES_PER_DEGREE_LAT = EARTH_RADIUS_MILES * math.pi / 180
+DEFAULT_CELL_DEGREES = 0.05
+# Cluster cells are 1/16 of a web-mercator tile, i.e. ~16px on screen.
+CLUSTER_CELLS_PER_TILE = 16
+
+BBox = Tuple[float, float, float, float]
+
+
+def parse_bbox(value: str) -> BBox:
+    """Parse ``"west,south,east,north"`` into floats, raising ``ValueError``."""
+
+    parts = [float(part) for part in value.split(",")]
+    if len(parts) != 4 or not all(math.isfinite(part) for part in parts):
+        raise ValueError("bbox must be four numbers: west,south,east,north")
+    west, south, east, north = parts
+    if west > east or south > north:
+        raise ValueError("bbox must be ordered west,south,east,north")
+    return west, south, east, north
+
+
+def cluster_cell_degrees(zoom: float) -> float:
+    return 360.0 / (2 ** max(zoom, 0.0)) / CLUSTER_CELLS_PER_TILE
+
+
+def haversine_miles(lat1: float, lon1: float, lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+    """Great-circle distance in miles from one point to arrays of points."""
+
+    lat1, lon1 = math.radians(lat1), math.radians(lon1)
+    lat2 = np.radians(lat2)
+    lon2 = np.radians(lon2)
+    a = np.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+class GridIndex:
+    """Bounding-box lookups and grid clustering over ``lat``/``lon`` arrays."""
+
+    def __init__(
+        self,
+        lat: Sequence[float],
+        lon: Sequence[float],
+        *,
+        cell_degrees: float = DEFAULT_CELL_DEGREES,
+    ) -> None:
+        self.lat = np.asarray(lat, dtype="float64")
+        self.lon = np.asarray(lon, dtype="float64")
+        self.cell_degrees = cell_degrees
+
+        valid = np.flatnonzero(np.isfinite(self.lat) & np.isfinite(self.lon))
+        if valid.size:
+            self._lat0 = float(self.lat[valid].min())
+            self._lon0 = float(self.lon[valid].min())
+            rows = self._row(self.lat[valid])
+            cols = self._col(self.lon[valid])
+            self._columns = int(cols.max()) + 1
+            self._rows = int(rows.max()) + 1
+            cells = rows * self._columns + cols
+        else:
+            self._lat0 = self._lon0 = 0.0
+            self._columns = self._rows = 0
+            cells = np.empty(0, dtype="int64")
+
+        order = np.argsort(cells, kind="stable")
+        self._cells = cells[order]
+        self._order = valid[order]
+
+    def __len__(self) -> int:
+        return int(self._order.size)
+
+    def _row(self, lat: np.ndarray) -> np.ndarray:
+        return np.floor((lat - self._lat0) / self.cell_degrees).astype("int64")
+
+    def _col(self, lon: np.ndarray) -> np.ndarray:
+        return np.floor((lon - self._lon0) / self.cell_degrees).astype("int64")
+
+    def query(self, bbox: BBox) -> np.ndarray:
+        """Sorted indices of the points inside ``bbox`` (edges inclusive)."""
+
+        west, south, east, north = bbox
+        if not self._rows:
+            return np.empty(0, dtype="int64")
+        row_lo, row_hi = np.clip(self._row(np.array([south, north])), 0, self._rows - 1)
+        col_lo, col_hi = np.clip(self._col(np.array([west, east])), 0, self._columns - 1)
+        rows = np.arange(row_lo, row_hi + 1)
+        starts = np.searchsorted(self._cells, rows * self._columns + col_lo, side="left")
+        ends = np.searchsorted(self._cells, rows * self._columns + col_hi, side="right")
+        if not (ends > starts).any():
+            return np.empty(0, dtype="int64")
+        candidates = np.concatenate([self._order[s:e] for s, e in zip(starts, ends) if e > s])
+
+        lat = self.lat[candidates]
+        lon = self.lon[candidates]
+        inside = (lat >= south) & (lat <= north) & (lon >= west) & (lon <= east)
+        return np.sort(candidates[inside])
+
+    def clusters(self, indices: np.ndarray, zoom: float) -> Dict[str, list]:
+        """Group ``indices`` into zoom-sized grid cells.
+
+        Returns the centroid ``lat``/``lon`` and point ``count`` per non-empty
+        cell.
+        """
+
+        if not len(indices):
+            return {"lat": [], "lon": [], "count": []}
+        size = cluster_cell_degrees(zoom)
+        lat = self.lat[indices]
+        lon = self.lon[indices]
+        keys = np.stack([np.floor(lat / size), np.floor(lon / size)], axis=1)
+        _, inverse, counts = np.unique(keys, axis=0, return_inverse=True, return_counts=True)
+        inverse = inverse.ravel()
+        centroid_lat = np.bincount(inverse, weights=lat) / counts
+        centroid_lon = np.bincount(inverse, weights=lon) / counts
+        return {
+            "lat": np.round(centroid_lat, 6).tolist(),
+            "lon": np.round(centroid_lon, 6).tolist(),
+            "count": counts.tolist(),
+        }
+
+    def within_radius(self, lat: float, lon: float, miles: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Indices and distances of the points within ``miles`` of a point."""
+
+        lat_pad = miles / MILES_PER_DEGREE_LAT * 1.01
+        # Widest longitude span is at the box edge nearest a pole.
+        cos_lat = max(math.cos(math.radians(min(abs(lat) + lat_pad, 89.9))), 1e-6)
+        lon_pad = lat_pad / cos_lat
+        candidates = self.query((lon - lon_pad, lat - lat_pad, lon + lon_pad, lat + lat_pad))
+        distances = haversine_miles(lat, lon, self.lat[candidates], self.lon[candidates])
+        inside = distances <= miles
+        return candidates[inside], distances[inside]
@@ -834,6 +834,8 @@ window.syncRoyaltyPanelHeight = () => {
     // Global variables to store all data
     let allWellData = null;
     let userWellData = null;
+    let mapLaterals; // undefined until fetched, null if unavailable
+    let mapDrawnYear = null; // year currently drawn on the main map
     const selectedWellApis = new Set();
     let selectionInitialized = false;
     const WELL_SELECTION_TOGGLE_ID = 'wellSelectionToggle';
@@ -1276,18 +1278,6 @@ window.syncRoyaltyPanelHeight = () => {
       }
     }
 
-    // Calculate distance between two lat/lon points in miles
-    function calculateDistance(lat1, lon1, lat2, lon2) {
-      const R = 3959; // Earth's radius in miles
-      const dLat = (lat2 - lat1) * Math.PI / 180;
-      const dLon = (lon2 - lon1) * Math.PI / 180;
-      const a = Math.sin(dLat/2) * Math.sin(dLat/2) +
-                Math.cos(lat1 * Math.PI / 180) * Math.cos(lat2 * Math.PI / 180) *
-                Math.sin(dLon/2) * Math.sin(dLon/2);
-      const c = 2 * Math.atan2(Math.sqrt(a), Math.sqrt(1-a));
-      return R * c;
-    }
-
     // Calculate centroid of user wells
     function calculateCentroid(lats, lons) {
       if (lats.length === 0) return null;
@@ -1298,47 +1288,46 @@ window.syncRoyaltyPanelHeight = () => {
       return { lat: avgLat, lon: avgLon };
     }
 
-    // Analyze wells within radius of centroid
-    function analyzeNearbyWells(allWells, userWells, currentYear, radiusMiles = 20) {
-      if (userWells.lat.length === 0) {
-        return {
-          centroid: null,
-          nearbyWells: [],
-          ageCategories: { recent: 0, medium: 0, old: 0 }
-        };
-      }
+    const nearbyWellsCache = new Map();
 
-      // Calculate centroid of user wells
-      const centroid = calculateCentroid(userWells.lat, userWells.lon);
-      
-      // Find wells within specified radius of centroid
-      const nearbyWells = [];
-      
-      for (let i = 0; i < allWells.lat.length; i++) {
-        const distance = calculateDistance(
-          centroid.lat, centroid.lon,
-          allWells.lat[i], allWells.lon[i]
-        );
-        
-        if (distance <= radiusMiles) {
-          const wellAge = currentYear - allWells.years[i];
-          nearbyWells.push({
-            index: i,
-            distance: distance,
-            age: wellAge,
-            year: allWells.years[i]
-          });
+    // Age-bucketed well counts around the centroid of the user's wells, per
+    // radius in miles. Counted server-side by /nearby-wells/ over the map
+    // payload's spatial index; results are memoised per centroid and year.
+    async function analyzeNearbyWells(userWells, currentYear, radii = [10, 20]) {
+      const emptyCounts = { recent: 0, medium: 0, old: 0, total: 0 };
+      const centroid = userWells && userWells.lat.length > 0
+        ? calculateCentroid(userWells.lat, userWells.lon)
+        : null;
+
+      let counts = {};
+      if (centroid) {
+        const params = new URLSearchParams({
+          lat: centroid.lat,
+          lon: centroid.lon,
+          year: currentYear,
+          radius: radii.join(',')
+        });
+        const key = params.toString();
+        try {
+          if (!nearbyWellsCache.has(key)) {
+            const res = await fetch(`/nearby-wells/?${key}`);
+            if (!res.ok) {
+              throw new Error(`HTTP ${res.status}: ${res.statusText}`);
+            }
+            nearbyWellsCache.set(key, (await res.json()).radii || {});
+          }
+          counts = nearbyWellsCache.get(key);
+        } catch (error) {
+          console.error('Nearby wells fetch error:', error);
         }
       }
 
-      // Categorize by age
-      const ageCategories = {
-        recent: nearbyWells.filter(w => w.age <= 3).length,    // ≤3 years
-        medium: nearbyWells.filter(w => w.age > 3 && w.age <= 10).length, // 4-10 years  
-        old: nearbyWells.filter(w => w.age > 10).length        // >10 years
-      };
-
-      return { centroid, nearbyWells, ageCategories };
+      const results = {};
+      radii.forEach((radius) => {
+        const ageCategories = counts[radius] || emptyCounts;
+        results[radius] = { centroid, total: ageCategories.total || 0, ageCategories };
+      });
+      return results;
     }
 
     // Create bar chart for nearby wells
@@ -1424,16 +1413,71 @@ window.syncRoyaltyPanelHeight = () => {
       // Removed the code that updates the total count display elements
     }
 
+    const COLUMNAR_CONTENT_TYPE = 'application/vnd.seg.columnar';
+
+    // Decode the packed columnar /map-data/ response (see mapapp/columnar.py)
+    // into typed arrays that Plotly can consume directly.
+    function decodeColumnarPayload(buffer) {
+      const view = new DataView(buffer);
+      const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+      if (magic !== 'SEGC') {
+        throw new Error('Unrecognised map data encoding');
+      }
+      const headerLength = view.getUint32(4, true);
+      const header = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 8, headerLength)));
+      const bodyStart = 8 + headerLength;
+      const count = header.count;
+      const columns = {};
+
+      header.columns.forEach((column) => {
+        const start = bodyStart + column.offset;
+        if (column.type === 'float32') {
+          columns[column.name] = new Float32Array(buffer, start, count);
+        } else if (column.type === 'int16') {
+          const raw = new Int16Array(buffer, start, count);
+          const values = new Float32Array(count);
+          for (let i = 0; i < count; i++) {
+            values[i] = raw[i] === column.null_value ? NaN : raw[i];
+          }
+          columns[column.name] = values;
+        } else if (column.type === 'dict') {
+          const codes = column.index_type === 'uint32'
+            ? new Uint32Array(buffer, start, count)
+            : new Uint16Array(buffer, start, count);
+          const dictionary = column.dictionary;
+          const values = new Array(count);
+          for (let i = 0; i < count; i++) {
+            values[i] = dictionary[codes[i]];
+          }
+          columns[column.name] = values;
+        } else if (column.type === 'utf8') {
+          const text = new TextDecoder().decode(new Uint8Array(buffer, start, column.length));
+          columns[column.name] = count ? text.split('\n').map((value) => value || null) : [];
+        }
+      });
+
+      const completion = columns.completion_date || [];
+      columns.text = completion.map((value) => (value ? `Completion: ${value}` : 'Well'));
+      columns.meta = header.meta || {};
+      if (columns.meta.year_index) {
+        columns.year_index = columns.meta.year_index;
+      }
+      return columns;
+    }
+
     // Fetch ALL Snowflake data once
     async function fetchAllData() {
       updateStatus(`Fetching all Snowflake data...`);
       
       try {
-        const res = await fetch(`/map-data/`);
+        const res = await fetch(`/map-data/?format=binary`);
         if (!res.ok) { 
           throw new Error(`HTTP ${res.status}: ${res.statusText}`); 
         }
-        const data = await res.json();
+        const contentType = res.headers.get('Content-Type') || '';
+        const data = contentType.startsWith(COLUMNAR_CONTENT_TYPE)
+          ? decodeColumnarPayload(await res.arrayBuffer())
+          : await res.json();
         
         if (!data.lat || !data.lon || !data.text) {
           throw new Error('Invalid data format from server - need lat, lon, text arrays');
@@ -1489,12 +1533,64 @@ window.syncRoyaltyPanelHeight = () => {
       }
     }
 
+    // Number of year-sorted points completed <= year, from the /map-data/
+    // year_index (first offset of each year).
+    function yearIndexEnd(yearIndex, year) {
+      const { years, starts, end } = yearIndex;
+      let lo = 0;
+      let hi = years.length;
+      while (lo < hi) {
+        const mid = (lo + hi) >> 1;
+        if (years[mid] <= year) {
+          lo = mid + 1;
+        } else {
+          hi = mid;
+        }
+      }
+      return lo < years.length ? starts[lo] : end;
+    }
+
+    // Wells completed in (fromYear, toYear] of the year-sorted payload, the
+    // part to append to the map when the slider moves forward.
+    function yearSlice(data, fromYear, toYear) {
+      const start = yearIndexEnd(data.year_index, fromYear);
+      const end = yearIndexEnd(data.year_index, toYear);
+      const slice = (values) => (values ? values.slice(start, end) : new Array(end - start).fill(null));
+      return {
+        lat: slice(data.lat),
+        lon: slice(data.lon),
+        text: slice(data.text),
+        years: slice(data.year),
+        lat_bh: slice(data.lat_bh),
+        lon_bh: slice(data.lon_bh)
+      };
+    }
+
     // Filter data by year (frontend filtering) - show wells completed <= year
     function filterDataByYear(data, year) {
       if (!data || !data.year) {
         return { lat: [], lon: [], text: [], years: [], lat_bh: [], lon_bh: [], owner_interest: [], owner_name: [], api_uwi: [], last_producing: [] };
       }
 
+      // Year-sorted server payload: the wells up to `year` are a prefix.
+      if (data.year_index) {
+        const count = yearIndexEnd(data.year_index, year);
+        const prefix = (values) => (values ? values.slice(0, count) : new Array(count).fill(null));
+        return {
+          lat: prefix(data.lat),
+          lon: prefix(data.lon),
+          text: prefix(data.text),
+          years: prefix(data.year),
+          lat_bh: prefix(data.lat_bh),
+          lon_bh: prefix(data.lon_bh),
+          owner_interest: prefix(data.owner_interest),
+          owner_name: prefix(data.owner_name),
+          last_producing: prefix(data.last_producing),
+          api_uwi: prefix(data.api_uwi),
+          completion_date: prefix(data.completion_date)
+        };
+      }
+
       const filteredIndices = [];
       for (let i = 0; i < data.year.length; i++) {
         const wellYear = parseInt(data.year[i], 10);
@@ -1518,24 +1614,47 @@ window.syncRoyaltyPanelHeight = () => {
       };
     }
 
-    // Calculate colors based on well year
-    function calculateColors(years, currentYear) {
-      const colors = [];
-      for (let i = 0; i < years.length; i++) {
-        const yearsSinceCompletion = currentYear - years[i];
-        if (yearsSinceCompletion <= 10) {
-          const ratio = (10 - yearsSinceCompletion) / 10;
-          const green = Math.round(255 * ratio);
-          colors.push(`rgb(0, ${green}, 0)`);
-        } else if (yearsSinceCompletion <= 15) {
-          const ratio = (yearsSinceCompletion - 10) / 5;
-          const grey = Math.round(200 * ratio);
-          colors.push(`rgb(${grey}, ${grey}, ${grey})`);
+    // Marker colour by years since completion: bright green when new, fading
+    // to black at 10 years, then to light grey at 15 and older. Markers carry
+    // their completion year and the slider only moves cmin/cmax.
+    const WELL_AGE_COLORSCALE = [
+      [0, 'rgb(200, 200, 200)'],
+      [1 / 3, 'rgb(0, 0, 0)'],
+      [1, 'rgb(0, 255, 0)']
+    ];
+
+    function wellAgeColorRange(year) {
+      return { cmin: year - 15, cmax: year };
+    }
+
+    // Fetch packed lateral polylines for all wells (see /map-laterals/): NaN
+    // separated lat/lon vertices in completion-year order, with the vertex
+    // count up to each year in meta.ends.
+    async function fetchMapLaterals() {
+      const res = await fetch('/map-laterals/');
+      if (!res.ok) {
+        throw new Error(`HTTP ${res.status}: ${res.statusText}`);
+      }
+      const columns = decodeColumnarPayload(await res.arrayBuffer());
+      return { lat: columns.lat, lon: columns.lon, years: columns.meta.years, ends: columns.meta.ends };
+    }
+
+    function lateralsUpToYear(laterals, year) {
+      let lo = 0;
+      let hi = laterals.years.length;
+      while (lo < hi) {
+        const mid = (lo + hi) >> 1;
+        if (laterals.years[mid] <= year) {
+          lo = mid + 1;
         } else {
-          colors.push('rgb(200, 200, 200)');
+          hi = mid;
         }
       }
-      return colors;
+      const count = lo > 0 ? laterals.ends[lo - 1] : 0;
+      return {
+        lineLats: laterals.lat.subarray(0, count),
+        lineLons: laterals.lon.subarray(0, count)
+      };
     }
 
     // Create line data for well trajectories
@@ -4068,6 +4187,14 @@ window.syncRoyaltyPanelHeight = () => {
         if (!userWellData) {
           userWellData = await fetchUserWells();
         }
+        if (mapLaterals === undefined) {
+          try {
+            mapLaterals = await fetchMapLaterals();
+          } catch (error) {
+            console.error('Map laterals fetch error:', error);
+            mapLaterals = null;
+          }
+        }
 
         // Filter both datasets by year on frontend
         const generalData = filterDataByYear(allWellData, year);
@@ -4079,12 +4206,13 @@ window.syncRoyaltyPanelHeight = () => {
         // Table displays all user wells; no need to update here
         
         // Analyze nearby wells and create charts - use unfiltered user wells for centroid
-        const nearbyAnalysis20 = analyzeNearbyWells(generalData, userWellData, year, 20);
-        const nearbyAnalysis10 = analyzeNearbyWells(generalData, userWellData, year, 10);
+        const nearbyAnalysis = await analyzeNearbyWells(userWellData, year, [10, 20]);
+        const nearbyAnalysis20 = nearbyAnalysis[20];
+        const nearbyAnalysis10 = nearbyAnalysis[10];
 
         latestStatsExtras = {
-          nearby10: (nearbyAnalysis10.nearbyWells || []).length,
-          nearby20: (nearbyAnalysis20.nearbyWells || []).length
+          nearby10: nearbyAnalysis10.total,
+          nearby20: nearbyAnalysis20.total
         };
 
         if (window.Stats) {
@@ -4098,11 +4226,10 @@ window.syncRoyaltyPanelHeight = () => {
 
         updateStatus(`✓ Showing ${generalData.lat.length} total wells (${userData.lat.length} yours) for year ${year}`, false, true);
 
-        // Calculate colors for general wells
-        const generalColors = calculateColors(generalData.years, year);
-        
+        const generalColorRange = wellAgeColorRange(year);
+
         // Create line data for well trajectories
-        const generalLines = createLineData(generalData);
+        const generalLines = mapLaterals ? lateralsUpToYear(mapLaterals, year) : createLineData(generalData);
         const userLines = createLineData(userData);
 
         // First time: create the map
@@ -4171,7 +4298,9 @@ window.syncRoyaltyPanelHeight = () => {
             mode: 'markers', 
             marker: {
               size: 6,
-              color: generalColors,
+              color: generalData.years,
+              colorscale: WELL_AGE_COLORSCALE,
+              ...generalColorRange,
               line: { color: 'black', width: 1 }
             },
             name: 'All Wells',
@@ -4232,6 +4361,7 @@ window.syncRoyaltyPanelHeight = () => {
           };
 
           await Plotly.react('map', traces, layout, {scrollZoom: false, responsive: true});
+          mapDrawnYear = year;
 
           const handleResize = () => {
             const nextHeight = syncMapHeight();
@@ -4319,9 +4449,47 @@ window.syncRoyaltyPanelHeight = () => {
             }
           }
         } else {
+          const mapDiv = document.getElementById('map');
+          const generalIndex = mapDiv.data.findIndex((trace) => trace.name === 'All Wells');
+          const generalLinesIndex = mapDiv.data.findIndex((trace) => trace.name === 'Well Trajectories');
+
+          // Moving forward on the year-sorted payload: append only the wells
+          // completed since the drawn year instead of resending every point.
+          const appendGeneral = Boolean(allWellData.year_index)
+            && mapDrawnYear !== null && year > mapDrawnYear
+            && generalIndex >= 0 && generalLinesIndex >= 0;
+          if (appendGeneral) {
+            const added = yearSlice(allWellData, mapDrawnYear, year);
+            if (added.lat.length > 0) {
+              await Plotly.extendTraces('map', {
+                lat: [added.lat],
+                lon: [added.lon],
+                text: [added.text],
+                'marker.color': [added.years]
+              }, [generalIndex]);
+            }
+            const drawnVertices = mapLaterals ? lateralsUpToYear(mapLaterals, mapDrawnYear).lineLats.length : 0;
+            const addedLines = mapLaterals
+              ? {
+                lineLats: generalLines.lineLats.subarray(drawnVertices),
+                lineLons: generalLines.lineLons.subarray(drawnVertices)
+              }
+              : createLineData(added);
+            if (addedLines.lineLats.length > 0) {
+              await Plotly.extendTraces('map', {
+                lat: [addedLines.lineLats],
+                lon: [addedLines.lineLons]
+              }, [generalLinesIndex]);
+            }
+            await Plotly.restyle('map', {
+              'marker.cmin': generalColorRange.cmin,
+              'marker.cmax': generalColorRange.cmax
+            }, [generalIndex]);
+          }
+
           // Update only specific traces, not all traces (to avoid affecting the circles)
           // Get the number of traces that existed before we added the circles
-          const originalTraceCount = document.getElementById('map').data.length - 2; // Subtract both circles
+          const originalTraceCount = mapDiv.data.length - 2; // Subtract both circles
           
           const updateData = {
             lat: [
@@ -4356,18 +4524,31 @@ window.syncRoyaltyPanelHeight = () => {
               null,
               null,
               nearbyAnalysis20.centroid ? ['orange'] : [],
-              generalColors,
+              generalData.years,
               userData.lat.length > 0 ? new Array(userData.lat.length).fill('red') : []
-            ]
+            ],
+            'marker.cmin': [null, null, null, generalColorRange.cmin, null],
+            'marker.cmax': [null, null, null, generalColorRange.cmax, null]
           };
           
           // Update only the original traces (0 through originalTraceCount-1), skip the circle
-          const traceIndices = [];
+          let traceIndices = [];
           for (let i = 0; i < originalTraceCount; i++) {
             traceIndices.push(i);
           }
-          
-          await Plotly.restyle('map', updateData, traceIndices);
+
+          // Appended traces are already current; leave them out of the restyle.
+          if (appendGeneral) {
+            traceIndices = traceIndices.filter((i) => i !== generalIndex && i !== generalLinesIndex);
+            Object.keys(updateData).forEach((key) => {
+              updateData[key] = traceIndices.map((i) => updateData[key][i]);
+            });
+          }
+
+          if (traceIndices.length > 0) {
+            await Plotly.restyle('map', updateData, traceIndices);
+          }
+          mapDrawnYear = year;
           
           // Update title separately
           await Plotly.relayout('map', {
@@ -2,19 +2,29 @@
   function fmt(n) {
     return (typeof n === 'number' && isFinite(n)) ? n.toLocaleString() : '—';
   }
+  // Plain arrays (JSON payloads) or typed arrays (binary /map-data/ columns).
+  function isList(x) {
+    return Array.isArray(x) || ArrayBuffer.isView(x);
+  }
   function maxDate(arr) {
-    if (!Array.isArray(arr) || !arr.length) return null;
-    const dates = arr
-      .map(v => (v ? new Date(v) : null))
+    if (!isList(arr) || !arr.length) return null;
+    const dates = Array.from(arr, v => (v ? new Date(v) : null))
       .filter(d => d && !isNaN(d));
     if (!dates.length) return null;
     return new Date(Math.max.apply(null, dates));
   }
   function yearRange(years) {
-    if (!Array.isArray(years) || !years.length) return '—';
-    const ys = years.filter(y => typeof y === 'number' && isFinite(y));
-    if (!ys.length) return '—';
-    return `${Math.min(...ys)}–${Math.max(...ys)}`;
+    if (!isList(years) || !years.length) return '—';
+    let min = Infinity;
+    let max = -Infinity;
+    for (let i = 0; i < years.length; i++) {
+      const y = years[i];
+      if (typeof y !== 'number' || !isFinite(y)) continue;
+      if (y < min) min = y;
+      if (y > max) max = y;
+    }
+    if (min > max) return '—';
+    return `${min}–${max}`;
   }
   function setText(id, val) {
     const el = document.getElementById(id);
@@ -26,8 +36,8 @@
     const g = generalData || {};
     const u = userData || {};
 
-    const total = Array.isArray(g.lat) ? g.lat.length : 0;
-    const userTotal = Array.isArray(u.lat) ? u.lat.length : 0;
+    const total = isList(g.lat) ? g.lat.length : 0;
+    const userTotal = isList(u.lat) ? u.lat.length : 0;
 
     // Prefer user last_producing if present, else fall back to general.
     const lastProd = maxDate(u.last_producing || g.last_producing);
@@ -1,3 +1,672 @@
-from django.test import TestCase
+import json
+import os
+import struct
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+import pandas as pd
+from django.test import RequestFactory, SimpleTestCase
+
+from . import columnar, local_backend, snapshots, snowflake_helpers, spatial, views
+
+
+class LocalSnowflakeTestCase(SimpleTestCase):
+    """Runs against a fresh SQLite stand-in database (see ``local_backend``)."""
+
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        env = mock.patch.dict(
+            os.environ,
+            {
+                local_backend.BACKEND_ENV: "sqlite",
+                local_backend.DATABASE_ENV: os.path.join(directory.name, "seg.sqlite3"),
+                "SEG_SNAPSHOTS_ENABLED": "0",
+            },
+        )
+        env.start()
+        self.addCleanup(env.stop)
+        pool = mock.patch.object(snowflake_helpers, "_pool", None)
+        pool.start()
+        self.addCleanup(pool.stop)
+        self.addCleanup(lambda: snowflake_helpers._pool and snowflake_helpers._pool.close_all())
+
+    def insert_rows(self, table, rows):
+        columns = list(rows[0])
+        sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['?'] * len(columns))})"
+        conn = local_backend.connect()
+        try:
+            conn.raw.executemany(sql, [[row.get(column) for column in columns] for row in rows])
+        finally:
+            conn.close()
+
+
+def _well(api, owners, nris, **extra):
+    return {
+        "API_UWI": api,
+        "WELLNAME": f"WELL {api}",
+        "ENVOPERATOR": "Operator 1",
+        "TRAJECTORY": "HORIZONTAL",
+        "LATITUDE": 31.5,
+        "LONGITUDE": -102.25,
+        "COMPLETIONDATE": "2020-06-01",
+        "OWNER_LIST": owners,
+        "NRI_LIST": nris,
+        **extra,
+    }
+
+
+OWNER_INDEX_WELLS = [
+    _well("42-001-00001", "Alpha|Beta", "0.25|0.5"),
+    # Same lists as the first well: split once, fanned out to both.
+    _well("42-001-00002", "Alpha|Beta", "0.25|0.5"),
+    # Owner listed twice (different case); both NRI entries are summed.
+    _well("42-001-00003", "Beta| beta ", "0.1|0.2"),
+    # Unparseable NRI counts as zero; missing trailing NRI entries as well.
+    _well("42-001-00004", "Alpha|Gamma|Delta", "n/a|0.3"),
+    _well("42-001-00005", None, None),
+    _well("42-001-00006", "Gamma", None),
+]
+
+
+def _reference_owner_index(frame):
+    """Per-well loop over the raw lists, the shape ``_build_owner_index`` returns."""
+    entries = defaultdict(dict)
+    for position, (owners, nris) in enumerate(
+        zip(frame["OWNER_LIST"].astype(object), frame["NRI_LIST"].astype(object))
+    ):
+        if not isinstance(owners, str):
+            continue
+        shares = nris.split("|") if isinstance(nris, str) else []
+        for slot, owner in enumerate(owners.split("|")):
+            name = owner.strip().lower()
+            if not name:
+                continue
+            try:
+                share = float(shares[slot])
+            except (IndexError, ValueError):
+                share = 0.0
+            entries[name][position] = entries[name].get(position, 0.0) + share
+    return {name: sorted(wells.items()) for name, wells in entries.items()}
+
+
+class OwnerIndexTests(LocalSnowflakeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.insert_rows("RAW_WELL_DATA_WITH_OWNERS", OWNER_INDEX_WELLS)
+        cache = mock.patch.dict(views._owner_index_cache, {"frame": None, "index": None})
+        cache.start()
+        self.addCleanup(cache.stop)
+        self.wells = views._fetch_wells_with_owners()
+
+    def index_as_lists(self, index):
+        return {
+            name: list(
+                zip(
+                    index["positions"][start:end].tolist(),
+                    index["interests"][start:end].tolist(),
+                )
+            )
+            for name, (start, end) in index["owners"].items()
+        }
+
+    def test_matches_per_well_reference(self):
+        index = views._build_owner_index(self.wells)
+        expected = _reference_owner_index(self.wells)
+        actual = self.index_as_lists(index)
+        self.assertEqual(sorted(actual), sorted(expected))
+        for name, wells in expected.items():
+            self.assertEqual([p for p, _ in actual[name]], [p for p, _ in wells])
+            np.testing.assert_allclose([i for _, i in actual[name]], [i for _, i in wells])
+
+    def test_duplicate_owner_entries_are_summed(self):
+        index = self.index_as_lists(views._build_owner_index(self.wells))
+        self.assertEqual([p for p, _ in index["beta"]], [0, 1, 2])
+        self.assertAlmostEqual(index["beta"][2][1], 0.3)
+        self.assertEqual(index["alpha"], [(0, 0.25), (1, 0.25), (3, 0.0)])
+        self.assertEqual(index["delta"], [(3, 0.0)])
+        self.assertEqual(index["gamma"], [(3, 0.3), (5, 0.0)])
+
+    def test_categorical_and_plain_lists_agree(self):
+        plain = self.wells.copy()
+        categorical = self.wells.copy()
+        for column in ("OWNER_LIST", "NRI_LIST"):
+            plain[column] = plain[column].astype(object)
+            categorical[column] = categorical[column].astype("category")
+        self.assertEqual(
+            self.index_as_lists(views._build_owner_index(plain)),
+            self.index_as_lists(views._build_owner_index(categorical)),
+        )
+
+    def test_owner_wells_lookup_is_case_insensitive(self):
+        rows, interests = views._owner_wells(self.wells, "BETA")
+        self.assertEqual(rows["API_UWI"].tolist(), ["42-001-00001", "42-001-00002", "42-001-00003"])
+        np.testing.assert_allclose(interests, [0.5, 0.5, 0.3])
+        rows, interests = views._owner_wells(self.wells, "Nobody")
+        self.assertTrue(rows.empty)
+        self.assertEqual(len(interests), 0)
+
+    def test_empty_and_missing_owner_columns(self):
+        for frame in (None, self.wells.iloc[0:0], self.wells.drop(columns=["OWNER_LIST"])):
+            index = views._build_owner_index(frame)
+            self.assertEqual(index["owners"], {})
+            self.assertEqual(len(index["positions"]), 0)
+
+    def test_index_is_rebuilt_only_for_a_new_frame(self):
+        with mock.patch.object(views, "_build_owner_index", wraps=views._build_owner_index) as build:
+            first = views._owner_index(self.wells)
+            self.assertIs(views._owner_index(self.wells), first)
+            self.assertEqual(build.call_count, 1)
+            refreshed = self.wells.copy()
+            self.assertIsNot(views._owner_index(refreshed), first)
+            self.assertEqual(build.call_count, 2)
+
+
+class FakeConnection:
+    def __init__(self, valid=True):
+        self.valid = valid
+        self.closed = False
+
+    def is_valid(self):
+        return self.valid
+
+    def is_closed(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+
+class ConnectionPoolTests(SimpleTestCase):
+    def make_pool(self, **kwargs):
+        self.opened = []
+
+        def factory():
+            conn = FakeConnection()
+            self.opened.append(conn)
+            return conn
+
+        kwargs.setdefault("acquire_timeout", 1.0)
+        return snowflake_helpers.ConnectionPool(factory, **kwargs)
+
+    def test_released_connection_is_reused(self):
+        pool = self.make_pool(max_size=2)
+        first = pool.acquire()
+        pool.release(first)
+        self.assertIs(pool.acquire(), first)
+        self.assertEqual(len(self.opened), 1)
+        self.assertEqual(pool.stats(), {"max_size": 2, "idle": 0, "in_use": 1})
+
+    def test_idle_connections_are_handed_out_lifo(self):
+        pool = self.make_pool(max_size=2)
+        older, newer = pool.acquire(), pool.acquire()
+        pool.release(older)
+        pool.release(newer)
+        self.assertIs(pool.acquire(), newer)
+
+    def test_acquire_times_out_when_exhausted(self):
+        pool = self.make_pool(max_size=1, acquire_timeout=0.05)
+        pool.acquire()
+        with self.assertRaises(snowflake_helpers.ConnectionPoolTimeout):
+            pool.acquire()
+
+    def test_waiting_acquire_gets_released_connection(self):
+        pool = self.make_pool(max_size=1)
+        conn = pool.acquire()
+        timer = threading.Timer(0.05, pool.release, args=(conn,))
+        timer.start()
+        self.addCleanup(timer.cancel)
+        self.assertIs(pool.acquire(), conn)
+        self.assertEqual(len(self.opened), 1)
+
+    def test_unhealthy_connection_is_replaced(self):
+        pool = self.make_pool(max_size=1, health_check_seconds=0)
+        conn = pool.acquire()
+        pool.release(conn)
+        conn.valid = False
+        replacement = pool.acquire()
+        self.assertIsNot(replacement, conn)
+        self.assertTrue(conn.closed)
+
+    def test_idle_connections_expire(self):
+        pool = self.make_pool(max_size=1, max_idle_seconds=0.01)
+        conn = pool.acquire()
+        pool.release(conn)
+        time.sleep(0.03)
+        self.assertIsNot(pool.acquire(), conn)
+        self.assertTrue(conn.closed)
+
+    def test_discarded_and_closed_connections_free_their_slot(self):
+        pool = self.make_pool(max_size=1, acquire_timeout=0.05)
+        conn = pool.acquire()
+        pool.release(conn, discard=True)
+        self.assertTrue(conn.closed)
+        conn = pool.acquire()
+        conn.close()
+        pool.release(conn)
+        self.assertEqual(pool.stats()["idle"], 0)
+        self.assertEqual(len(self.opened), 2)
+        pool.acquire()
+
+    def test_failed_connect_frees_its_slot(self):
+        pool = self.make_pool(max_size=1, acquire_timeout=0.05)
+        with mock.patch.object(pool, "_factory", side_effect=RuntimeError("login failed")):
+            with self.assertRaises(RuntimeError):
+                pool.acquire()
+        self.assertIsInstance(pool.acquire(), FakeConnection)
+
+
+class PooledConnectionTests(LocalSnowflakeTestCase):
+    def test_close_returns_session_to_pool(self):
+        with snowflake_helpers.get_connection() as conn:
+            raw = conn.raw
+            self.assertEqual(snowflake_helpers.fetch_one("SELECT 1 AS ONE")["ONE"], 1)
+        self.assertFalse(raw.is_closed())
+        with snowflake_helpers.get_connection() as conn:
+            self.assertIs(conn.raw, raw)
+
+    def test_connection_errors_discard_the_session(self):
+        with self.assertRaises(snowflake_helpers.snowflake_errors.OperationalError):
+            with snowflake_helpers.get_connection() as conn:
+                raw = conn.raw
+                raise snowflake_helpers.snowflake_errors.OperationalError(msg="session expired")
+        self.assertTrue(raw.is_closed())
+        self.assertEqual(snowflake_helpers.get_pool().stats()["in_use"], 0)
+
+
+def _unpack(payload):
+    """Split a ``columnar.pack`` buffer into its header and column arrays."""
+    (length,) = struct.unpack_from("<I", payload, len(columnar.MAGIC))
+    start = len(columnar.MAGIC) + 4
+    header = json.loads(payload[start : start + length])
+    body = payload[start + length :]
+    dtypes = {"float32": "<f4", "int16": "<i2"}
+    columns = {}
+    for spec in header["columns"]:
+        raw = body[spec["offset"] : spec["offset"] + spec["length"]]
+        if spec["type"] == "utf8":
+            columns[spec["name"]] = raw.decode("utf-8").split("\n")
+        elif spec["type"] == "dict":
+            codes = np.frombuffer(raw, dtype="<u2" if spec["index_type"] == "uint16" else "<u4")
+            columns[spec["name"]] = codes
+        else:
+            columns[spec["name"]] = np.frombuffer(raw, dtype=dtypes[spec["type"]])
+    return header, start + length, columns
+
+
+class ColumnarPackTests(SimpleTestCase):
+    def setUp(self):
+        self.payload = columnar.pack(
+            [
+                ("lat", "float32", [31.5, None, "32.25"]),
+                ("year", "int16", [2020, None, 1999]),
+                ("operator", "dict", ["Op A", None, "Op A"]),
+                ("name", "utf8", ["Well 1", None, "Well 3"]),
+            ],
+            meta={"source": "test"},
+        )
+        self.header, self.body_start, self.columns = _unpack(self.payload)
+
+    def test_header(self):
+        self.assertEqual(self.payload[:4], columnar.MAGIC)
+        self.assertEqual(self.header["version"], columnar.FORMAT_VERSION)
+        self.assertEqual(self.header["count"], 3)
+        self.assertEqual(self.header["meta"], {"source": "test"})
+        self.assertEqual([c["name"] for c in self.header["columns"]], ["lat", "year", "operator", "name"])
+
+    def test_buffers_are_aligned(self):
+        self.assertEqual(self.body_start % 8, 0)
+        for spec in self.header["columns"]:
+            self.assertEqual(spec["offset"] % 8, 0, spec["name"])
+
+    def test_float32_nulls_are_nan(self):
+        lat = self.columns["lat"]
+        self.assertEqual(lat[0], np.float32(31.5))
+        self.assertTrue(np.isnan(lat[1]))
+        self.assertEqual(lat[2], np.float32(32.25))
+
+    def test_int16_nulls_use_sentinel(self):
+        spec = self.header["columns"][1]
+        self.assertEqual(spec["null_value"], columnar.INT16_NULL)
+        self.assertEqual(self.columns["year"].tolist(), [2020, columnar.INT16_NULL, 1999])
+
+    def test_dictionary_reserves_code_zero_for_null(self):
+        spec = self.header["columns"][2]
+        self.assertEqual(spec["index_type"], "uint16")
+        self.assertEqual(spec["dictionary"], [None, "Op A"])
+        self.assertEqual(self.columns["operator"].tolist(), [1, 0, 1])
+
+    def test_utf8_is_newline_joined(self):
+        self.assertEqual(self.columns["name"], ["Well 1", "", "Well 3"])
+
+    def test_large_dictionary_uses_uint32_codes(self):
+        values = [f"owner {i}" for i in range(0x10000)]
+        header, _, columns = _unpack(columnar.pack([("owner", "dict", values)]))
+        self.assertEqual(header["columns"][0]["index_type"], "uint32")
+        self.assertEqual(header["columns"][0]["dictionary"][int(columns["owner"][-1])], "owner 65535")
+
+    def test_empty_and_mismatched_columns(self):
+        header, _, _ = _unpack(columnar.pack([]))
+        self.assertEqual(header["count"], 0)
+        with self.assertRaises(ValueError):
+            columnar.pack([("a", "float32", [1.0, 2.0]), ("b", "int16", [1])])
+
+
+class WithinRadiusTests(SimpleTestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.lat = rng.uniform(25.0, 75.0, 5000)
+        self.lon = rng.uniform(-110.0, -90.0, 5000)
+        self.lat[::97] = np.nan
+        self.index = spatial.GridIndex(self.lat, self.lon)
+
+    def brute_force(self, lat, lon, miles):
+        with np.errstate(invalid="ignore"):
+            distances = spatial.haversine_miles(lat, lon, self.lat, self.lon)
+            return np.flatnonzero(distances <= miles)
+
+    def test_matches_brute_force(self):
+        # Mid-latitude, high-latitude (wide longitude span) and the data's edges.
+        centers = [(31.5, -102.0), (74.0, -100.0), (25.0, -110.0), (50.0, -90.0)]
+        for lat, lon in centers:
+            for miles in (1, 10, 60, 250):
+                with self.subTest(lat=lat, lon=lon, miles=miles):
+                    indices, distances = self.index.within_radius(lat, lon, miles)
+                    self.assertEqual(indices.tolist(), self.brute_force(lat, lon, miles).tolist())
+                    self.assertTrue(np.all(distances <= miles))
+                    np.testing.assert_allclose(
+                        distances, spatial.haversine_miles(lat, lon, self.lat[indices], self.lon[indices])
+                    )
+
+    def test_missing_coordinates_are_skipped(self):
+        indices, _ = self.index.within_radius(50.0, -100.0, 5000)
+        self.assertEqual(len(indices), int(np.isfinite(self.lat).sum()))
+
+    def test_empty_index(self):
+        indices, distances = spatial.GridIndex([], []).within_radius(31.5, -102.0, 10)
+        self.assertEqual(len(indices), 0)
+        self.assertEqual(len(distances), 0)
+
+    def test_one_degree_of_latitude(self):
+        index = spatial.GridIndex([31.0, 32.0], [-102.0, -102.0])
+        indices, distances = index.within_radius(31.0, -102.0, 70)
+        self.assertEqual(indices.tolist(), [0, 1])
+        self.assertAlmostEqual(distances[1], spatial.MILES_PER_DEGREE_LAT, places=6)
+        self.assertEqual(index.within_radius(31.0, -102.0, 69)[0].tolist(), [0])
+
+
+class MapIncrementalRefreshTests(LocalSnowflakeTestCase):
+    def setUp(self):
+        super().setUp()
+        cache = mock.patch.dict(
+            views._map_data_cache,
+            {"payload": None, "timestamp": 0.0, "failures": 0, "retry_at": 0.0, "full_refresh_at": 0.0},
+        )
+        cache.start()
+        self.addCleanup(cache.stop)
+        self.insert_rows(
+            "RAW_WELL_DATA_WITH_OWNERS",
+            [
+                _well("42-001-00001", None, None, COMPLETIONDATE="2019-03-01", LASTPRODUCINGMONTH="2026-09-01"),
+                _well("42-001-00002", None, None, COMPLETIONDATE="2021-05-01", LASTPRODUCINGMONTH="2026-10-01"),
+            ],
+        )
+        views._store_map_payload(views._map_refresh_frame())
+
+    def refresh(self):
+        with mock.patch.object(views, "_fetch_map_frame", wraps=views._fetch_map_frame) as fetch:
+            payload = views._map_payload_lists(views._map_refresh_frame())
+        fetch.assert_called_once_with(changed_since="2026-10-01")
+        return payload
+
+    def test_wells_at_the_high_water_month_are_picked_up(self):
+        self.insert_rows(
+            "RAW_WELL_DATA_WITH_OWNERS",
+            [_well("42-001-00003", None, None, COMPLETIONDATE="2020-01-01", LASTPRODUCINGMONTH="2026-10-01")],
+        )
+        payload = self.refresh()
+        self.assertEqual(payload["api_uwi"], ["42-001-00001", "42-001-00003", "42-001-00002"])
+        self.assertEqual(payload["year"], [2019, 2020, 2021])
+
+    def test_new_wells_without_production_are_picked_up(self):
+        self.insert_rows(
+            "RAW_WELL_DATA_WITH_OWNERS",
+            [_well("42-001-00004", None, None, COMPLETIONDATE="2026-08-01", LASTPRODUCINGMONTH=None)],
+        )
+        payload = self.refresh()
+        self.assertEqual(payload["api_uwi"], ["42-001-00001", "42-001-00002", "42-001-00004"])
+        self.assertIsNone(payload["last_producing"][2])
+
+
+class MapSnapshotTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        env = mock.patch.dict(
+            os.environ, {"SEG_SNAPSHOTS_ENABLED": "1", "SEG_SNAPSHOT_DIR": directory.name}
+        )
+        env.start()
+        self.addCleanup(env.stop)
+        self.frame = pd.DataFrame(
+            {
+                "lat": [31.5, 32.0],
+                "lon": [-102.0, -101.5],
+                "text": ["Completion: 2020-06-01", "Well"],
+                "year": [2020.0, np.nan],
+                "api_uwi": ["42-001-00001", "42-001-00002"],
+                "lat_bh": [31.6, np.nan],
+                "lon_bh": [-102.1, np.nan],
+                "last_producing": ["2026-10-01", None],
+            }
+        )
+
+    def test_refresh_returns_the_mapped_snapshot(self):
+        payload = snapshots.refresh_shared("map_test", lambda: self.frame, arrow_strings=True)
+        self.assertIsNot(payload, self.frame)
+        self.assertIsInstance(payload["api_uwi"].dtype, pd.ArrowDtype)
+        self.assertFalse(payload["lat"].to_numpy().flags.writeable)
+        self.assertEqual(views._map_payload_lists(payload), views._map_payload_lists(self.frame))
+        self.assertEqual(views._map_high_water_mark(payload), "2026-10-01")
+        self.assertEqual(views._map_dated_count(payload), 1)
+
+    def test_strings_are_plain_without_arrow_strings(self):
+        snapshots.save_frame("map_test", self.frame)
+        frame, _ = snapshots.load_frame("map_test")
+        self.assertNotIsInstance(frame["api_uwi"].dtype, pd.ArrowDtype)
+
+
+class SaveDcaInputsBatchTests(LocalSnowflakeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.insert_rows(
+            "ECON_INPUT_1PASS",
+            [
+                {"API_UWI": "42-001-00001", "OIL_CALC_QI": 100.0, "APPROVED": "Y"},
+                {"API_UWI": "42-001-00002", "OIL_CALC_QI": 200.0, "APPROVED": "Y"},
+                {"API_UWI": "42-001-00003", "OIL_CALC_QI": 300.0, "APPROVED": "Y"},
+            ],
+        )
+        self.statements = []
+        execute = local_backend.LocalCursor.execute
+
+        def recording_execute(cursor, command, params=None, *args, **kwargs):
+            self.statements.append(" ".join(command.split()))
+            return execute(cursor, command, params, *args, **kwargs)
+
+        patcher = mock.patch.object(local_backend.LocalCursor, "execute", recording_execute)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def post(self, wells):
+        request = RequestFactory().post(
+            "/well-dca-inputs/save-batch/", json.dumps({"wells": wells}), content_type="application/json"
+        )
+        request.session = {"user": {"email": "user@example.com"}}
+        return views.save_well_dca_inputs_batch(request)
+
+    def rows(self):
+        conn = local_backend.connect()
+        try:
+            return conn.raw.execute(
+                "SELECT API_UWI, OIL_CALC_QI, APPROVED FROM ECON_INPUT_1PASS ORDER BY rowid"
+            ).fetchall()
+        finally:
+            conn.close()
+
+    def assert_no_open_transaction(self):
+        pool = snowflake_helpers.get_pool()
+        self.assertEqual(pool.stats()["in_use"], 0)
+        with snowflake_helpers.get_connection() as conn:
+            self.assertFalse(conn.raw.raw.in_transaction)
+
+    def test_approvals_are_reset_with_one_statement(self):
+        response = self.post(
+            [
+                {"api": "42-001-00001", "params": {"OIL_CALC_QI": 110, "APPROVED": "Y"}},
+                {"api": "42-001-00002", "params": {"OIL_CALC_QI": 210, "APPROVED": "Y"}},
+                {"api": "42-001-00004", "params": {"OIL_CALC_QI": 410}},
+            ]
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)["approved"], 2)
+        updates = [sql for sql in self.statements if sql.startswith("UPDATE")]
+        inserts = [sql for sql in self.statements if sql.startswith("INSERT")]
+        self.assertEqual((len(updates), len(inserts)), (1, 1))
+        self.assertEqual(
+            self.rows(),
+            [
+                ("42-001-00001", 100.0, None),
+                ("42-001-00002", 200.0, None),
+                ("42-001-00003", 300.0, "Y"),
+                ("42-001-00001", 110.0, "Y"),
+                ("42-001-00002", 210.0, "Y"),
+                ("42-001-00004", 410.0, None),
+            ],
+        )
+
+    def test_last_entry_for_an_api_wins(self):
+        response = self.post(
+            [
+                {"api": "42-001-00001", "params": {"OIL_CALC_QI": 110, "APPROVED": "Y"}},
+                {"api": " 42-001-00001 ", "params": {"OIL_CALC_QI": 120}},
+            ]
+        )
+        self.assertEqual(json.loads(response.content), {"saved": 1, "approved": 0, "apis": ["42-001-00001"]})
+        self.assertFalse(any(sql.startswith("UPDATE") for sql in self.statements))
+        self.assertEqual(self.rows()[0], ("42-001-00001", 100.0, "Y"))
+        self.assertEqual(self.rows()[3:], [("42-001-00001", 120.0, None)])
+
+    def test_batch_size_limit(self):
+        with mock.patch.object(views, "DCA_BATCH_MAX_WELLS", 2):
+            response = self.post([{"api": f"42-001-0000{i}"} for i in range(3)])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.statements, [])
+
+    def test_invalid_wells_are_rejected(self):
+        for wells in ([], [{"params": {}}], [{"api": "42-001-00001", "params": [1]}], [{"api": "x", "params": "x"}]):
+            with self.subTest(wells=wells):
+                self.assertEqual(self.post(wells).status_code, 400)
+        self.assertEqual(self.statements, [])
+
+    def test_failed_insert_rolls_back_the_approval_reset(self):
+        execute = local_backend.LocalCursor.execute
+
+        def failing_insert(cursor, command, params=None, *args, **kwargs):
+            if command.lstrip().startswith("INSERT"):
+                raise snowflake_helpers.snowflake_errors.ProgrammingError(msg="insert failed")
+            return execute(cursor, command, params, *args, **kwargs)
+
+        with mock.patch.object(local_backend.LocalCursor, "execute", failing_insert):
+            with self.assertLogs(views.logger, "ERROR"):
+                response = self.post([{"api": "42-001-00001", "params": {"APPROVED": "Y"}}])
+        self.assertEqual(response.status_code, 502)
+        self.assertEqual(self.rows()[0], ("42-001-00001", 100.0, "Y"))
+        self.assert_no_open_transaction()
+
+    def test_unexpected_errors_roll_back_too(self):
+        execute = local_backend.LocalCursor.execute
+
+        def failing_insert(cursor, command, params=None, *args, **kwargs):
+            if command.lstrip().startswith("INSERT"):
+                raise TypeError("unsupported parameter type")
+            return execute(cursor, command, params, *args, **kwargs)
+
+        with mock.patch.object(local_backend.LocalCursor, "execute", failing_insert):
+            with self.assertRaises(TypeError):
+                self.post([{"api": "42-001-00001", "params": {"APPROVED": "Y"}}])
+        self.assertEqual(self.rows()[0], ("42-001-00001", 100.0, "Y"))
+        self.assert_no_open_transaction()
+
+
+class SharedVersionCacheTests(LocalSnowflakeTestCase):
+    def setUp(self):
+        super().setUp()
+        env = mock.patch.dict(
+            os.environ, {"SEG_SNAPSHOTS_ENABLED": "1", "SEG_SNAPSHOT_DIR": os.path.join(self.directory, "snap")}
+        )
+        env.start()
+        self.addCleanup(env.stop)
+        versions = mock.patch.dict(snapshots._local_versions, clear=True)
+        versions.start()
+        self.addCleanup(versions.stop)
+
+    def bump_in_another_worker(self, name):
+        # Only the shared file changes; this process's own counter does not.
+        with mock.patch.dict(snapshots._local_versions):
+            snapshots.bump_version(name)
+
+    def test_version_stamp_sees_other_workers_bumps(self):
+        before = snapshots.version_stamp("test")
+        self.assertEqual(snapshots.version_stamp("test"), before)
+        self.bump_in_another_worker("test")
+        after = snapshots.version_stamp("test")
+        self.assertNotEqual(after, before)
+        snapshots.bump_version("test")
+        self.assertNotIn(snapshots.version_stamp("test"), (before, after))
+
+    def test_version_stamp_is_per_process_without_snapshots(self):
+        with mock.patch.dict(os.environ, {"SEG_SNAPSHOTS_ENABLED": "0"}):
+            before = snapshots.version_stamp("test")
+            snapshots.bump_version("test")
+            self.assertNotEqual(snapshots.version_stamp("test"), before)
+
+    def test_user_wells_rebuilt_after_another_workers_approval(self):
+        self.insert_rows("RAW_WELL_DATA_WITH_OWNERS", OWNER_INDEX_WELLS)
+        wells = views._fetch_wells_with_owners()
+        for patcher in (
+            mock.patch.object(views, "get_all_wells_with_owners", return_value=wells),
+            mock.patch.dict(views._user_wells_cache, clear=True),
+            mock.patch.dict(views._owner_index_cache, {"frame": None, "index": None}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        first = views._cached_user_wells_payload("Gamma")
+        self.assertIs(views._cached_user_wells_payload("Gamma"), first)
+        self.assertEqual(json.loads(first.variants["identity"])["dca_approved"], [False, False])
+
+        self.insert_rows("ECON_INPUT_1PASS", [{"API_UWI": "42-001-00006", "APPROVED": "Y"}])
+        self.bump_in_another_worker(views.DCA_APPROVALS_VERSION)
+        refreshed = views._cached_user_wells_payload("Gamma")
+        self.assertIsNot(refreshed, first)
+        self.assertEqual(json.loads(refreshed.variants["identity"])["dca_approved"], [False, True])
+
+    def test_econ_scenarios_reloaded_after_another_workers_save(self):
+        cache = mock.patch.dict(views._econ_scenario_cache, {"rows": None, "version": None, "timestamp": 0.0})
+        cache.start()
+        self.addCleanup(cache.stop)
+        self.insert_rows("ECON_SCENARIOS", [{"ECON_SCENARIO": "BASE"}])
+
+        first = views._cached_econ_scenarios()
+        self.assertIs(views._cached_econ_scenarios(), first)
+        self.assertEqual([row["ECON_SCENARIO"] for row in first], ["BASE"])
+
+        self.insert_rows("ECON_SCENARIOS", [{"ECON_SCENARIO": "HIGH"}])
+        self.bump_in_another_worker(views.ECON_SCENARIOS_VERSION)
+        self.assertEqual([row["ECON_SCENARIO"] for row in views._cached_econ_scenarios()], ["BASE", "HIGH"])
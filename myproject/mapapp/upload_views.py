@@ -17,7 +17,7 @@ from django.utils.text import get_valid_filename
 
 from snowflake.connector.errors import Error as SnowflakeError
 
-from . import snowflake_helpers
+from . import responses, snowflake_helpers
 
 
 S3_BUCKET_NAME = "seg-user-document-uploads"
@@ -363,32 +363,32 @@ class ListMyFiles(ApiLoginRequiredMixin, View):
 
     def get(self, request, *args, **kwargs):
         try:
-            rows = snowflake_helpers.fetch_all(
-                """
-                SELECT id, filename, note, bytes, content_type, created_at
-                FROM WELLS.MINERALS.USER_DOC_DIRECTORY
-                WHERE owner_user_id = %s
-                ORDER BY created_at DESC
-                """,
-                (request.user.id,),
+            rows = responses.prime(
+                snowflake_helpers.iter_rows(
+                    """
+                    SELECT id, filename, note, bytes, content_type, created_at
+                    FROM WELLS.MINERALS.USER_DOC_DIRECTORY
+                    WHERE owner_user_id = %s
+                    ORDER BY created_at DESC
+                    """,
+                    (request.user.id,),
+                )
             )
         except Exception as exc:  # noqa: BLE001
             return _snowflake_error_response(exc, "listing supporting documents")
 
-        documents = []
-        for row in rows:
-            documents.append(
-                {
-                    "id": _dict_get(row, "ID"),
-                    "filename": _dict_get(row, "FILENAME"),
-                    "note": _dict_get(row, "NOTE"),
-                    "bytes": _dict_get(row, "BYTES"),
-                    "content_type": _dict_get(row, "CONTENT_TYPE"),
-                    "created_at": _format_timestamp(_dict_get(row, "CREATED_AT")),
-                }
-            )
+        return responses.streaming_json_list("files", rows, _document_payload)
+
 
-        return JsonResponse({"files": documents})
+def _document_payload(row: Any) -> Dict[str, Any]:
+    return {
+        "id": _dict_get(row, "ID"),
+        "filename": _dict_get(row, "FILENAME"),
+        "note": _dict_get(row, "NOTE"),
+        "bytes": _dict_get(row, "BYTES"),
+        "content_type": _dict_get(row, "CONTENT_TYPE"),
+        "created_at": _format_timestamp(_dict_get(row, "CREATED_AT")),
+    }
 
 
 @method_decorator(csrf_exempt, name="dispatch")
@@ -12,6 +12,8 @@ from .upload_views import (
 urlpatterns = [
     path('', views.map_page, name='map_page'),
     path('map-data/', views.map_data, name='map_data'),
+    path('map-laterals/', views.map_laterals, name='map_laterals'),
+    path('nearby-wells/', views.nearby_wells, name='nearby_wells'),
     path('well-explorer/', views.well_explorer_page, name='well_explorer'),
     path('well-explorer/data/', views.well_explorer_data, name='well_explorer_data'),
     path('well-explorer/wellsets/', views.well_explorer_wellsets, name='well_explorer_wellsets'),
@@ -23,6 +25,7 @@ urlpatterns = [
     path('bulk-production/', views.bulk_well_production, name='bulk_well_production'),
     path('well-dca-inputs/', views.well_dca_inputs, name='well_dca_inputs'),
     path('well-dca-inputs/save/', views.save_well_dca_inputs, name='save_well_dca_inputs'),
+    path('well-dca-inputs/save-batch/', views.save_well_dca_inputs_batch, name='save_well_dca_inputs_batch'),
     path('well-dca-inputs/export/', views.export_well_dca_inputs, name='export_well_dca_inputs'),
     path('econ-scenarios/', views.econ_scenarios, name='econ_scenarios'),
     path('econ-scenarios/save/', views.save_econ_scenario, name='save_econ_scenario'),
@@ -30,6 +33,8 @@ urlpatterns = [
     path('econ-data/', views.economics_data, name='economics_data'),
     path('feedback/', views.user_feedback_entries, name='user_feedback_entries'),
     path('api/user-info/', views.user_info, name='user_info'),
+    path('api/query-stats/', views.query_stats, name='query_stats'),
+    path('api/wells-cache/refresh/', views.refresh_wells_cache, name='refresh_wells_cache'),
     path('impersonate/select-user/', views.admin_select_user, name='admin_select_user'),
     path('api/uploads/start', StartUpload.as_view(), name='start_upload'),
     path('api/uploads/finalize', FinalizeUpload.as_view(), name='finalize_upload'),
@@ -3,7 +3,6 @@ import logging
 import time
 from datetime import datetime, timezone
 from decimal import Decimal
-from functools import lru_cache
 from threading import Lock
 
 import numpy as np
@@ -14,7 +13,7 @@ from django.shortcuts import redirect, render
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 
-from . import snowflake_helpers
+from . import columnar, responses, snapshots, snowflake_helpers, spatial
 
 
 OWNER_PROFILE_FIELD_MAP = [
@@ -361,52 +360,49 @@ def get_admin_banner_context(request):
 
 
 def get_snowflake_connection():
-    return snowflake_helpers.connect()
+    return snowflake_helpers.get_connection()
 
 
-def get_executive_dashboard_context():
-    owner_rows = []
-    feedback_rows = []
-    document_rows = []
-    row = None
+def _concurrent_result(results, name, message):
+    """Return one named ``run_concurrently`` result, logging Snowflake failures."""
+    value = results.get(name)
+    if isinstance(value, snowflake_errors.Error):
+        logger.exception(message, exc_info=value)
+        return None
+    if isinstance(value, Exception):
+        raise value
+    return value
 
-    conn = get_snowflake_connection()
-    try:
-        cur = conn.cursor(DictCursor)
-        try:
-            cur.execute(EXECUTIVE_OWNER_ACCOUNTS_SQL)
-            owner_rows = cur.fetchall() or []
-        except snowflake_errors.Error:
-            logger.exception("Failed to load executive dashboard owner accounts.")
 
-        try:
-            cur.execute(EXECUTIVE_FEEDBACK_OVERVIEW_SQL)
-            feedback_rows = cur.fetchall() or []
-        except snowflake_errors.Error:
-            logger.exception("Failed to load executive dashboard feedback overview.")
+def get_executive_dashboard_context():
+    results = snowflake_helpers.run_concurrently(
+        [
+            ("owners", EXECUTIVE_OWNER_ACCOUNTS_SQL, None),
+            ("feedback", EXECUTIVE_FEEDBACK_OVERVIEW_SQL, None),
+            ("documents", EXECUTIVE_DOCUMENTS_SQL, None),
+            ("metrics", EXECUTIVE_DASHBOARD_SQL, None, "one"),
+        ]
+    )
 
-        try:
-            cur.execute(EXECUTIVE_DOCUMENTS_SQL)
-            document_rows = cur.fetchall() or []
-        except snowflake_errors.Error:
-            logger.exception("Failed to load executive dashboard documents with owner names.")
-            try:
-                cur.execute(EXECUTIVE_DOCUMENTS_SQL_FALLBACK)
-                document_rows = cur.fetchall() or []
-            except snowflake_errors.Error:
-                logger.exception("Failed to load executive dashboard documents.")
+    owner_rows = _concurrent_result(
+        results, "owners", "Failed to load executive dashboard owner accounts."
+    ) or []
+    feedback_rows = _concurrent_result(
+        results, "feedback", "Failed to load executive dashboard feedback overview."
+    ) or []
+    row = _concurrent_result(
+        results, "metrics", "Failed to load executive dashboard metrics."
+    )
 
+    document_rows = _concurrent_result(
+        results, "documents", "Failed to load executive dashboard documents with owner names."
+    )
+    if document_rows is None:
         try:
-            cur.execute(EXECUTIVE_DASHBOARD_SQL)
-            row = cur.fetchone()
+            document_rows = list(snowflake_helpers.fetch_all(EXECUTIVE_DOCUMENTS_SQL_FALLBACK))
         except snowflake_errors.Error:
-            logger.exception("Failed to load executive dashboard metrics.")
-    finally:
-        try:
-            cur.close()
-        except Exception:
-            pass
-        conn.close()
+            logger.exception("Failed to load executive dashboard documents.")
+            document_rows = []
 
     if not row:
         return {
@@ -494,6 +490,21 @@ def _format_timestamp_for_json(value):
     return str(value)
 
 
+def _frame_records(df):
+    """Return DataFrame rows as JSON-safe dicts (native scalars, NaN as None)."""
+    if df is None or df.empty:
+        return []
+    return df.astype(object).where(df.notna(), None).to_dict("records")
+
+
+def _json_number(value):
+    """Map NaN/NA numeric cells to ``None`` so JsonResponse emits ``null``."""
+    try:
+        return None if pd.isna(value) else value
+    except (TypeError, ValueError):
+        return value
+
+
 def _parse_iso_timestamp(value):
     if not value:
         return None
@@ -600,8 +611,40 @@ def _profile_row_to_dict(row, email):
     return profile
 
 _MAP_DATA_CACHE_TTL_SECONDS = 300
-_map_data_cache = {"payload": None, "timestamp": 0.0}
+# Past the TTL the cached payload is served while a background refresh runs;
+# past the max staleness a request refreshes synchronously instead.
+_MAP_DATA_MAX_STALE_SECONDS = 1800
+_MAP_DATA_ERROR_BACKOFF_SECONDS = 30
+_MAP_DATA_MAX_BACKOFF_SECONDS = 600
+# TTL refreshes only read wells whose LASTPRODUCINGMONTH is past the newest
+# month already cached; a full rescan (which also picks up deleted wells,
+# corrected coordinates and wells without new production) runs on this schedule.
+_MAP_DATA_FULL_REFRESH_SECONDS = 6 * 60 * 60
+_map_data_cache = {
+    "payload": None,
+    "timestamp": 0.0,
+    "failures": 0,
+    "retry_at": 0.0,
+    "full_refresh_at": 0.0,
+}
 _map_data_lock = Lock()
+_map_data_refresh_lock = Lock()
+# Serialized (and compressed) responses, rebuilt once per cache generation.
+_map_data_encoded = responses.EncodedCache()
+_map_viewport_encoded = responses.EncodedCache()
+_map_laterals_encoded = responses.EncodedCache()
+_price_deck_encoded = responses.EncodedCache()
+_econ_scenario_encoded = responses.EncodedCache()
+_map_index_cache = {"payload": None, "index": None}
+_map_index_lock = Lock()
+
+# Viewport requests get raw points when the box holds at most this many
+# wells (or the map is zoomed in past the cluster zoom); otherwise clusters.
+MAP_VIEWPORT_MAX_POINTS = 5000
+_MAP_CLUSTER_MAX_ZOOM = 11
+
+NEARBY_DEFAULT_RADII_MILES = (10, 20)
+NEARBY_MAX_RADIUS_MILES = 100
 
 _ADMIN_CACHE_TTL_SECONDS = 300
 _admin_emails_cache = {"emails": None, "timestamp": 0.0}
@@ -609,89 +652,253 @@ _admin_emails_lock = Lock()
 _admin_contact_cache = {}
 _admin_contact_lock = Lock()
 
+_owner_index_cache = {"frame": None, "index": None}
+_owner_index_lock = Lock()
+
 _OWNER_NAME_CACHE_TTL_SECONDS = 300
 _owner_name_cache = {}
 _owner_name_lock = Lock()
 
+# Encoded /user-wells-data/ responses per owner name, valid for one wells
+# frame and one host-wide DCA approvals stamp (see snapshots.version_stamp).
+# Saves that approve wells bump the stamp, so every worker rebuilds; the TTL
+# covers approvals changed outside this app.
+DCA_APPROVALS_VERSION = "dca_approvals"
+_USER_WELLS_CACHE_TTL_SECONDS = 300
+_USER_WELLS_CACHE_MAX_OWNERS = 64
+_user_wells_cache = {}
+_user_wells_lock = Lock()
+
+_PRICE_DECK_CACHE_TTL_SECONDS = 300
+_price_deck_cache = {"frame": None, "timestamp": 0.0}
+_price_deck_lock = Lock()
+
+# The /econ-scenarios/ listing, valid for one host-wide scenarios stamp;
+# saving a scenario bumps it so every worker reloads.
+ECON_SCENARIOS_VERSION = "econ_scenarios"
+_ECON_SCENARIO_CACHE_TTL_SECONDS = 300
+_econ_scenario_cache = {"rows": None, "version": None, "timestamp": 0.0}
+_econ_scenario_lock = Lock()
+
+MAP_PAYLOAD_SNAPSHOT = "map_payload"
+WELLS_SNAPSHOT = "wells_with_owners"
+PRICE_DECK_SNAPSHOT = "price_decks"
+
+
+MAP_PAYLOAD_SQL = """
+    SELECT
+        LATITUDE   AS LAT,
+        LONGITUDE  AS LON,
+        LATITUDE_BH AS LAT_BH,
+        LONGITUDE_BH AS LON_BH,
+        COMPLETIONDATE,
+        DATE_PART(year, COMPLETIONDATE) AS COMPLETION_YEAR,
+        API_UWI,
+        LASTPRODUCINGMONTH
+    FROM WELLS.MINERALS.RAW_WELL_DATA
+    WHERE LATITUDE IS NOT NULL
+      AND LONGITUDE IS NOT NULL
+"""
 
-def _fetch_map_payload():
-    conn = get_snowflake_connection()
 
-    # Rest of your function stays the same...
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT
-                LATITUDE   AS LAT,
-                LONGITUDE  AS LON,
-                LATITUDE_BH AS LAT_BH,
-                LONGITUDE_BH AS LON_BH,
-                COMPLETIONDATE,
-                DATE_PART(year, COMPLETIONDATE) AS COMPLETION_YEAR,
-                API_UWI,
-                LASTPRODUCINGMONTH
-            FROM WELLS.MINERALS.RAW_WELL_DATA
-            WHERE LATITUDE IS NOT NULL
-              AND LONGITUDE IS NOT NULL
-            """
+def _iso_dates(series):
+    return pd.to_datetime(series, errors="coerce").dt.strftime("%Y-%m-%d")
+
+
+def _fetch_map_frame(changed_since=None):
+    """Build the map payload columns from one Arrow fetch using column operations.
+
+    With ``changed_since`` (an ISO date) only wells whose last producing month
+    is on or after it, or not reported yet, are read. The month is coarse:
+    production for the latest month keeps arriving after the previous
+    refresh, so the boundary month is re-read; the merge replaces by API.
+
+    Points are ordered by effective year (completion year, else the year of
+    the last producing month), undated wells last, so "every well up to year
+    Y" is always a prefix and the wells added between two years are one
+    contiguous slice.
+    """
+    if changed_since is None:
+        df = snowflake_helpers.fetch_frame(MAP_PAYLOAD_SQL)
+    else:
+        df = snowflake_helpers.fetch_frame(
+            MAP_PAYLOAD_SQL
+            + "  AND (LASTPRODUCINGMONTH >= %s OR LASTPRODUCINGMONTH IS NULL)\n",
+            (changed_since,),
         )
-        rows = cur.fetchall()
-
-        payload = {
-            "lat": [],
-            "lon": [],
-            "text": [],
-            "year": [],
-            "api_uwi": [],
-            "lat_bh": [],
-            "lon_bh": [],
-            "last_producing": [],
+
+    completion = _iso_dates(df["COMPLETIONDATE"])
+    last_producing = _iso_dates(df["LASTPRODUCINGMONTH"])
+    year = pd.to_numeric(df["COMPLETION_YEAR"], errors="coerce")
+    year = year.fillna(pd.to_datetime(last_producing, errors="coerce").dt.year)
+
+    # Zero bottom-hole coordinates mean "not surveyed".
+    lat_bh = pd.to_numeric(df["LAT_BH"], errors="coerce")
+    lon_bh = pd.to_numeric(df["LON_BH"], errors="coerce")
+    frame = pd.DataFrame(
+        {
+            "lat": pd.to_numeric(df["LAT"], errors="coerce").astype("float64"),
+            "lon": pd.to_numeric(df["LON"], errors="coerce").astype("float64"),
+            "text": ("Completion: " + completion).fillna("Well"),
+            "year": year,
+            "api_uwi": df["API_UWI"],
+            "lat_bh": lat_bh.where(lat_bh != 0),
+            "lon_bh": lon_bh.where(lon_bh != 0),
+            "last_producing": last_producing,
         }
-        for lat, lon, lat_bh, lon_bh, cdate, cyear, api_uwi, last_prod in rows:
-            label = f"Completion: {cdate}" if cdate is not None else "Well"
-            if cyear is not None:
-                year_val = int(cyear)
-            elif last_prod:
-                try:
-                    year_val = pd.to_datetime(last_prod).year
-                except Exception:
-                    year_val = None
-            else:
-                year_val = None
-
-            payload["lat"].append(float(lat))
-            payload["lon"].append(float(lon))
-            payload["text"].append(label)
-            payload["year"].append(year_val)
-            payload["api_uwi"].append(api_uwi)
-            payload["lat_bh"].append(float(lat_bh) if lat_bh else None)
-            payload["lon_bh"].append(float(lon_bh) if lon_bh else None)
-            payload["last_producing"].append(last_prod)
-        return payload
-    finally:
-        try:
-            cur.close()
-        except Exception:
-            pass
-        conn.close()
+    )
+    return frame.sort_values("year", na_position="last", kind="stable", ignore_index=True)
+
+
+def _map_high_water_mark(payload):
+    months = payload["last_producing"].dropna()
+    return str(months.max()) if len(months) else None
+
+
+def _merge_map_frames(frame, changes):
+    """Replace the wells in ``changes`` (by API) and keep the year ordering."""
+    kept = frame[~frame["api_uwi"].isin(changes["api_uwi"])]
+    merged = pd.concat([kept, changes], ignore_index=True)
+    return merged.sort_values("year", na_position="last", kind="stable", ignore_index=True)
+
+
+def _map_refresh_frame():
+    """Incremental refresh from the cached payload's high-water mark.
+
+    Falls back to a full rescan when nothing is cached yet or the last full
+    rescan is older than ``_MAP_DATA_FULL_REFRESH_SECONDS``.
+    """
+    current = _map_data_cache["payload"]
+    high_water = _map_high_water_mark(current) if current is not None else None
+    full_due = time.time() - _map_data_cache["full_refresh_at"] >= _MAP_DATA_FULL_REFRESH_SECONDS
+    if high_water is None or full_due:
+        frame = _fetch_map_frame()
+        with _map_data_lock:
+            _map_data_cache["full_refresh_at"] = time.time()
+        return frame
+    changes = _fetch_map_frame(changed_since=high_water)
+    return _merge_map_frames(current, changes)
+
+
+def _map_dated_count(payload):
+    # Undated wells sort last, so the dated ones are a prefix.
+    return int(payload["year"].notna().sum())
+
+
+def _map_year_index(payload):
+    """First offset of each year in the year-sorted payload.
+
+    Points with year <= Y are ``[0, starts[k])`` where ``k`` is the first
+    entry with ``years[k] > Y`` (or ``end`` if there is none).
+    """
+    dated = _map_dated_count(payload)
+    years, starts = np.unique(
+        payload["year"].to_numpy(dtype="float64")[:dated].astype("int64"), return_index=True
+    )
+    return {"years": years.tolist(), "starts": starts.tolist(), "end": dated}
+
+
+def _map_payload_lists(frame):
+    """Per-well Python lists for the encoders.
+
+    The cached payload is the year-sorted frame itself. Loaded from the
+    snapshot its columns are views of the memory-mapped file shared by every
+    worker, so the boxed lists are only built while encoding a response.
+    """
+    payload = {
+        column: frame[column].astype(object).where(frame[column].notna(), None).tolist()
+        for column in frame.columns
+    }
+    # Nullable integer years are stored as floats.
+    payload["year"] = [int(value) if value is not None else None for value in payload.get("year", [])]
+    return payload
+
+
+def _store_map_payload(payload):
+    with _map_data_lock:
+        _map_data_cache["payload"] = payload
+        _map_data_cache["timestamp"] = time.monotonic()
+        _map_data_cache["failures"] = 0
+        _map_data_cache["retry_at"] = 0.0
+
+
+def _record_map_refresh_failure():
+    with _map_data_lock:
+        failures = _map_data_cache["failures"] + 1
+        backoff = min(
+            _MAP_DATA_ERROR_BACKOFF_SECONDS * 2 ** (failures - 1),
+            _MAP_DATA_MAX_BACKOFF_SECONDS,
+        )
+        _map_data_cache["failures"] = failures
+        _map_data_cache["retry_at"] = time.monotonic() + backoff
+
+
+def _refresh_map_payload():
+    # Another worker on this host may already have refreshed the snapshot
+    # within the TTL; reuse it instead of querying Snowflake again.
+    try:
+        payload = snapshots.refresh_shared(
+            MAP_PAYLOAD_SNAPSHOT,
+            _map_refresh_frame,
+            newer_than=time.time() - _MAP_DATA_CACHE_TTL_SECONDS,
+            arrow_strings=True,
+        )
+    except Exception:
+        _record_map_refresh_failure()
+        raise
+    _store_map_payload(payload)
+    return payload
 
 
 def _get_cached_map_payload():
+    """Return the map payload, refreshing it stale-while-revalidate.
+
+    Within the TTL the cached payload is returned as is. Once it expires the
+    stale payload keeps being served while one background thread rebuilds
+    it; only past ``_MAP_DATA_MAX_STALE_SECONDS`` does a request wait for the
+    rebuild. Failed refreshes back off exponentially before being retried.
+    """
     now = time.monotonic()
     cached_payload = _map_data_cache["payload"]
-    if cached_payload and (now - _map_data_cache["timestamp"] < _MAP_DATA_CACHE_TTL_SECONDS):
+    age = now - _map_data_cache["timestamp"]
+    if cached_payload is not None and age < _MAP_DATA_CACHE_TTL_SECONDS:
+        return cached_payload
+
+    if cached_payload is not None and age < _MAP_DATA_MAX_STALE_SECONDS:
+        if now >= _map_data_cache["retry_at"]:
+            snapshots.refresh_in_background(MAP_PAYLOAD_SNAPSHOT, _refresh_map_payload)
         return cached_payload
 
     with _map_data_lock:
         cached_payload = _map_data_cache["payload"]
-        if cached_payload and (now - _map_data_cache["timestamp"] < _MAP_DATA_CACHE_TTL_SECONDS):
+        if cached_payload is not None and (
+            time.monotonic() - _map_data_cache["timestamp"] < _MAP_DATA_MAX_STALE_SECONDS
+        ):
             return cached_payload
 
-        payload = _fetch_map_payload()
-        _map_data_cache["payload"] = payload
-        _map_data_cache["timestamp"] = time.monotonic()
-        return payload
+        if cached_payload is None:
+            # Cold worker: serve the on-disk snapshot and refresh it behind the scenes.
+            payload = snapshots.warm_load(
+                MAP_PAYLOAD_SNAPSHOT,
+                _fetch_map_frame,
+                _store_map_payload,
+                arrow_strings=True,
+            )
+            _map_data_cache["payload"] = payload
+            _map_data_cache["timestamp"] = time.monotonic()
+            return payload
+
+        if time.monotonic() < _map_data_cache["retry_at"]:
+            raise snowflake_errors.OperationalError(
+                msg="Map data refresh is backing off after a failed refresh."
+            )
+
+    # Too stale to serve: rebuild now. Concurrent callers wait on the refresh
+    # lock and then pick up the payload the first caller stored.
+    with _map_data_refresh_lock:
+        if time.monotonic() - _map_data_cache["timestamp"] < _MAP_DATA_MAX_STALE_SECONDS:
+            return _map_data_cache["payload"]
+        return _refresh_map_payload()
 
 def map_page(request):
     """Renders the HTML page with Plotly map + slider."""
@@ -719,8 +926,209 @@ def map_data(request):
         return redirect('/login/')
     
     # Your existing map_data code here...
-    payload = _get_cached_map_payload()
-    return JsonResponse(payload)
+    try:
+        payload = _get_cached_map_payload()
+    except snowflake_errors.Error:
+        logger.exception("Failed to load map data.")
+        return JsonResponse({"detail": "Map data is temporarily unavailable."}, status=503)
+    if request.GET.get("bbox"):
+        return _map_viewport_response(request, payload)
+    if request.GET.get("format") == "binary":
+        encoded = _map_data_encoded.get(
+            payload,
+            "binary",
+            lambda: responses.Precompressed(
+                _encode_map_payload(
+                    _map_payload_lists(payload), meta={"year_index": _map_year_index(payload)}
+                ),
+                columnar.CONTENT_TYPE,
+            ),
+        )
+    else:
+        encoded = _map_data_encoded.get(
+            payload,
+            "json",
+            lambda: responses.Precompressed.from_json(
+                {**_map_payload_lists(payload), "year_index": _map_year_index(payload)}
+            ),
+        )
+    return responses.precompressed_response(request, encoded)
+
+
+def map_laterals(request):
+    """Wellbore laterals for the map as one packed polyline."""
+    if 'user' not in request.session:
+        return redirect('/login/')
+    try:
+        payload = _get_cached_map_payload()
+    except snowflake_errors.Error:
+        logger.exception("Failed to load map data for laterals.")
+        return JsonResponse({"detail": "Map data is temporarily unavailable."}, status=503)
+    encoded = _map_laterals_encoded.get(
+        payload,
+        None,
+        lambda: responses.Precompressed(_encode_map_laterals(payload), columnar.CONTENT_TYPE),
+    )
+    return responses.precompressed_response(request, encoded)
+
+
+def _encode_map_laterals(payload):
+    """Surface-to-bottom-hole segments as NaN-separated ``lat``/``lon`` vertices.
+
+    Wells without a bottom hole or with a zero-length lateral are dropped.
+    Segments follow the year-sorted payload, and ``meta.ends[k]`` is the
+    number of vertices belonging to wells completed by ``meta.years[k]``, so
+    the year slider draws a prefix of the arrays.
+    """
+    lat = payload["lat"].to_numpy(dtype="float64")
+    lon = payload["lon"].to_numpy(dtype="float64")
+    lat_bh = payload["lat_bh"].to_numpy(dtype="float64")
+    lon_bh = payload["lon_bh"].to_numpy(dtype="float64")
+    valid = (
+        np.isfinite(lat_bh)
+        & np.isfinite(lon_bh)
+        & ((lat_bh != lat) | (lon_bh != lon))
+    )
+    wells = np.flatnonzero(valid)
+    separator = np.full(len(wells), np.nan)
+    vertex_lat = np.column_stack([lat[wells], lat_bh[wells], separator]).ravel()
+    vertex_lon = np.column_stack([lon[wells], lon_bh[wells], separator]).ravel()
+
+    year_index = _map_year_index(payload)
+    laterals_before = np.concatenate([[0], np.cumsum(valid)])
+    bounds = year_index["starts"][1:] + [year_index["end"]] if year_index["years"] else []
+    ends = (3 * laterals_before[bounds]).tolist()
+    return columnar.pack(
+        [("lat", "float32", vertex_lat), ("lon", "float32", vertex_lon)],
+        meta={"years": year_index["years"], "ends": ends},
+    )
+
+
+def _map_spatial_index(payload):
+    with _map_index_lock:
+        if _map_index_cache["payload"] is payload:
+            return _map_index_cache["index"]
+    index = spatial.GridIndex(
+        payload["lat"].to_numpy(dtype="float64"), payload["lon"].to_numpy(dtype="float64")
+    )
+    with _map_index_lock:
+        _map_index_cache["payload"] = payload
+        _map_index_cache["index"] = index
+    return index
+
+
+def _nearby_age_counts(years, year):
+    """Bucket well ages (``year`` minus completion year) like the map charts.
+
+    ``years`` is a float array; undated wells (NaN) are not counted.
+    """
+    ages = year - years[years <= year]
+    recent = int((ages <= 3).sum())
+    medium = int(((ages > 3) & (ages <= 10)).sum())
+    old = int((ages > 10).sum())
+    return {"recent": recent, "medium": medium, "old": old, "total": recent + medium + old}
+
+
+@require_http_methods(["GET"])
+def nearby_wells(request):
+    """Counts of wells within each radius of a point, bucketed by age.
+
+    Only wells completed by ``year`` are counted, matching the year slider.
+    """
+    if "user" not in request.session:
+        return JsonResponse({"detail": "Authentication required."}, status=401)
+    try:
+        lat = float(request.GET["lat"])
+        lon = float(request.GET["lon"])
+        year = int(request.GET.get("year") or datetime.now(timezone.utc).year)
+        radii = [
+            float(value)
+            for value in (request.GET.get("radius") or "").split(",")
+            if value.strip()
+        ] or list(NEARBY_DEFAULT_RADII_MILES)
+    except (KeyError, ValueError):
+        return JsonResponse({"detail": "lat, lon, year and radius must be numbers."}, status=400)
+    if not all(0 < radius <= NEARBY_MAX_RADIUS_MILES for radius in radii):
+        return JsonResponse(
+            {"detail": f"radius must be between 0 and {NEARBY_MAX_RADIUS_MILES} miles."}, status=400
+        )
+
+    try:
+        payload = _get_cached_map_payload()
+    except snowflake_errors.Error:
+        logger.exception("Failed to load map data for nearby wells.")
+        return JsonResponse({"detail": "Map data is temporarily unavailable."}, status=503)
+
+    index = _map_spatial_index(payload)
+    years = payload["year"].to_numpy(dtype="float64")
+    counts = {}
+    for radius in radii:
+        indices, _ = index.within_radius(lat, lon, radius)
+        counts[f"{radius:g}"] = _nearby_age_counts(years[indices], year)
+    return JsonResponse({"centroid": {"lat": lat, "lon": lon}, "year": year, "radii": counts})
+
+
+def _map_viewport_response(request, payload):
+    """Points (or grid clusters) inside ``?bbox=west,south,east,north``."""
+    try:
+        bbox = spatial.parse_bbox(request.GET["bbox"])
+        zoom = float(request.GET.get("zoom") or 0)
+    except ValueError:
+        return JsonResponse(
+            {"detail": "bbox must be west,south,east,north and zoom a number."}, status=400
+        )
+
+    binary = request.GET.get("format") == "binary"
+
+    def build():
+        index = _map_spatial_index(payload)
+        indices = index.query(bbox)
+        if len(indices) <= MAP_VIEWPORT_MAX_POINTS or zoom >= _MAP_CLUSTER_MAX_ZOOM:
+            subset = _map_payload_lists(payload.iloc[indices])
+            if binary:
+                return responses.Precompressed(
+                    _encode_map_payload(subset, meta={"mode": "points"}), columnar.CONTENT_TYPE
+                )
+            return responses.Precompressed.from_json({"mode": "points", **subset})
+
+        clusters = index.clusters(indices, zoom)
+        if binary:
+            body = columnar.pack(
+                [
+                    ("lat", "float32", clusters["lat"]),
+                    ("lon", "float32", clusters["lon"]),
+                    ("count", "float32", clusters["count"]),
+                ],
+                meta={"mode": "clusters"},
+            )
+            return responses.Precompressed(body, columnar.CONTENT_TYPE)
+        return responses.Precompressed.from_json({"mode": "clusters", **clusters})
+
+    encoded = _map_viewport_encoded.get(payload, (bbox, zoom, binary), build)
+    return responses.precompressed_response(request, encoded)
+
+
+def _encode_map_payload(payload, meta=None):
+    # Hover labels ("Completion: <date>") are rebuilt client-side from the
+    # dictionary-encoded completion dates instead of being sent per well.
+    completion_dates = [
+        text[len("Completion: "):] if isinstance(text, str) and text.startswith("Completion: ") else None
+        for text in payload["text"]
+    ]
+    return columnar.pack(
+        [
+            ("lat", "float32", payload["lat"]),
+            ("lon", "float32", payload["lon"]),
+            ("lat_bh", "float32", payload["lat_bh"]),
+            ("lon_bh", "float32", payload["lon_bh"]),
+            ("year", "int16", payload["year"]),
+            ("completion_date", "dict", completion_dates),
+            ("last_producing", "dict", payload["last_producing"]),
+            ("api_uwi", "utf8", payload["api_uwi"]),
+        ],
+        meta=meta,
+    )
+
 
 
 WELL_EXPLORER_FILTER_FIELDS = {
@@ -783,13 +1191,21 @@ def _parse_api_list(value):
     return [entry.strip() for entry in str(value).split(",") if entry.strip()]
 
 
+def _text_or_empty(df, column):
+    """Column values as a list with missing (or categorical NaN) entries as ``""``."""
+    if column not in df.columns:
+        return [""] * len(df)
+    values = df[column].astype(object)
+    return values.where(values.notna(), "").tolist()
+
+
 def _build_well_explorer_payload():
     all_wells = get_all_wells_with_owners()
     if all_wells is None or all_wells.empty:
         return {"filters": {}, "wells": []}
 
     if "OWNER_LIST" in all_wells.columns:
-        owner_mask = all_wells["OWNER_LIST"].fillna("").astype(str).str.strip() != ""
+        owner_mask = all_wells["OWNER_LIST"].astype(object).fillna("").astype(str).str.strip() != ""
         wells_df = all_wells.loc[owner_mask].copy()
     else:
         wells_df = all_wells.iloc[0:0].copy()
@@ -800,7 +1216,7 @@ def _build_well_explorer_payload():
             if key == "owner_list":
                 # Explode pipe-delimited owner names into unique values
                 all_owners = set()
-                for val in wells_df[column].dropna().astype(str):
+                for val in wells_df[column].dropna().astype(str).unique():
                     for owner in val.split("|"):
                         owner = owner.strip()
                         if owner:
@@ -811,51 +1227,39 @@ def _build_well_explorer_payload():
         else:
             filters[key] = []
 
-    # Query ECON_INPUT_1PASS for approved wells
+    # Query ECON_INPUT_1PASS for approved wells. The explorer lists every
+    # owned well, so fetch all approved APIs and intersect locally rather
+    # than binding the whole inventory into the statement.
     approved_apis = set()
     api_list = wells_df["API_UWI"].dropna().tolist() if "API_UWI" in wells_df.columns else []
     if api_list:
-        conn = get_snowflake_connection()
         try:
-            cur = conn.cursor(DictCursor)
-            placeholders = ",".join(["%s"] * len(api_list))
-            cur.execute(
-                f"""
+            rows = snowflake_helpers.fetch_all(
+                """
                 SELECT DISTINCT API_UWI
                 FROM WELLS.MINERALS.ECON_INPUT_1PASS
-                WHERE API_UWI IN ({placeholders})
-                  AND APPROVED = 'Y'
-                """,
-                api_list,
+                WHERE APPROVED = 'Y'
+                """
             )
-            rows = cur.fetchall() or []
             approved_apis = {row.get("API_UWI") for row in rows if row.get("API_UWI")}
+            approved_apis.intersection_update(api_list)
         except snowflake_errors.Error:
             logger.exception("Failed to load approved wells for well explorer.")
-        finally:
-            try:
-                cur.close()
-            except Exception:
-                pass
-            conn.close()
 
-    wells = []
-    for _, row in wells_df.iterrows():
-        api_uwi = row.get("API_UWI")
-        wells.append(
-            {
-                "api_uwi": api_uwi,
-                "wellname": row.get("WELLNAME") or "",
-                "envoperator": row.get("ENVOPERATOR") or "",
-                "owner_list": row.get("OWNER_LIST") or "",
-                "envwellstatus": row.get("ENVWELLSTATUS") or "",
-                "trajectory": row.get("TRAJECTORY") or "",
-                "county": row.get("COUNTY") or "",
-                "lat": float(row.get("LATITUDE")) if row.get("LATITUDE") is not None else None,
-                "lon": float(row.get("LONGITUDE")) if row.get("LONGITUDE") is not None else None,
-                "dca_approved": api_uwi in approved_apis,
-            }
-        )
+    api_uwi = _column_or_none(wells_df, "API_UWI").astype(object).tolist()
+    columns = {
+        "api_uwi": api_uwi,
+        "wellname": _text_or_empty(wells_df, "WELLNAME"),
+        "envoperator": _text_or_empty(wells_df, "ENVOPERATOR"),
+        "owner_list": _text_or_empty(wells_df, "OWNER_LIST"),
+        "envwellstatus": _text_or_empty(wells_df, "ENVWELLSTATUS"),
+        "trajectory": _text_or_empty(wells_df, "TRAJECTORY"),
+        "county": _text_or_empty(wells_df, "COUNTY"),
+        "lat": _coordinate_or_none(wells_df, "LATITUDE").tolist(),
+        "lon": _coordinate_or_none(wells_df, "LONGITUDE").tolist(),
+        "dca_approved": [api in approved_apis for api in api_uwi],
+    }
+    wells = [dict(zip(columns, values)) for values in zip(*columns.values())]
 
     return {"filters": filters, "wells": wells}
 
@@ -971,130 +1375,370 @@ def get_user_owner_name(user_email):
     return owner_name
 
 
-@lru_cache(maxsize=1)
+# Columns of RAW_WELL_DATA_WITH_OWNERS read by _user_wells_frame, the owner
+# index and _build_well_explorer_payload. Any that are missing from the table
+# (e.g. OWNER_INTEREST_LIST, COUNTY) are skipped.
+WELLS_WITH_OWNERS_COLUMNS = (
+    "API_UWI",
+    "WELLNAME",
+    "WELL_NAME",
+    "ENVOPERATOR",
+    "ENVWELLSTATUS",
+    "COUNTY",
+    "TRAJECTORY",
+    "LATITUDE",
+    "LONGITUDE",
+    "LATITUDE_BH",
+    "LONGITUDE_BH",
+    "PERMITAPPROVEDDATE",
+    "COMPLETIONDATE",
+    "COMPLETION_YEAR",
+    "FIRSTPRODMONTHOIL",
+    "FIRSTPRODMONTHGAS",
+    "LASTPRODUCINGMONTHOIL",
+    "LASTPRODUCINGMONTHGAS",
+    "LASTPRODUCINGMONTH",
+    "OWNER_LIST",
+    "NRI_LIST",
+    "OWNER_INTEREST_LIST",
+    "GROSS_OIL_EUR",
+    "GROSS_GAS_EUR",
+    "NET_OIL_EUR",
+    "NET_GAS_EUR",
+    "NET_NGL_EUR",
+    "REMAINING_NET_OIL",
+    "REMAINING_NET_GAS",
+    "PV17",
+)
+_WELLS_CACHE_TTL_SECONDS = snapshots.env_seconds("SEG_WELLS_CACHE_TTL_SECONDS", 900)
+
+
+def _wells_with_owners_projection():
+    available = snowflake_helpers.fetch_frame(
+        "SELECT * FROM WELLS.MINERALS.RAW_WELL_DATA_WITH_OWNERS LIMIT 0"
+    ).columns
+    return [column for column in WELLS_WITH_OWNERS_COLUMNS if column in available]
+
+
+# Low-cardinality text and the pipe-delimited owner/interest lists (repeated
+# across the wells of a unit) are stored as categoricals, so each distinct
+# value is held once and rows carry integer codes.
+WELLS_CATEGORY_COLUMNS = (
+    "ENVOPERATOR",
+    "ENVWELLSTATUS",
+    "COUNTY",
+    "TRAJECTORY",
+    "OWNER_LIST",
+    "NRI_LIST",
+    "OWNER_INTEREST_LIST",
+)
+WELLS_DATE_COLUMNS = ("PERMITAPPROVEDDATE", "COMPLETIONDATE", "LASTPRODUCINGMONTH")
+WELLS_COORDINATE_COLUMNS = ("LATITUDE", "LONGITUDE", "LATITUDE_BH", "LONGITUDE_BH")
+
+
+def _load_wells_with_owners():
+    df = snowflake_helpers.fetch_frame(
+        f"""
+        SELECT {", ".join(_wells_with_owners_projection())}
+        FROM WELLS.MINERALS.RAW_WELL_DATA_WITH_OWNERS
+        WHERE LATITUDE IS NOT NULL
+          AND LONGITUDE IS NOT NULL
+        """
+    )
+    # Derive completion year if not provided
+    if "COMPLETION_YEAR" not in df.columns and "COMPLETIONDATE" in df.columns:
+        df["COMPLETION_YEAR"] = pd.to_datetime(df["COMPLETIONDATE"]).dt.year
+    # Production date bounds, parsed once here instead of per request.
+    df["FIRST_PROD_DATE"] = _date_bound(df, FIRST_PROD_DATE_COLUMNS, "min")
+    df["LAST_PROD_DATE"] = _date_bound(df, LAST_PROD_DATE_COLUMNS, "max")
+    # LASTPRODUCINGMONTH stays for the completion-year fallback.
+    return df.drop(
+        columns=[
+            column
+            for column in FIRST_PROD_DATE_COLUMNS + LAST_PROD_DATE_COLUMNS
+            if column != "LASTPRODUCINGMONTH" and column in df.columns
+        ]
+    )
+
+
+def _compact_wells_frame(df):
+    """Shrink ``df`` in place for caching: categoricals, parsed dates, float32 coordinates.
+
+    float32 keeps coordinates to well under a metre; readers round them back
+    to six decimals.
+    """
+    for column in WELLS_COORDINATE_COLUMNS:
+        if column in df.columns:
+            df[column] = pd.to_numeric(df[column], errors="coerce").astype("float32")
+    for column in WELLS_DATE_COLUMNS:
+        if column in df.columns:
+            df[column] = pd.to_datetime(df[column], errors="coerce").astype("datetime64[s]")
+    for column in WELLS_CATEGORY_COLUMNS:
+        if column in df.columns:
+            categorical = df[column].astype("category")
+            # Near-unique lists are smaller left as plain strings.
+            if categorical.memory_usage(deep=True) < df[column].memory_usage(deep=True):
+                df[column] = categorical
+    return df
+
+
+def _fetch_wells_with_owners():
+    return _compact_wells_frame(_load_wells_with_owners())
+
+
+FIRST_PROD_DATE_COLUMNS = ("FIRSTPRODMONTHOIL", "FIRSTPRODMONTHGAS")
+LAST_PROD_DATE_COLUMNS = ("LASTPRODUCINGMONTHOIL", "LASTPRODUCINGMONTHGAS", "LASTPRODUCINGMONTH")
+
+
+def _date_bound(df, columns, how):
+    """Row-wise earliest/latest of the date ``columns`` present in ``df``."""
+    parsed = [pd.to_datetime(df[column], errors="coerce") for column in columns if column in df.columns]
+    if not parsed:
+        return pd.Series(pd.NaT, index=df.index, dtype="datetime64[ns]")
+    stacked = pd.concat(parsed, axis=1)
+    return stacked.min(axis=1) if how == "min" else stacked.max(axis=1)
+
+
+_wells_dataset = snapshots.SharedDataset(
+    WELLS_SNAPSHOT, _fetch_wells_with_owners, ttl=_WELLS_CACHE_TTL_SECONDS
+)
+
+
 def get_all_wells_with_owners():
-    """Fetch all wells with owner information and cache the result."""
-    conn = get_snowflake_connection()
-    try:
-        cur = conn.cursor()
-        # Select all columns so the query succeeds even if some optional
-        # fields (e.g. OWNER_INTEREST_LIST) are missing in the table.
-        cur.execute(
-            """
-            SELECT *
-            FROM WELLS.MINERALS.RAW_WELL_DATA_WITH_OWNERS
-            WHERE LATITUDE IS NOT NULL
-              AND LONGITUDE IS NOT NULL
-            """
-        )
-        rows = cur.fetchall()
-        cols = [c[0] for c in cur.description]
-        df = pd.DataFrame(rows, columns=cols)
-        # Derive completion year if not provided
-        if "COMPLETION_YEAR" not in df.columns and "COMPLETIONDATE" in df.columns:
-            df["COMPLETION_YEAR"] = pd.to_datetime(df["COMPLETIONDATE"]).dt.year
-        # Helper column for API without dashes
-        if "API_UWI" in df.columns:
-            df["API_NODASH"] = df["API_UWI"].str.replace('-', '', regex=False)
-        return df
-    finally:
-        try:
-            cur.close()
-        except Exception:
-            pass
-        conn.close()
+    """All wells with owner information (projected columns), cached with a TTL.
+
+    A cold worker starts from the on-disk snapshot. Past the TTL
+    (``SEG_WELLS_CACHE_TTL_SECONDS``) the cached frame is served while it
+    refreshes in the background; ``refresh_wells_cache`` forces a reload.
+    """
+    return _wells_dataset.get()
 
 
-def _snowflake_user_wells(owner_name):
-    """Get rich data for user's specific wells from cached data."""
-    all_wells = get_all_wells_with_owners()
+def _split_pipe_list(series):
+    """Explode a pipe-delimited column into ``(position, slot, value)`` entries."""
+    values = series.reset_index(drop=True).fillna("").astype(str).str.split("|").explode()
+    return pd.DataFrame(
+        {
+            "position": values.index.to_numpy(dtype="int64"),
+            "slot": values.groupby(level=0).cumcount().to_numpy(),
+            "value": values.str.strip().to_numpy(),
+        }
+    )
 
-    # Filter wells where the owner appears in the pipe-delimited OWNER_LIST
-    mask = all_wells["OWNER_LIST"].fillna("").apply(
-        lambda owners_csv: any(
-            owner_name.lower() == o.strip().lower() for o in owners_csv.split("|") if o
-        )
+
+def _decode_codes(codes, uniques):
+    """``pd.factorize`` codes back to values, with -1 as ``None``."""
+    values = np.append(np.asarray(uniques, dtype=object), None)
+    return pd.Series(values[codes])
+
+
+def _build_owner_index(all_wells):
+    """Inverted index from lower-cased owner name to the wells listing it.
+
+    ``owners`` maps each name to a ``(start, end)`` range into ``positions``
+    (row positions in ``all_wells``, ascending) and the aligned
+    ``interests``: the owner's NRI entries for that well summed, with
+    unparseable entries counted as zero. Each distinct owner/interest list
+    pair is split once and fanned out to the wells sharing it.
+    """
+    empty = {"owners": {}, "positions": np.empty(0, dtype="int64"), "interests": np.empty(0)}
+    if all_wells is None or all_wells.empty or "OWNER_LIST" not in all_wells.columns:
+        return empty
+
+    owner_codes, owner_lists = pd.factorize(all_wells["OWNER_LIST"])
+    interest_column = next(
+        (column for column in ("NRI_LIST", "OWNER_INTEREST_LIST") if column in all_wells.columns),
+        None,
+    )
+    if interest_column is not None:
+        interest_codes, interest_lists = pd.factorize(all_wells[interest_column])
+    else:
+        interest_codes, interest_lists = np.full(len(all_wells), -1), []
+    pairs, well_pair = np.unique(
+        owner_codes.astype("int64") * (len(interest_lists) + 1) + interest_codes + 1,
+        return_inverse=True,
     )
-    df = all_wells.loc[mask].copy()
+    well_pair = well_pair.ravel()
+
+    entries = _split_pipe_list(_decode_codes(pairs // (len(interest_lists) + 1), owner_lists))
+    entries["value"] = entries["value"].str.lower()
+    entries = entries[entries["value"] != ""]
+    if interest_column is not None:
+        shares = _split_pipe_list(_decode_codes(pairs % (len(interest_lists) + 1) - 1, interest_lists))
+        shares["interest"] = pd.to_numeric(shares.pop("value"), errors="coerce")
+        entries = entries.merge(shares, on=["position", "slot"], how="left")
+    else:
+        entries["interest"] = np.nan
+    if entries.empty:
+        return empty
+
+    # (owner, pair) interests, then one row per well sharing the pair.
+    per_pair = entries.groupby(["value", "position"], sort=False)["interest"].sum()
+    well_order = np.argsort(well_pair, kind="stable")
+    pair_starts = np.searchsorted(well_pair[well_order], np.arange(len(pairs) + 1))
+    pair_ids = per_pair.index.get_level_values(1).to_numpy(dtype="int64")
+    counts = pair_starts[pair_ids + 1] - pair_starts[pair_ids]
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    positions = well_order[np.repeat(pair_starts[pair_ids], counts) + offsets].astype("int64")
+    names = np.repeat(per_pair.index.get_level_values(0).to_numpy(dtype=object), counts)
+    interests = np.repeat(per_pair.to_numpy(dtype="float64"), counts)
+
+    order = np.lexsort((positions, names))
+    names, positions, interests = names[order], positions[order], interests[order]
+    starts = np.concatenate([[0], np.flatnonzero(names[1:] != names[:-1]) + 1])
+    ends = np.append(starts[1:], len(names))
+    return {
+        "owners": dict(zip(names[starts].tolist(), zip(starts.tolist(), ends.tolist()))),
+        "positions": positions,
+        "interests": interests,
+    }
+
+
+def _owner_index(all_wells):
+    """The owner index for ``all_wells``, built once per loaded frame."""
+    with _owner_index_lock:
+        if _owner_index_cache["frame"] is not all_wells:
+            _owner_index_cache["index"] = _build_owner_index(all_wells)
+            _owner_index_cache["frame"] = all_wells
+        return _owner_index_cache["index"]
+
+
+def _owner_wells(all_wells, owner_name):
+    """Rows of ``all_wells`` listing ``owner_name`` and the owner's interest in each."""
+    index = _owner_index(all_wells)
+    start, end = index["owners"].get(owner_name.lower(), (0, 0))
+    return all_wells.iloc[index["positions"][start:end]], index["interests"][start:end]
+
+
+USER_WELL_NUMBER_COLUMNS = {
+    "gross_oil_eur": "GROSS_OIL_EUR",
+    "gross_gas_eur": "GROSS_GAS_EUR",
+    "net_oil_eur": "NET_OIL_EUR",
+    "net_gas_eur": "NET_GAS_EUR",
+    "net_ngl_eur": "NET_NGL_EUR",
+    "remaining_net_oil": "REMAINING_NET_OIL",
+    "remaining_net_gas": "REMAINING_NET_GAS",
+    "pv17": "PV17",
+}
+
+
+def _column_or_none(df, column):
+    if column in df.columns:
+        return df[column]
+    return pd.Series(None, index=df.index, dtype=object)
+
+
+def _iso_date_or_none(series):
+    return pd.to_datetime(series, errors="coerce").dt.strftime("%Y-%m-%d").astype(object)
+
+
+def _coordinate_or_none(df, column):
+    """A (float32) coordinate column widened and rounded back to six decimals."""
+    return pd.to_numeric(_column_or_none(df, column), errors="coerce").astype("float64").round(6)
+
+
+def _user_wells_frame(owner_name, all_wells=None):
+    """The owner's wells, one row per API, with the ``/user-wells-data/`` fields as columns."""
+    if all_wells is None:
+        all_wells = get_all_wells_with_owners()
+
+    df, interests = _owner_wells(all_wells, owner_name)
     # Snowflake can return duplicate rows for a well. Drop them so each well
     # is only counted once in downstream tables and calculations.
     if "API_UWI" in df.columns:
-        df = df.drop_duplicates(subset=["API_UWI"])
-
-    def interest_for_row(row):
-        owners = [o.strip() for o in str(row.get("OWNER_LIST", "")).split("|")]
-        interests_raw = str(row.get("NRI_LIST", row.get("OWNER_INTEREST_LIST", "")))
-        interests = [i.strip() for i in interests_raw.split("|")]
-        total = 0.0
-        for o, i in zip(owners, interests):
-            if o.lower() == owner_name.lower():
-                try:
-                    total += float(i)
-                except Exception:
-                    continue
-        return total
-
-    out = []
-    for _, row in df.iterrows():
-        interest = interest_for_row(row)
-        cdate = row["COMPLETIONDATE"]
-        label = (
-            f"Well: {row['API_UWI']}\n"
-            f"Owner: {owner_name}\n"
-            f"Interest: {interest}%\n"
-            f"Completion: {cdate}"
-        )
-
-        traj_raw = str(row.get("TRAJECTORY", ""))
-        trajectory = "Horizontal" if traj_raw.strip().upper().startswith("H") else "Vertical"
-
-        first_dates = [row.get("FIRSTPRODMONTHOIL"), row.get("FIRSTPRODMONTHGAS")]
-        first_dates = [pd.to_datetime(d) for d in first_dates if pd.notnull(d)]
-        first_prod = min(first_dates).date().isoformat() if first_dates else None
+        first = ~df["API_UWI"].duplicated().to_numpy()
+        df = df[first]
+        interests = interests[first]
+
+    interest = pd.Series(interests, index=df.index, dtype="float64")
+    completion = _iso_date_or_none(_column_or_none(df, "COMPLETIONDATE"))
+    api = _column_or_none(df, "API_UWI")
+    label = (
+        "Well: " + api.map(str).astype(object)
+        + f"\nOwner: {owner_name}\nInterest: "
+        + interest.map(str).astype(object)
+        + "%\nCompletion: "
+        + completion.fillna("None")
+    )
+    year = pd.to_numeric(_column_or_none(df, "COMPLETION_YEAR"), errors="coerce").fillna(
+        pd.to_datetime(_column_or_none(df, "LASTPRODUCINGMONTH"), errors="coerce").dt.year
+    )
+    name = _column_or_none(df, "WELL_NAME")
+    name = name.where(name.notna() & (name != ""), _column_or_none(df, "WELLNAME"))
+    trajectory = _column_or_none(df, "TRAJECTORY").astype(object).fillna("").astype(str).str.strip().str.upper()
+    last_prod = _iso_date_or_none(_column_or_none(df, "LAST_PROD_DATE"))
 
-        last_dates = [
-            row.get("LASTPRODUCINGMONTHOIL"),
-            row.get("LASTPRODUCINGMONTHGAS"),
-            row.get("LASTPRODUCINGMONTH"),
-        ]
-        last_dates = [pd.to_datetime(d) for d in last_dates if pd.notnull(d)]
-        last_prod = max(last_dates).date().isoformat() if last_dates else None
-
-        out.append({
-            "lat": float(row["LATITUDE"]),
-            "lon": float(row["LONGITUDE"]),
-            "lat_bh": float(row["LATITUDE_BH"]) if pd.notnull(row["LATITUDE_BH"]) else None,
-            "lon_bh": float(row["LONGITUDE_BH"]) if pd.notnull(row["LONGITUDE_BH"]) else None,
+    frame = pd.DataFrame(
+        {
+            "lat": _coordinate_or_none(df, "LATITUDE"),
+            "lon": _coordinate_or_none(df, "LONGITUDE"),
+            "lat_bh": _coordinate_or_none(df, "LATITUDE_BH"),
+            "lon_bh": _coordinate_or_none(df, "LONGITUDE_BH"),
             "label": label,
-            "year": (
-                int(row["COMPLETION_YEAR"]) if pd.notnull(row["COMPLETION_YEAR"])
-                else (
-                    pd.to_datetime(row["LASTPRODUCINGMONTH"]).year
-                    if pd.notnull(row["LASTPRODUCINGMONTH"]) else None
-                )
-            ),
-            "api_uwi": row["API_UWI"],
-            "name": row.get("WELL_NAME") or row.get("WELLNAME"),
-            "operator": row.get("ENVOPERATOR"),
-            "trajectory": trajectory,
-            "permit_date": row.get("PERMITAPPROVEDDATE"),
-            "first_prod_date": first_prod,
+            "year": year.astype("Int64"),
+            "api_uwi": api,
+            "name": name,
+            "operator": _column_or_none(df, "ENVOPERATOR"),
+            "trajectory": np.where(trajectory.str.startswith("H"), "Horizontal", "Vertical"),
+            "permit_date": _iso_date_or_none(_column_or_none(df, "PERMITAPPROVEDDATE")),
+            "first_prod_date": _iso_date_or_none(_column_or_none(df, "FIRST_PROD_DATE")),
             "last_prod_date": last_prod,
-            "completion_date": cdate,
-            "gross_oil_eur": row.get("GROSS_OIL_EUR"),
-            "gross_gas_eur": row.get("GROSS_GAS_EUR"),
-            "net_oil_eur": row.get("NET_OIL_EUR"),
-            "net_gas_eur": row.get("NET_GAS_EUR"),
-            "net_ngl_eur": row.get("NET_NGL_EUR"),
-            "remaining_net_oil": row.get("REMAINING_NET_OIL"),
-            "remaining_net_gas": row.get("REMAINING_NET_GAS"),
-            "pv17": row.get("PV17"),
+            "completion_date": completion,
+            **{key: _column_or_none(df, column) for key, column in USER_WELL_NUMBER_COLUMNS.items()},
             "last_producing": last_prod,
             "owner_interest": interest,
             "owner_name": owner_name,
-        })
+        },
+        index=df.index,
+    )
+    return frame.reset_index(drop=True)
+
+
+def _frame_column_values(frame, column):
+    """Column values as a list with NaN/NaT mapped to ``None``."""
+    values = frame[column].astype(object)
+    return values.where(frame[column].notna(), None).tolist()
+
+
+def _snowflake_user_wells(owner_name):
+    """Get rich data for user's specific wells from cached data."""
+    frame = _user_wells_frame(owner_name)
+    columns = {column: _frame_column_values(frame, column) for column in frame.columns}
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+
+# /user-wells-data/ response key -> column of _user_wells_frame (plus the
+# dca_approved column added by the view), in response order.
+USER_WELLS_RESPONSE_SCHEMA = {
+    "lat": "lat",
+    "lon": "lon",
+    "text": "label",
+    "year": "year",
+    "api_uwi": "api_uwi",
+    "name": "name",
+    "operator": "operator",
+    "trajectory": "trajectory",
+    "permit_date": "permit_date",
+    "first_prod_date": "first_prod_date",
+    "last_prod_date": "last_prod_date",
+    "completion_date": "completion_date",
+    **{key: key for key in USER_WELL_NUMBER_COLUMNS},
+    "dca_approved": "dca_approved",
+    "lat_bh": "lat_bh",
+    "lon_bh": "lon_bh",
+    "last_producing": "last_producing",
+    "owner_interest": "owner_interest",
+    "owner_name": "owner_name",
+}
+
+
+def _user_wells_columns(frame):
+    """The ``USER_WELLS_RESPONSE_SCHEMA`` columns of ``frame`` as lists, NaN as ``None``."""
+    return {
+        key: frame[column].to_numpy(dtype=object, na_value=None).tolist()
+        for key, column in USER_WELLS_RESPONSE_SCHEMA.items()
+    }
 
-    return out
 
 def user_wells_data(request):
     """Returns JSON for user's specific wells with rich data."""
@@ -1107,75 +1751,115 @@ def user_wells_data(request):
     
     if not owner_name:
         # User has no wells assigned
-        return JsonResponse({
-            "lat": [], "lon": [], "text": [], "year": [],
-            "api_uwi": [], "name": [], "operator": [], "trajectory": [],
-            "permit_date": [], "first_prod_date": [], "last_prod_date": [], "completion_date": [],
-            "gross_oil_eur": [], "gross_gas_eur": [], "net_oil_eur": [],
-            "net_gas_eur": [], "net_ngl_eur": [], "remaining_net_oil": [],
-            "remaining_net_gas": [],
-            "pv17": [],
-            "dca_approved": [],
-            "lat_bh": [], "lon_bh": [],
-            "last_producing": [], "owner_interest": [], "owner_name": []
-        })
-    
-    # Get user's wells with rich data
-    rows = _snowflake_user_wells(owner_name)
-    approved_map = {}
-    apis = [r["api_uwi"] for r in rows if r.get("api_uwi")]
+        return responses.json_response({key: [] for key in USER_WELLS_RESPONSE_SCHEMA})
+
+    return responses.precompressed_response(request, _cached_user_wells_payload(owner_name))
+
+
+def _user_wells_payload(owner_name, all_wells):
+    """Encode the ``/user-wells-data/`` response for ``owner_name``."""
+    wells = _user_wells_frame(owner_name, all_wells)
+    approved_apis = set()
+    apis = [api for api in wells["api_uwi"].dropna().tolist() if api]
     if apis:
-        conn = get_snowflake_connection()
-        cur = conn.cursor(DictCursor)
-        try:
-            placeholders = ",".join(["%s"] * len(apis))
-            cur.execute(
-                f"""
-                SELECT API_UWI
-                FROM WELLS.MINERALS.ECON_INPUT_1PASS
-                WHERE API_UWI IN ({placeholders})
-                  AND APPROVED = 'Y'
-                """,
-                apis,
-            )
-            approved_rows = cur.fetchall() or []
-            approved_map = {row.get("API_UWI"): True for row in approved_rows}
-        finally:
-            try:
-                cur.close()
-            except Exception:
-                pass
-            conn.close()
-    return JsonResponse({
-        "lat": [r["lat"] for r in rows],
-        "lon": [r["lon"] for r in rows],
-        "text": [r["label"] for r in rows],
-        "year": [r["year"] for r in rows],
-        "api_uwi": [r["api_uwi"] for r in rows],
-        "name": [r["name"] for r in rows],
-        "operator": [r["operator"] for r in rows],
-        "trajectory": [r["trajectory"] for r in rows],
-        "permit_date": [r["permit_date"] for r in rows],
-        "first_prod_date": [r["first_prod_date"] for r in rows],
-        "last_prod_date": [r["last_prod_date"] for r in rows],
-        "completion_date": [r["completion_date"] for r in rows],
-        "gross_oil_eur": [r["gross_oil_eur"] for r in rows],
-        "gross_gas_eur": [r["gross_gas_eur"] for r in rows],
-        "net_oil_eur": [r["net_oil_eur"] for r in rows],
-        "net_gas_eur": [r["net_gas_eur"] for r in rows],
-        "net_ngl_eur": [r["net_ngl_eur"] for r in rows],
-        "remaining_net_oil": [r["remaining_net_oil"] for r in rows],
-        "remaining_net_gas": [r["remaining_net_gas"] for r in rows],
-        "pv17": [r["pv17"] for r in rows],
-        "dca_approved": [bool(approved_map.get(r["api_uwi"])) for r in rows],
-        "lat_bh": [r["lat_bh"] for r in rows],
-        "lon_bh": [r["lon_bh"] for r in rows],
-        "last_producing": [r["last_producing"] for r in rows],
-        "owner_interest": [r["owner_interest"] for r in rows],
-        "owner_name": [r["owner_name"] for r in rows],
-    })
+        api_filter, api_params = snowflake_helpers.in_list("API_UWI", apis)
+        approved_rows = snowflake_helpers.fetch_all(
+            f"""
+            SELECT API_UWI
+            FROM WELLS.MINERALS.ECON_INPUT_1PASS
+            WHERE {api_filter}
+              AND APPROVED = 'Y'
+            """,
+            api_params,
+        )
+        approved_apis = {row.get("API_UWI") for row in approved_rows}
+    wells["dca_approved"] = wells["api_uwi"].isin(approved_apis)
+    return responses.Precompressed(responses.dumps(_user_wells_columns(wells)), "application/json")
+
+
+def _cached_user_wells_payload(owner_name):
+    """The owner's encoded response, rebuilt per wells frame, approvals stamp or TTL."""
+    all_wells = get_all_wells_with_owners()
+    # Read before querying approvals: a save racing with the build leaves
+    # the entry under the old stamp, so the next request rebuilds it.
+    version = snapshots.version_stamp(DCA_APPROVALS_VERSION)
+    now = time.monotonic()
+    with _user_wells_lock:
+        entry = _user_wells_cache.get(owner_name)
+        if (
+            entry
+            and entry["frame"] is all_wells
+            and entry["version"] == version
+            and now - entry["timestamp"] < _USER_WELLS_CACHE_TTL_SECONDS
+        ):
+            return entry["payload"]
+
+    payload = _user_wells_payload(owner_name, all_wells)
+    with _user_wells_lock:
+        # A new frame or stamp invalidates every entry (and releases the old frame).
+        if any(
+            cached["frame"] is not all_wells or cached["version"] != version
+            for cached in _user_wells_cache.values()
+        ):
+            _user_wells_cache.clear()
+        _user_wells_cache.pop(owner_name, None)
+        while len(_user_wells_cache) >= _USER_WELLS_CACHE_MAX_OWNERS:
+            _user_wells_cache.pop(next(iter(_user_wells_cache)))
+        _user_wells_cache[owner_name] = {
+            "frame": all_wells,
+            "version": version,
+            "payload": payload,
+            "timestamp": now,
+        }
+    return payload
+
+
+def _invalidate_user_wells(apis):
+    """Expire cached ``/user-wells-data/`` responses in every worker after ``apis`` were approved."""
+    if apis:
+        snapshots.bump_version(DCA_APPROVALS_VERSION)
+
+
+@require_http_methods(["GET"])
+def query_stats(request):
+    """Per-view Snowflake query timings collected by this worker (admins only)."""
+
+    if "user" not in request.session:
+        return JsonResponse({"detail": "Authentication required."}, status=401)
+
+    admin_context = get_admin_banner_context(request)
+    if not admin_context.get("is_admin"):
+        return JsonResponse({"detail": "Admin access required."}, status=403)
+
+    return JsonResponse(snowflake_helpers.query_stats())
 
 
+@csrf_exempt
+@require_http_methods(["POST"])
+def refresh_wells_cache(request):
+    """Reload the wells-with-owners frame after ownership data changed (admins only).
+
+    Only this worker reloads immediately; the others pick up the new
+    snapshot at their next TTL refresh.
+    """
+
+    if "user" not in request.session:
+        return JsonResponse({"detail": "Authentication required."}, status=401)
+
+    admin_context = get_admin_banner_context(request)
+    if not admin_context.get("is_admin"):
+        return JsonResponse({"detail": "Admin access required."}, status=403)
+
+    _wells_dataset.invalidate()
+    with _owner_name_lock:
+        _owner_name_cache.clear()
+    try:
+        wells = get_all_wells_with_owners()
+    except snowflake_errors.Error:
+        logger.exception("Failed to reload wells with owners.")
+        return JsonResponse({"detail": "Unable to reload wells."}, status=502)
+    return JsonResponse({"refreshed": True, "wells": len(wells)})
+
 
 @require_http_methods(["GET", "PUT"])
 def user_info(request):
@@ -1263,14 +1947,9 @@ def user_feedback_entries(request):
     if not user_email:
         return JsonResponse({"detail": "User email unavailable."}, status=400)
 
-    conn = get_snowflake_connection()
-    cur = None
-
-    try:
-        cur = conn.cursor(DictCursor)
-
-        if request.method == "GET":
-            cur.execute(
+    if request.method == "GET":
+        rows = responses.prime(
+            snowflake_helpers.iter_rows(
                 """
                 SELECT FEEDBACK_TEXT, FEEDBACK_RESPONSE, SUBMITTED_AT, USERNAME
                 FROM WELLS.MINERALS.USER_FEEDBACK
@@ -1279,17 +1958,23 @@ def user_feedback_entries(request):
                 """,
                 (user_email,),
             )
-            rows = cur.fetchall()
-            entries = [
-                {
-                    "feedback_text": row.get("FEEDBACK_TEXT"),
-                    "feedback_response": row.get("FEEDBACK_RESPONSE"),
-                    "submitted_at": _format_timestamp_for_json(row.get("SUBMITTED_AT")),
-                    "username": row.get("USERNAME"),
-                }
-                for row in rows
-            ]
-            return JsonResponse({"entries": entries})
+        )
+        return responses.streaming_json_list(
+            "entries",
+            rows,
+            lambda row: {
+                "feedback_text": row.get("FEEDBACK_TEXT"),
+                "feedback_response": row.get("FEEDBACK_RESPONSE"),
+                "submitted_at": _format_timestamp_for_json(row.get("SUBMITTED_AT")),
+                "username": row.get("USERNAME"),
+            },
+        )
+
+    conn = get_snowflake_connection()
+    cur = None
+
+    try:
+        cur = conn.cursor(DictCursor)
 
         try:
             payload = json.loads(request.body or "{}")
@@ -1478,61 +2163,44 @@ def bulk_well_production(request):
     if len(apis) > 5000:
         return JsonResponse({"error": "Too many APIs; max 5000 per request"}, status=400)
 
-    conn = get_snowflake_connection()
-    cur = conn.cursor()
-    try:
-        rows = []
-        cols = None
-
-        CHUNK = 1000  # Snowflake handles big IN lists, but chunk to be safe
-        for i in range(0, len(apis_clean), CHUNK):
-            chunk = apis_clean[i:i+CHUNK]
-            placeholders = ",".join(["%s"] * len(chunk))
-            sql = f"""
-                SELECT *
-                FROM WELLS.MINERALS.FORECASTS
-                WHERE REPLACE(API_UWI, '-', '') IN ({placeholders})
-            """
-            cur.execute(sql, chunk)
-            part = cur.fetchall()
-            if cols is None:
-                cols = [d[0] for d in cur.description]
-            rows.extend(part)
-
-        data_rows = [dict(zip(cols, r)) for r in rows] if cols else []
-
-        # Group by normalized API to align with input values
-        by_api = None
-        missing = None
-        if cols:
-            api_col = next((c for c in cols if c.upper() == "API_UWI"), None)
-            if api_col:
-                grouped = {}
-                for rec in data_rows:
-                    key = str(rec.get(api_col, "")).replace("-", "")
-                    grouped.setdefault(key, []).append(rec)
-                # Map sanitized keys back to original format when possible
-                key_map = {a.replace("-", ""): a for a in apis}
-                by_api = {key_map.get(k, k): v for k, v in grouped.items()}
-                # Determine which requested APIs returned no rows
-                missing_norm = set(key_map.keys()) - set(grouped.keys())
-                if missing_norm:
-                    missing = {
-                        key_map.get(k, k): "No production data found" for k in missing_norm
-                    }
+    api_filter, api_params = snowflake_helpers.in_list("REPLACE(API_UWI, '-', '')", apis_clean)
+    result = snowflake_helpers.fetch_frame(
+        f"""
+        SELECT *
+        FROM WELLS.MINERALS.FORECASTS
+        WHERE {api_filter}
+        """,
+        api_params,
+    )
+    cols = list(result.columns) or None
+    data_rows = _frame_records(result)
+
+    # Group by normalized API to align with input values
+    by_api = None
+    missing = None
+    if cols:
+        api_col = next((c for c in cols if c.upper() == "API_UWI"), None)
+        if api_col:
+            grouped = {}
+            for rec in data_rows:
+                key = str(rec.get(api_col, "")).replace("-", "")
+                grouped.setdefault(key, []).append(rec)
+            # Map sanitized keys back to original format when possible
+            key_map = {a.replace("-", ""): a for a in apis}
+            by_api = {key_map.get(k, k): v for k, v in grouped.items()}
+            # Determine which requested APIs returned no rows
+            missing_norm = set(key_map.keys()) - set(grouped.keys())
+            if missing_norm:
+                missing = {
+                    key_map.get(k, k): "No production data found" for k in missing_norm
+                }
 
-        return JsonResponse({
-            "count": len(data_rows),
-            "rows": data_rows,
-            "by_api": by_api,
-            "missing": missing,
-        })
-    finally:
-        try:
-            cur.close()
-        except Exception:
-            pass
-        conn.close()
+    return JsonResponse({
+        "count": len(data_rows),
+        "rows": data_rows,
+        "by_api": by_api,
+        "missing": missing,
+    })
 
 
 @require_http_methods(["GET"])
@@ -1545,73 +2213,106 @@ def well_dca_inputs(request):
         return JsonResponse({"detail": "API is required."}, status=400)
 
     approved_only = (request.GET.get("approved") or "").lower() == "true"
-    conn = get_snowflake_connection()
-    cur = conn.cursor(DictCursor)
-    try:
-        cur.execute(
-            """
-            SELECT API_UWI, PRODUCINGMONTH, LIQUIDSPROD_BBL, GASPROD_MCF
-            FROM WELLS.MINERALS.RAW_PROD_DATA
-            WHERE API_UWI = %s
-            ORDER BY PRODUCINGMONTH
-            """,
-            (api,),
-        )
-        prod_rows = cur.fetchall() or []
-        production = [
-            {
-                "API_UWI": row.get("API_UWI"),
-                "PRODUCINGMONTH": _format_timestamp_for_json(row.get("PRODUCINGMONTH")),
-                "LIQUIDSPROD_BBL": row.get("LIQUIDSPROD_BBL"),
-                "GASPROD_MCF": row.get("GASPROD_MCF"),
-            }
-            for row in prod_rows
-        ]
-
-        params = {}
-        approved_missing = False
-        cur.execute(
-            """
-            SELECT *
-            FROM WELLS.MINERALS.ECON_INPUT_1PASS
-            WHERE API_UWI = %s
-              AND APPROVED = 'Y'
-            ORDER BY LAST_EDIT_DATE DESC
-            LIMIT 1
-            """,
-            (api,),
-        )
-        params = cur.fetchone() or {}
-        if not params:
-            if approved_only:
-                approved_missing = True
-            cur.execute(
+    results = snowflake_helpers.run_concurrently(
+        [
+            (
+                "production",
+                """
+                SELECT API_UWI, PRODUCINGMONTH, LIQUIDSPROD_BBL, GASPROD_MCF
+                FROM WELLS.MINERALS.RAW_PROD_DATA
+                WHERE API_UWI = %s
+                ORDER BY PRODUCINGMONTH
+                """,
+                (api,),
+            ),
+            (
+                "approved_params",
                 """
                 SELECT *
                 FROM WELLS.MINERALS.ECON_INPUT_1PASS
                 WHERE API_UWI = %s
+                  AND APPROVED = 'Y'
                 ORDER BY LAST_EDIT_DATE DESC
                 LIMIT 1
                 """,
                 (api,),
-            )
-            params = cur.fetchone() or {}
-        params_out = {
-            key: _format_timestamp_for_json(value) if isinstance(value, datetime) else value
-            for key, value in params.items()
+                "one",
+            ),
+            (
+                "latest_params",
+                """
+                SELECT *
+                FROM WELLS.MINERALS.ECON_INPUT_1PASS
+                WHERE API_UWI = %s
+                ORDER BY LAST_EDIT_DATE DESC
+                LIMIT 1
+                """,
+                (api,),
+                "one",
+            ),
+        ]
+    )
+    for value in results.values():
+        if isinstance(value, Exception):
+            raise value
+
+    prod_rows = results["production"] or []
+    production = [
+        {
+            "API_UWI": row.get("API_UWI"),
+            "PRODUCINGMONTH": _format_timestamp_for_json(row.get("PRODUCINGMONTH")),
+            "LIQUIDSPROD_BBL": row.get("LIQUIDSPROD_BBL"),
+            "GASPROD_MCF": row.get("GASPROD_MCF"),
         }
-        return JsonResponse({
-            "api": api,
-            "production": production,
-            "params": params_out,
-            "approved_missing": approved_missing,
-        })
-    finally:
-        try:
-            cur.close()
-        except Exception:
-            pass
-        conn.close()
+        for row in prod_rows
+    ]
+
+    approved_missing = False
+    params = results["approved_params"] or {}
+    if not params:
+        if approved_only:
+            approved_missing = True
+        params = results["latest_params"] or {}
+    params_out = {
+        key: _format_timestamp_for_json(value) if isinstance(value, datetime) else value
+        for key, value in params.items()
+    }
+    return JsonResponse({
+        "api": api,
+        "production": production,
+        "params": params_out,
+        "approved_missing": approved_missing,
+    })
+
+
+DCA_INPUT_COLUMNS = [
+    "OIL_CALC_QI",
+    "OIL_Q_MIN",
+    "OIL_EMPIRICAL_DI",
+    "OIL_CALC_B_FACTOR",
+    "OIL_D_MIN",
+    "OIL_DECLINE_TYPE",
+    "FCST_START_OIL",
+    "OIL_FCST_YRS",
+    "GAS_CALC_QI",
+    "GAS_Q_MIN",
+    "GAS_EMPIRICAL_DI",
+    "GAS_CALC_B_FACTOR",
+    "GAS_D_MIN",
+    "GAS_DECLINE_TYPE",
+    "FCST_START_GAS",
+    "GAS_FCST_YRS",
+    "ECON_SCENARIO",
+    "APPROVED",
+]
+DCA_BATCH_MAX_WELLS = 1000
+
+
+def _dca_input_values(params):
+    values = {col: params.get(col) for col in DCA_INPUT_COLUMNS}
+    if values.get("APPROVED") != "Y":
+        values["APPROVED"] = None
+    return values
 
 
 @csrf_exempt
@@ -1630,31 +2331,8 @@ def save_well_dca_inputs(request):
     if not api:
         return JsonResponse({"detail": "API is required."}, status=400)
 
-    columns = [
-        "OIL_CALC_QI",
-        "OIL_Q_MIN",
-        "OIL_EMPIRICAL_DI",
-        "OIL_CALC_B_FACTOR",
-        "OIL_D_MIN",
-        "OIL_DECLINE_TYPE",
-        "FCST_START_OIL",
-        "OIL_FCST_YRS",
-        "GAS_CALC_QI",
-        "GAS_Q_MIN",
-        "GAS_EMPIRICAL_DI",
-        "GAS_CALC_B_FACTOR",
-        "GAS_D_MIN",
-        "GAS_DECLINE_TYPE",
-        "FCST_START_GAS",
-        "GAS_FCST_YRS",
-        "ECON_SCENARIO",
-        "APPROVED",
-    ]
-
-    values = {col: params.get(col) for col in columns}
-    approved_value = values.get("APPROVED")
-    if approved_value != "Y":
-        values["APPROVED"] = None
+    columns = DCA_INPUT_COLUMNS
+    values = _dca_input_values(params)
 
     conn = get_snowflake_connection()
     cur = conn.cursor()
@@ -1678,6 +2356,8 @@ def save_well_dca_inputs(request):
         insert_params = [api] + [values[col] for col in columns]
         cur.execute(insert_sql, insert_params)
         conn.commit()
+        if values.get("APPROVED") == "Y":
+            _invalidate_user_wells([api])
         return JsonResponse({"saved": True})
     except snowflake_errors.Error:
         logger.exception("Failed to save DCA inputs for %s", api)
@@ -1691,6 +2371,102 @@ def save_well_dca_inputs(request):
         conn.close()
 
 
+@csrf_exempt
+@require_http_methods(["POST"])
+def save_well_dca_inputs_batch(request):
+    """Save DCA inputs for many wells in one transaction.
+
+    Expects ``{"wells": [{"api": ..., "params": {...}}, ...]}``. Previously
+    approved rows for every well being approved are reset with one UPDATE and
+    all new rows are written with a single multi-row INSERT.
+    """
+
+    if "user" not in request.session:
+        return JsonResponse({"detail": "Authentication required."}, status=401)
+
+    try:
+        payload = json.loads(request.body or "{}")
+    except json.JSONDecodeError:
+        return JsonResponse({"detail": "Invalid JSON payload."}, status=400)
+
+    wells = payload.get("wells")
+    if not isinstance(wells, list) or not wells:
+        return JsonResponse({"detail": "A non-empty list of wells is required."}, status=400)
+    if len(wells) > DCA_BATCH_MAX_WELLS:
+        return JsonResponse(
+            {"detail": f"At most {DCA_BATCH_MAX_WELLS} wells can be saved per request."},
+            status=400,
+        )
+
+    # The last entry for an API wins, mirroring sequential single saves.
+    values_by_api = {}
+    for index, well in enumerate(wells):
+        api = (well.get("api") or "").strip() if isinstance(well, dict) else ""
+        if not api:
+            return JsonResponse({"detail": f"API is required (well {index})."}, status=400)
+        params = well.get("params") or {}
+        if not isinstance(params, dict):
+            return JsonResponse({"detail": f"params must be an object (well {index})."}, status=400)
+        values_by_api.pop(api, None)
+        values_by_api[api] = _dca_input_values(params)
+
+    approved_apis = [api for api, values in values_by_api.items() if values["APPROVED"] == "Y"]
+    insert_cols = ", ".join(["API_UWI"] + DCA_INPUT_COLUMNS + ["LAST_EDIT_DATE"])
+    row_placeholders = "(" + ", ".join(["%s"] * (len(DCA_INPUT_COLUMNS) + 1)) + ", CURRENT_TIMESTAMP())"
+    insert_sql = f"""
+        INSERT INTO WELLS.MINERALS.ECON_INPUT_1PASS ({insert_cols})
+        VALUES {", ".join([row_placeholders] * len(values_by_api))}
+    """
+    insert_params = [
+        param
+        for api, values in values_by_api.items()
+        for param in [api] + [values[col] for col in DCA_INPUT_COLUMNS]
+    ]
+
+    conn = get_snowflake_connection()
+    cur = conn.cursor()
+    discard = False
+    try:
+        cur.execute("BEGIN")
+        if approved_apis:
+            api_filter, api_params = snowflake_helpers.in_list("API_UWI", approved_apis)
+            cur.execute(
+                f"""
+                UPDATE WELLS.MINERALS.ECON_INPUT_1PASS
+                SET APPROVED = NULL
+                WHERE {api_filter}
+                  AND APPROVED = 'Y'
+                """,
+                api_params,
+            )
+        cur.execute(insert_sql, insert_params)
+        conn.commit()
+    except Exception as exc:
+        # Never hand a session with an open transaction back to the pool.
+        try:
+            conn.rollback()
+        except Exception:  # noqa: BLE001
+            logger.warning("Rollback failed; discarding the connection.", exc_info=True)
+            discard = True
+        if not isinstance(exc, snowflake_errors.Error):
+            raise
+        logger.exception("Failed to save DCA inputs for %d wells", len(values_by_api))
+        return JsonResponse({"detail": "Unable to save well inputs."}, status=502)
+    finally:
+        try:
+            cur.close()
+        except Exception:
+            pass
+        conn.close(discard=discard)
+
+    _invalidate_user_wells(approved_apis)
+    return JsonResponse({
+        "saved": len(values_by_api),
+        "approved": len(approved_apis),
+        "apis": list(values_by_api.keys()),
+    })
+
+
 @csrf_exempt
 @require_http_methods(["POST"])
 def export_well_dca_inputs(request):
@@ -2061,16 +2837,40 @@ def _calc_decline_forecast(prd: pd.DataFrame, params: dict) -> pd.DataFrame:
     return final_df
 
 
-def fetch_price_decks():
-    conn = get_snowflake_connection()
-    cur = conn.cursor()
-    cur.execute(
+def _query_price_decks():
+    return snowflake_helpers.fetch_frame(
         "SELECT PRICE_DECK_NAME, MONTH_DATE, OIL, GAS FROM PRICE_DECK"
     )
-    rows = cur.fetchall()
-    cols = [c[0] for c in cur.description]
-    conn.close()
-    return pd.DataFrame(rows, columns=cols)
+
+
+def _store_price_decks(frame):
+    with _price_deck_lock:
+        _price_deck_cache["frame"] = frame
+        _price_deck_cache["timestamp"] = time.monotonic()
+
+
+def fetch_price_decks():
+    now = time.monotonic()
+    cached = _price_deck_cache["frame"]
+    if cached is not None and (now - _price_deck_cache["timestamp"] < _PRICE_DECK_CACHE_TTL_SECONDS):
+        return cached
+
+    with _price_deck_lock:
+        cached = _price_deck_cache["frame"]
+        if cached is not None and (now - _price_deck_cache["timestamp"] < _PRICE_DECK_CACHE_TTL_SECONDS):
+            return cached
+
+        if cached is None:
+            frame = snapshots.warm_load(PRICE_DECK_SNAPSHOT, _query_price_decks, _store_price_decks)
+        else:
+            frame = snapshots.refresh_shared(
+                PRICE_DECK_SNAPSHOT,
+                _query_price_decks,
+                newer_than=time.time() - _PRICE_DECK_CACHE_TTL_SECONDS,
+            )
+        _price_deck_cache["frame"] = frame
+        _price_deck_cache["timestamp"] = time.monotonic()
+        return frame
 
 
 def _parse_econ_value(value, default=None):
@@ -2082,10 +2882,7 @@ def _parse_econ_value(value, default=None):
     return float(parsed)
 
 
-@require_http_methods(["GET"])
-def econ_scenarios(request):
-    if "user" not in request.session:
-        return JsonResponse({"detail": "Authentication required."}, status=401)
+def _load_econ_scenarios():
     conn = get_snowflake_connection()
     cur = conn.cursor(DictCursor)
     try:
@@ -2112,7 +2909,52 @@ def econ_scenarios(request):
             else:
                 normalized[key] = value
         serialized.append(normalized)
-    return JsonResponse({"scenarios": serialized})
+    return serialized
+
+
+def _cached_econ_scenarios():
+    version = snapshots.version_stamp(ECON_SCENARIOS_VERSION)
+    now = time.monotonic()
+
+    def fresh():
+        return (
+            _econ_scenario_cache["rows"] is not None
+            and _econ_scenario_cache["version"] == version
+            and now - _econ_scenario_cache["timestamp"] < _ECON_SCENARIO_CACHE_TTL_SECONDS
+        )
+
+    if fresh():
+        return _econ_scenario_cache["rows"]
+
+    with _econ_scenario_lock:
+        if fresh():
+            return _econ_scenario_cache["rows"]
+        rows = _load_econ_scenarios()
+        _econ_scenario_cache["rows"] = rows
+        _econ_scenario_cache["version"] = version
+        _econ_scenario_cache["timestamp"] = time.monotonic()
+        return rows
+
+
+def _invalidate_econ_scenarios():
+    """Expire the cached scenario listing in every worker."""
+    snapshots.bump_version(ECON_SCENARIOS_VERSION)
+    with _econ_scenario_lock:
+        _econ_scenario_cache["rows"] = None
+        _econ_scenario_cache["version"] = None
+        _econ_scenario_cache["timestamp"] = 0.0
+    _econ_scenario_encoded.clear()
+
+
+@require_http_methods(["GET"])
+def econ_scenarios(request):
+    if "user" not in request.session:
+        return JsonResponse({"detail": "Authentication required."}, status=401)
+    rows = _cached_econ_scenarios()
+    encoded = _econ_scenario_encoded.get(
+        rows, None, lambda: responses.Precompressed.from_json({"scenarios": rows})
+    )
+    return responses.precompressed_response(request, encoded)
 
 
 @csrf_exempt
@@ -2160,6 +3002,7 @@ def save_econ_scenario(request):
             [values[col] for col in ECON_SCENARIO_COLUMNS],
         )
         conn.commit()
+        _invalidate_econ_scenarios()
         return JsonResponse({"saved": True, "scenario": values})
     except snowflake_errors.Error:
         logger.exception("Failed to save econ scenario %s", scenario_name)
@@ -2255,12 +3098,19 @@ def price_decks(request):
         for name in df["PRICE_DECK_NAME"].unique()
         if str(name).upper() != "HIST"
     )
+    encoded = _price_deck_encoded.get(
+        df, deck or "", lambda: responses.Precompressed.from_json(_price_deck_payload(df, deck, options))
+    )
+    return responses.precompressed_response(request, encoded)
+
+
+def _price_deck_payload(df, deck, options):
     trailing_avg = {"10_year": _price_deck_trailing_average(df, years=10)}
     if deck:
         blended = get_blended_price_deck(deck, df)
         data = json.loads(blended.to_json(orient="records", date_format="iso"))
-        return JsonResponse({"options": options, "data": data, "trailing_averages": trailing_avg})
-    return JsonResponse({"options": options, "trailing_averages": trailing_avg})
+        return {"options": options, "data": data, "trailing_averages": trailing_avg}
+    return {"options": options, "trailing_averages": trailing_avg}
 
 
 def fetch_forecasts_for_apis(apis):
@@ -2278,63 +3128,48 @@ def fetch_forecasts_for_apis(apis):
     if not apis:
         return pd.DataFrame(columns=base_columns)
 
-    conn = get_snowflake_connection()
-    cur = conn.cursor(DictCursor)
     apis = [str(a).strip() for a in apis if str(a).strip()]
-    CHUNK = 1000
-    production_rows = []
-    params_by_api = {}
-    try:
-        for i in range(0, len(apis), CHUNK):
-            chunk = apis[i : i + CHUNK]
-            placeholders = ",".join(["%s"] * len(chunk))
-            cur.execute(
-                f"""
-                SELECT API_UWI, PRODUCINGMONTH, LIQUIDSPROD_BBL, GASPROD_MCF
-                FROM WELLS.MINERALS.RAW_PROD_DATA
-                WHERE API_UWI IN ({placeholders})
-                ORDER BY API_UWI, PRODUCINGMONTH
-                """,
-                chunk,
-            )
-            production_rows.extend(cur.fetchall() or [])
-
-            cur.execute(
-                f"""
-                SELECT *
-                FROM (
-                    SELECT *,
-                        ROW_NUMBER() OVER (
-                            PARTITION BY API_UWI
-                            ORDER BY LAST_EDIT_DATE DESC
-                        ) AS rn
-                    FROM WELLS.MINERALS.ECON_INPUT_1PASS
-                    WHERE API_UWI IN ({placeholders})
-                )
-                WHERE rn = 1
-                """,
-                chunk,
+    production_columns = ["API_UWI", "PRODUCINGMONTH", "LIQUIDSPROD_BBL", "GASPROD_MCF"]
+    api_filter, api_params = snowflake_helpers.in_list("API_UWI", apis)
+    with snowflake_helpers.timed_phase("forecast_production_fetch"):
+        production_df = snowflake_helpers.fetch_frame(
+            f"""
+            SELECT API_UWI, PRODUCINGMONTH, LIQUIDSPROD_BBL, GASPROD_MCF
+            FROM WELLS.MINERALS.RAW_PROD_DATA
+            WHERE {api_filter}
+            ORDER BY API_UWI, PRODUCINGMONTH
+            """,
+            api_params,
+        )
+    with snowflake_helpers.timed_phase("forecast_econ_inputs_fetch"):
+        rows = snowflake_helpers.fetch_all(
+            f"""
+            SELECT *
+            FROM (
+                SELECT *,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY API_UWI
+                        ORDER BY LAST_EDIT_DATE DESC
+                    ) AS rn
+                FROM WELLS.MINERALS.ECON_INPUT_1PASS
+                WHERE {api_filter}
             )
-            for row in cur.fetchall() or []:
-                params_by_api[row.get("API_UWI")] = row
-    finally:
-        try:
-            cur.close()
-        except Exception:
-            pass
-        conn.close()
-
-    production_df = pd.DataFrame(
-        production_rows,
-        columns=["API_UWI", "PRODUCINGMONTH", "LIQUIDSPROD_BBL", "GASPROD_MCF"],
-    )
+            WHERE rn = 1
+            """,
+            api_params,
+        )
+    model_started = time.perf_counter()
+    params_by_api = {row.get("API_UWI"): row for row in rows}
+    if production_df.empty:
+        production_df = pd.DataFrame(columns=production_columns)
+    production_by_api = {
+        api: group for api, group in production_df.groupby("API_UWI", sort=False)
+    }
     forecasts = []
     for api in apis:
-        prd = production_df[production_df["API_UWI"] == api].copy()
-        if prd.empty:
-            prd = pd.DataFrame(
-                columns=["API_UWI", "PRODUCINGMONTH", "LIQUIDSPROD_BBL", "GASPROD_MCF"]
-            )
+        prd = production_by_api.get(api)
+        if prd is None or prd.empty:
+            prd = pd.DataFrame(columns=production_columns)
         params = params_by_api.get(api, {})
         fc = _calc_decline_forecast(prd, params)
         fc["ECON_SCENARIO"] = _normalize_econ_scenario(params.get("ECON_SCENARIO"))
@@ -2354,6 +3189,7 @@ def fetch_forecasts_for_apis(apis):
     if "API_NODASH" not in df.columns and "API_UWI" in df.columns:
         df["API_NODASH"] = df["API_UWI"].str.replace('-', '', regex=False)
 
+    snowflake_helpers.record_phase("forecast_decline_model", time.perf_counter() - model_started)
     return df
 
 
@@ -2379,6 +3215,7 @@ def economics_data(request):
     price_df = fetch_price_decks()
     deck_df = get_blended_price_deck(deck, price_df)
     fc = fetch_forecasts_for_apis(apis)
+    model_started = time.perf_counter()
     # Start with 100% working-interest volumes. Depending on the setting below,
     # the owner's net-interest may be applied before or after economic
     # deductions are taken so that our results can mirror other applications.
@@ -2697,6 +3534,7 @@ def economics_data(request):
         "rate": royalty_rate,
         "today_month": base_period.to_timestamp().strftime("%Y-%m-%d"),
     }
+    snowflake_helpers.record_phase("cashflow_model", time.perf_counter() - model_started)
 
     return JsonResponse({
         "npv": npvs,